@@ -15,10 +15,13 @@ from elizaos_art.base import (
     BaseAgent,
     BaseEnvironment,
     EpisodeResult,
+    RenderCache,
     State,
     TrainingConfig,
     TrainingMetrics,
     Trajectory,
+    memoized_render,
+    render_cache,
 )
 
 __version__ = "1.0.0"
@@ -31,6 +34,10 @@ __all__ = [
     "Action",
     "EpisodeResult",
     "Trajectory",
+    # Rendering
+    "RenderCache",
+    "memoized_render",
+    "render_cache",
     # Training
     "TrainingConfig",
     "TrainingMetrics",
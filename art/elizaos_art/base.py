@@ -4,16 +4,145 @@ Base classes for ART environments and agents.
 Provides abstract interfaces that all games must implement.
 """
 
+import functools
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Generic, TypeVar
+from typing import Callable, Generic, Hashable, TypeVar
 
 # Type variables for state and action
 S = TypeVar("S", bound="State")
 A = TypeVar("A", bound="Action")
 
 
+class RenderCache:
+    """
+    Bounded LRU cache of strings rendered from immutable states.
+
+    Frozen state dataclasses compare and hash by value, so equal states
+    (the same board reached in different rollouts) share one cached
+    string.
+
+    Args:
+        maxsize: Rendered strings kept before the least recently used
+            are evicted
+    """
+
+    def __init__(self, maxsize: int = 8192):
+        self.maxsize = maxsize
+        self.enabled = True
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def put(self, key: Hashable, text: str) -> None:
+        with self._lock:
+            self._entries[key] = text
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+render_cache = RenderCache()
+
+
+class _RenderKey:
+    """Cache key for a rendered state, hashing the state only once."""
+
+    __slots__ = ("name", "state", "_hash")
+
+    def __init__(self, name: str, state: "State", state_hash: int):
+        self.name = name
+        self.state = state
+        self._hash = hash((name, state_hash))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, _RenderKey)
+            and self.name == other.name
+            and self.state == other.state
+        )
+
+
+def memoized_render(method: Callable[[S], str]) -> Callable[[S], str]:
+    """
+    Memoize a string-rendering method (`to_prompt`, `render`) of a frozen state.
+
+    The first result is kept on the state instance, so rendering the same
+    object again is a dict lookup. Equal states created elsewhere (the
+    same board in another rollout) share results through the bounded
+    module-level `render_cache`, keyed on the method and the state's
+    value. States that cannot be hashed are only memoized per instance.
+    """
+    name = method.__qualname__
+    attr = f"_memo_{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self: S) -> str:
+        if not render_cache.enabled:
+            return method(self)
+
+        # Frozen dataclasses block __setattr__, but not their instance dict
+        memo = self.__dict__
+        text = memo.get(attr)
+        if text is not None:
+            return text
+
+        state_hash = memo.get("_memo_hash")
+        if state_hash is None:
+            try:
+                state_hash = hash(self)
+            except TypeError:
+                # A field holds an unhashable value
+                state_hash = False
+            memo["_memo_hash"] = state_hash
+
+        key = _RenderKey(name, self, state_hash) if state_hash is not False else None
+        text = render_cache.get(key) if key is not None else None
+        if text is None:
+            text = method(self)
+            if key is not None:
+                render_cache.put(key, text)
+
+        memo[attr] = text
+        return text
+
+    return wrapper
+
+
 class State(ABC):
     """Abstract base class for game states."""
 
@@ -7,14 +7,19 @@ across all games with consistent reporting.
 
 import asyncio
 import json
+import multiprocessing
+import os
 import time
-from dataclasses import dataclass, field
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Awaitable, Callable
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+
+from elizaos_art.scheduler import Job, JobContext, JobScheduler
 
 console = Console()
 
@@ -53,6 +58,10 @@ class BenchmarkResult:
             "duration_seconds": self.duration_seconds,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "BenchmarkResult":
+        return cls(**{k: v for k, v in data.items() if k != "win_rate"})
+
 
 @dataclass
 class PipelineResult:
@@ -67,279 +76,553 @@ class PipelineResult:
     training_duration_seconds: float
     improvement_pct: float
 
+    def to_dict(self) -> dict:
+        return {
+            "game": self.game,
+            "model": self.model,
+            "baseline": self.baseline.to_dict(),
+            "final": self.final.to_dict(),
+            "training_steps": self.training_steps,
+            "training_trajectories": self.training_trajectories,
+            "training_duration_seconds": self.training_duration_seconds,
+            "improvement_pct": self.improvement_pct,
+        }
 
-async def run_game_baseline(
-    game_name: str,
-    episodes: int = 100,
-) -> BenchmarkResult:
-    """Run baseline benchmark for a single game."""
-    start_time = time.time()
+    @classmethod
+    def from_dict(cls, data: dict) -> "PipelineResult":
+        return cls(
+            **{
+                **data,
+                "baseline": BenchmarkResult.from_dict(data["baseline"]),
+                "final": BenchmarkResult.from_dict(data["final"]),
+            }
+        )
 
-    rewards: list[float] = []
-    wins = 0
-    losses = 0
-    draws = 0
 
-    if game_name == "game_2048":
-        from elizaos_art.games.game_2048 import Game2048Environment, Game2048HeuristicAgent
-
-        env = Game2048Environment()
-        agent = Game2048HeuristicAgent()
-        await env.initialize()
-
-        for i in range(episodes):
-            state = await env.reset(seed=i)
-            total_reward = 0.0
-
-            while not state.game_over:
-                actions = env.get_available_actions(state)
-                if not actions:
-                    break
-                action = await agent.decide(state, actions)
-                state, reward, _ = await env.step(action)
-                total_reward += reward
+EpisodeOutcome = tuple[int, float, str]
+"""(seed, total reward, "win" | "loss" | "draw") for one baseline episode."""
 
-            rewards.append(total_reward)
-            if state.max_tile >= 2048:
-                wins += 1
-            elif state.max_tile >= 1024:
-                draws += 1
-            else:
-                losses += 1
-
-    elif game_name == "tic_tac_toe":
-        from elizaos_art.games.tic_tac_toe import TicTacToeEnvironment, TicTacToeHeuristicAgent
-        from elizaos_art.games.tic_tac_toe.types import TicTacToeConfig
-
-        config = TicTacToeConfig(opponent="random")
-        env = TicTacToeEnvironment(config)
-        agent = TicTacToeHeuristicAgent()
-        await env.initialize()
-
-        for i in range(episodes):
-            state = await env.reset(seed=i)
-            total_reward = 0.0
-
-            while not state.is_terminal():
-                actions = env.get_available_actions(state)
-                if not actions:
-                    break
-                action = await agent.decide(state, actions)
-                state, reward, _ = await env.step(action)
-                total_reward += reward
+PlayFn = Callable[[int], Awaitable[tuple[float, str]]]
 
-            rewards.append(total_reward)
-            if state.winner and state.winner.value == 1:  # X wins
-                wins += 1
-            elif state.winner:
-                losses += 1
-            else:
-                draws += 1
-
-    elif game_name == "codenames":
-        from elizaos_art.games.codenames import CodenamesEnvironment, CodenamesGuesserAgent
-        from elizaos_art.games.codenames.types import CardColor, CodenamesConfig, Role
-
-        config = CodenamesConfig(ai_role=Role.GUESSER, ai_team=CardColor.RED)
-        env = CodenamesEnvironment(config)
-        agent = CodenamesGuesserAgent()
-        await env.initialize()
-
-        for i in range(episodes):
-            state = await env.reset(seed=i)
-            total_reward = 0.0
-
-            while not state.game_over:
-                actions = env.get_available_actions(state)
-                if not actions:
-                    break
-
-                if state.current_team == config.ai_team:
-                    action = await agent.decide(state, actions)
-                    state, reward, _ = await env.step(action)
-                    total_reward += reward
-                else:
-                    # Opponent turn
-                    for a in actions:
-                        if a.value < 25:  # Select word
-                            state, _, _ = await env.step(a)
-                            break
-                    else:
-                        from elizaos_art.games.codenames.types import CodenamesAction
-
-                        state, _, _ = await env.step(CodenamesAction.PASS)
-
-            rewards.append(total_reward)
-            if state.winner == config.ai_team:
-                wins += 1
-            else:
-                losses += 1
-
-    elif game_name == "temporal_clue":
-        from elizaos_art.games.temporal_clue import (
-            TemporalClueEnvironment,
-            TemporalClueHeuristicAgent,
-        )
+BASELINES: dict[str, dict[str, Callable[[], Awaitable[PlayFn]]]] = {}
+
+
+def register_baseline(game_name: str, agent: str = "heuristic") -> Callable:
+    """
+    Register a model-free baseline agent for a game.
+
+    The decorated coroutine function creates the environment and agent
+    once and returns a coroutine function that plays one episode for a
+    seed and returns (total_reward, "win" | "loss" | "draw").
+    """
+
+    def decorator(setup: Callable[[], Awaitable[PlayFn]]) -> Callable[[], Awaitable[PlayFn]]:
+        BASELINES.setdefault(game_name, {})[agent] = setup
+        return setup
+
+    return decorator
+
+
+async def _play_2048(agent) -> PlayFn:
+    from elizaos_art.games.game_2048 import Game2048Environment
+
+    env = Game2048Environment()
+    await env.initialize()
+
+    async def play(seed: int) -> tuple[float, str]:
+        state = await env.reset(seed=seed)
+        total_reward = 0.0
+
+        while not state.game_over:
+            actions = env.get_available_actions(state)
+            if not actions:
+                break
+            action = await agent.decide(state, actions)
+            state, reward, _ = await env.step(action)
+            total_reward += reward
+
+        if state.max_tile >= 2048:
+            return total_reward, "win"
+        if state.max_tile >= 1024:
+            return total_reward, "draw"
+        return total_reward, "loss"
+
+    return play
+
+
+@register_baseline("game_2048")
+async def _baseline_2048() -> PlayFn:
+    from elizaos_art.games.game_2048 import Game2048HeuristicAgent
+
+    return await _play_2048(Game2048HeuristicAgent())
+
+
+@register_baseline("game_2048", agent="expectimax")
+async def _baseline_2048_expectimax() -> PlayFn:
+    from elizaos_art.games.game_2048 import Game2048ExpectimaxAgent
+
+    # Fixed depth without a time budget keeps results reproducible
+    return await _play_2048(Game2048ExpectimaxAgent(max_depth=2, time_budget_ms=None))
+
+
+@register_baseline("tic_tac_toe")
+async def _baseline_tic_tac_toe() -> PlayFn:
+    from elizaos_art.games.tic_tac_toe import TicTacToeEnvironment, TicTacToeHeuristicAgent
+    from elizaos_art.games.tic_tac_toe.types import TicTacToeConfig
+
+    env = TicTacToeEnvironment(TicTacToeConfig(opponent="random"))
+    agent = TicTacToeHeuristicAgent()
+    await env.initialize()
+
+    async def play(seed: int) -> tuple[float, str]:
+        state = await env.reset(seed=seed)
+        total_reward = 0.0
+
+        while not state.is_terminal():
+            actions = env.get_available_actions(state)
+            if not actions:
+                break
+            action = await agent.decide(state, actions)
+            state, reward, _ = await env.step(action)
+            total_reward += reward
+
+        if state.winner and state.winner.value == 1:  # X wins
+            return total_reward, "win"
+        if state.winner:
+            return total_reward, "loss"
+        return total_reward, "draw"
+
+    return play
 
-        env = TemporalClueEnvironment()
-        agent = TemporalClueHeuristicAgent()
-        await env.initialize()
 
-        for i in range(episodes):
-            state = await env.reset(seed=i)
-            total_reward = 0.0
+@register_baseline("codenames")
+async def _baseline_codenames() -> PlayFn:
+    from elizaos_art.games.codenames import CodenamesEnvironment, CodenamesGuesserAgent
+    from elizaos_art.games.codenames.types import CardColor, CodenamesConfig, Role
 
-            while not state.submitted:
-                actions = env.get_available_actions(state)
-                if not actions:
-                    break
-                action = await agent.decide(state, actions)
-                state, reward, _ = await env.step(action)
+    config = CodenamesConfig(ai_role=Role.GUESSER, ai_team=CardColor.RED)
+    env = CodenamesEnvironment(config)
+    agent = CodenamesGuesserAgent()
+    await env.initialize()
+
+    async def play(seed: int) -> tuple[float, str]:
+        state = await env.reset(seed=seed)
+        total_reward = 0.0
+
+        while not state.game_over:
+            actions = env.get_available_actions(state)
+            if not actions:
+                break
+
+            # Both teams guess with the embedding baseline from the
+            # environment's embedding spymaster clues
+            team = state.current_team
+            action = await agent.decide(state, actions)
+            state, reward, _ = await env.step(action)
+            if team == config.ai_team:
                 total_reward += reward
 
-            rewards.append(total_reward)
-            if state.is_correct:
-                wins += 1
-            else:
-                losses += 1
+        return total_reward, "win" if state.winner == config.ai_team else "loss"
 
-    else:
+    return play
+
+
+@register_baseline("temporal_clue")
+async def _baseline_temporal_clue() -> PlayFn:
+    from elizaos_art.games.temporal_clue import (
+        TemporalClueEnvironment,
+        TemporalClueHeuristicAgent,
+    )
+
+    env = TemporalClueEnvironment()
+    agent = TemporalClueHeuristicAgent()
+    await env.initialize()
+
+    async def play(seed: int) -> tuple[float, str]:
+        state = await env.reset(seed=seed)
+        total_reward = 0.0
+
+        while not state.submitted:
+            actions = env.get_available_actions(state)
+            if not actions:
+                break
+            action = await agent.decide(state, actions)
+            state, reward, _ = await env.step(action)
+            total_reward += reward
+
+        return total_reward, "win" if state.is_correct else "loss"
+
+    return play
+
+
+ALL_GAMES = list(BASELINES)
+
+
+def _get_baseline(game_name: str, agent: str = "heuristic") -> Callable[[], Awaitable[PlayFn]]:
+    if game_name not in BASELINES:
         raise ValueError(f"Unknown game: {game_name}")
+    if agent not in BASELINES[game_name]:
+        raise ValueError(f"No {agent} baseline for {game_name}")
+    return BASELINES[game_name][agent]
+
+
+async def _episode_done(progress: Callable[[int], None] | None) -> None:
+    if progress is not None:
+        progress(1)
+    # Let concurrently scheduled games make progress between episodes
+    await asyncio.sleep(0)
+
+
+async def _play_seeds(
+    game_name: str,
+    seeds: list[int],
+    progress: Callable[[int], None] | None = None,
+    agent: str = "heuristic",
+) -> list[EpisodeOutcome]:
+    play = await _get_baseline(game_name, agent)()
+    outcomes: list[EpisodeOutcome] = []
+    for seed in seeds:
+        reward, outcome = await play(seed)
+        outcomes.append((seed, reward, outcome))
+        await _episode_done(progress)
+    return outcomes
+
+
+def _run_shard(game_name: str, seeds: list[int], agent: str) -> list[EpisodeOutcome]:
+    """Worker-process entry point: play one shard of seeds."""
+    return asyncio.run(_play_seeds(game_name, seeds, agent=agent))
+
+
+def shard_seeds(seeds: list[int], num_shards: int) -> list[list[int]]:
+    """Split seeds into at most `num_shards` contiguous, near-equal shards."""
+    num_shards = max(1, min(num_shards, len(seeds)))
+    size, extra = divmod(len(seeds), num_shards)
+    shards = []
+    start = 0
+    for i in range(num_shards):
+        end = start + size + (1 if i < extra else 0)
+        shards.append(seeds[start:end])
+        start = end
+    return [shard for shard in shards if shard]
+
+
+def create_baseline_pool(workers: int | None = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool for sharded baselines.
+
+    Workers are spawned rather than forked: the parent runs an event loop
+    and rich's refresh thread, neither of which is fork-safe.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def aggregate_baseline(
+    game_name: str,
+    outcomes: list[EpisodeOutcome],
+    duration_seconds: float,
+    agent_type: str = "heuristic",
+) -> BenchmarkResult:
+    """
+    Merge per-episode outcomes into a BenchmarkResult.
 
-    duration = time.time() - start_time
+    Outcomes are ordered by seed before aggregating, so the result does
+    not depend on how episodes were sharded or in which order shards
+    finished.
+    """
+    outcomes = sorted(outcomes, key=lambda o: o[0])
+    rewards = [reward for _, reward, _ in outcomes]
+    counts = Counter(outcome for _, _, outcome in outcomes)
 
     return BenchmarkResult(
         game=game_name,
-        agent_type="heuristic",
-        episodes=episodes,
-        wins=wins,
-        losses=losses,
-        draws=draws,
+        agent_type=agent_type,
+        episodes=len(outcomes),
+        wins=counts["win"],
+        losses=counts["loss"],
+        draws=counts["draw"],
         avg_reward=sum(rewards) / len(rewards) if rewards else 0,
         max_reward=max(rewards) if rewards else 0,
         min_reward=min(rewards) if rewards else 0,
-        duration_seconds=duration,
+        duration_seconds=duration_seconds,
     )
 
 
+async def _run_sharded(
+    game_name: str,
+    seeds: list[int],
+    workers: int,
+    executor: ProcessPoolExecutor | None,
+    progress: Callable[[int], None] | None,
+    agent: str,
+) -> list[EpisodeOutcome]:
+    owns_executor = executor is None
+    if owns_executor:
+        executor = create_baseline_pool(workers)
+
+    loop = asyncio.get_running_loop()
+    # A few shards per worker keeps workers busy when episode lengths vary
+    shards = shard_seeds(seeds, workers * 4)
+    futures = [
+        loop.run_in_executor(executor, _run_shard, game_name, shard, agent) for shard in shards
+    ]
+
+    outcomes: list[EpisodeOutcome] = []
+    try:
+        for future in asyncio.as_completed(futures):
+            shard_outcomes = await future
+            outcomes.extend(shard_outcomes)
+            if progress is not None:
+                progress(len(shard_outcomes))
+    finally:
+        if owns_executor:
+            executor.shutdown(cancel_futures=True)
+
+    return outcomes
+
+
+async def run_game_baseline(
+    game_name: str,
+    episodes: int = 100,
+    progress: Callable[[int], None] | None = None,
+    seeds: list[int] | None = None,
+    workers: int = 1,
+    executor: ProcessPoolExecutor | None = None,
+    agent: str = "heuristic",
+) -> BenchmarkResult:
+    """
+    Run baseline benchmark for a single game.
+
+    With more than one worker (or a shared executor), episode seeds are
+    sharded across worker processes. The aggregate is identical to the
+    in-process run for the same seeds.
+
+    Args:
+        game_name: Game registered in BASELINES
+        episodes: Number of episodes, seeded 0..episodes-1
+        progress: Optional callback, called with the number of episodes
+            finished
+        seeds: Explicit episode seeds (overrides `episodes`)
+        workers: Worker processes (1 = play in-process)
+        executor: Shared process pool from `create_baseline_pool`
+        agent: Baseline agent registered for the game
+    """
+    _get_baseline(game_name, agent)
+    seeds = list(range(episodes)) if seeds is None else list(seeds)
+    start_time = time.time()
+
+    if executor is None and workers <= 1:
+        outcomes = await _play_seeds(game_name, seeds, progress, agent)
+    else:
+        outcomes = await _run_sharded(
+            game_name, seeds, max(1, workers), executor, progress, agent
+        )
+
+    return aggregate_baseline(game_name, outcomes, time.time() - start_time, agent)
+
+
+def _print_header(title: str) -> None:
+    console.print(f"\n[bold cyan]═══ {title} ═══[/bold cyan]\n")
+
+
+def _save_results(output_path: Path, prefix: str, results: dict) -> Path:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_file = output_path / f"{prefix}_{timestamp}.json"
+    with open(results_file, "w") as f:
+        json.dump({g: r.to_dict() for g, r in results.items()}, f, indent=2)
+    console.print(f"\n[green]Results saved to {results_file}[/green]")
+    return results_file
+
+
 async def run_baselines(
     episodes: int = 100,
     output_dir: str = "./benchmark_results/art",
+    games: list[str] | None = None,
+    max_parallel: int | None = None,
+    resume: bool = False,
+    workers: int | None = None,
+    agent: str = "heuristic",
 ) -> dict[str, BenchmarkResult]:
-    """Run baseline benchmarks for all games."""
+    """
+    Run baseline benchmarks for all games concurrently.
+
+    Args:
+        episodes: Episodes per game
+        output_dir: Directory for results and the resumable job state
+        games: Games to benchmark (default: all)
+        max_parallel: CPU slots, i.e. games run at once (default: CPU count)
+        resume: Skip games that finished in an interrupted run with the
+            same parameters
+        workers: Worker processes shared by all games for seed sharding
+            (default: CPU count; 1 = play in-process)
+        agent: Baseline agent; games without it are skipped
+    """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
+    games = games or ALL_GAMES
+    workers = workers or os.cpu_count() or 1
 
-    games = ["game_2048", "tic_tac_toe", "codenames", "temporal_clue"]
-    results: dict[str, BenchmarkResult] = {}
+    _print_header("ART Baseline Benchmarks")
 
-    console.print("\n[bold cyan]═══ ART Baseline Benchmarks ═══[/bold cyan]\n")
+    skipped = [game for game in games if agent not in BASELINES.get(game, {})]
+    if skipped:
+        console.print(f"[dim]No {agent} baseline for: {', '.join(skipped)}[/dim]")
+        games = [game for game in games if game not in skipped]
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        for game in games:
-            task = progress.add_task(f"Benchmarking {game}...", total=1)
-            result = await run_game_baseline(game, episodes)
-            results[game] = result
-            progress.update(task, completed=1)
-            console.print(f"  {game}: {result.win_rate:.1%} win rate, {result.avg_reward:.1f} avg reward")
-
-    # Display summary table
-    table = Table(title="Baseline Benchmark Results")
-    table.add_column("Game")
-    table.add_column("Win Rate", justify="right")
-    table.add_column("Avg Reward", justify="right")
-    table.add_column("Episodes", justify="right")
-    table.add_column("Duration", justify="right")
-
-    for game, result in results.items():
-        table.add_row(
-            game,
-            f"{result.win_rate:.1%}",
-            f"{result.avg_reward:.1f}",
-            str(result.episodes),
-            f"{result.duration_seconds:.1f}s",
-        )
+    executor = create_baseline_pool(workers) if workers > 1 else None
 
-    console.print("\n")
-    console.print(table)
+    def make_job(game: str) -> Job:
+        async def run(ctx: JobContext) -> dict:
+            result = await run_game_baseline(
+                game,
+                episodes,
+                progress=ctx.advance,
+                workers=workers,
+                executor=executor,
+                agent=agent,
+            )
+            return result.to_dict()
 
-    # Save results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_file = output_path / f"baselines_{timestamp}.json"
-    with open(results_file, "w") as f:
-        json.dump({g: r.to_dict() for g, r in results.items()}, f, indent=2)
+        return Job(name=game, run=run, cpu_slots=1, total=episodes)
 
-    console.print(f"\n[green]Results saved to {results_file}[/green]")
+    # Results do not depend on the worker count, so it is not part of the
+    # fingerprint and a run can resume with a different number of workers
+    scheduler = JobScheduler(
+        cpu_budget=max_parallel,
+        state_path=output_path / "baselines.state.json",
+        fingerprint=f"baselines:agent={agent}:episodes={episodes}",
+        console=console,
+    )
+    try:
+        states = await scheduler.run([make_job(game) for game in games], resume=resume)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    console.print()
+    scheduler.print_summary(
+        states,
+        title="Baseline Benchmark Results",
+        columns=[
+            ("Win Rate", lambda r: f"{r['win_rate']:.1%}"),
+            ("Avg Reward", lambda r: f"{r['avg_reward']:.1f}"),
+            ("Episodes", lambda r: str(r["episodes"])),
+        ],
+    )
+
+    results = {
+        name: BenchmarkResult.from_dict(state.result)
+        for name, state in states.items()
+        if state.status == "done"
+    }
+    _save_results(output_path, "baselines", results)
 
     return results
 
 
+def create_trainable(game_name: str, model: str = ""):
+    """
+    Create the environment and model-backed agent for a game.
+
+    This is the environment the training pipeline plays; benchmarks that
+    only need the environment can ignore the agent.
+
+    Args:
+        game_name: One of ALL_GAMES
+        model: Model name for the agent
+
+    Returns:
+        (environment, agent)
+
+    Raises:
+        ValueError: If the game is unknown
+    """
+    if game_name == "game_2048":
+        from elizaos_art.games.game_2048 import Game2048Agent, Game2048Environment
+
+        return Game2048Environment(), Game2048Agent(model_name=model)
+
+    if game_name == "tic_tac_toe":
+        from elizaos_art.games.tic_tac_toe import TicTacToeAgent, TicTacToeEnvironment
+
+        return TicTacToeEnvironment(), TicTacToeAgent(model_name=model)
+
+    if game_name == "codenames":
+        from elizaos_art.games.codenames import CodenamesAgent, CodenamesEnvironment
+
+        return CodenamesEnvironment(), CodenamesAgent(model_name=model)
+
+    if game_name == "temporal_clue":
+        from elizaos_art.games.temporal_clue import TemporalClueAgent, TemporalClueEnvironment
+
+        return TemporalClueEnvironment(), TemporalClueAgent(model_name=model)
+
+    raise ValueError(f"Unknown game: {game_name}")
+
+
+def _pipeline_benchmark(
+    game_name: str, agent_type: str, episodes: int, summary: dict
+) -> BenchmarkResult:
+    wins = int(summary["win_rate"] * episodes)
+    return BenchmarkResult(
+        game=game_name,
+        agent_type=agent_type,
+        episodes=episodes,
+        wins=wins,
+        losses=episodes - wins,
+        draws=0,
+        avg_reward=summary["avg_reward"],
+        max_reward=summary["max_reward"],
+        min_reward=summary["min_reward"],
+        duration_seconds=0,
+    )
+
+
 async def run_pipelines(
     model: str = "meta-llama/Llama-3.2-3B-Instruct",
     steps: int = 50,
     eval_episodes: int = 50,
     output_dir: str = "./benchmark_results/art",
+    games: list[str] | None = None,
+    max_parallel: int | None = None,
+    inference_slots: int = 4,
+    resume: bool = False,
 ) -> dict[str, PipelineResult]:
-    """Run full training pipelines for all games."""
+    """
+    Run full training pipelines for all games concurrently.
+
+    Pipelines spend most of their time waiting on inference, so the
+    number running at once is bounded by `inference_slots`.
+
+    Args:
+        model: Model to train
+        steps: Training steps per game
+        eval_episodes: Evaluation episodes before and after training
+        output_dir: Directory for results and the resumable job state
+        games: Games to train (default: all)
+        max_parallel: CPU slots (default: CPU count)
+        inference_slots: Pipelines allowed to use the model at once
+        resume: Skip games that finished in an interrupted run with the
+            same parameters
+    """
     from elizaos_art.base import TrainingConfig
     from elizaos_art.trainer import GRPOTrainer
 
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
+    games = games or ALL_GAMES
 
-    console.print("\n[bold cyan]═══ ART Training Pipelines ═══[/bold cyan]")
+    _print_header("ART Training Pipelines")
     console.print(f"Model: {model}")
     console.print(f"Steps: {steps}")
     console.print(f"Eval episodes: {eval_episodes}\n")
 
-    results: dict[str, PipelineResult] = {}
-
-    games_configs = [
-        ("game_2048", None),
-        ("tic_tac_toe", None),
-        ("codenames", None),
-        ("temporal_clue", None),
-    ]
-
-    for game_name, _ in games_configs:
-        console.print(f"\n[bold blue]Training {game_name}...[/bold blue]")
-
-        try:
-            # Get environment and agent
-            if game_name == "game_2048":
-                from elizaos_art.games.game_2048 import Game2048Agent, Game2048Environment
-
-                env = Game2048Environment()
-                agent = Game2048Agent(model_name=model)
-
-            elif game_name == "tic_tac_toe":
-                from elizaos_art.games.tic_tac_toe import TicTacToeAgent, TicTacToeEnvironment
-
-                env = TicTacToeEnvironment()
-                agent = TicTacToeAgent(model_name=model)
-
-            elif game_name == "codenames":
-                from elizaos_art.games.codenames import CodenamesAgent, CodenamesEnvironment
-
-                env = CodenamesEnvironment()
-                agent = CodenamesAgent(model_name=model)
-
-            elif game_name == "temporal_clue":
-                from elizaos_art.games.temporal_clue import (
-                    TemporalClueAgent,
-                    TemporalClueEnvironment,
-                )
-
-                env = TemporalClueEnvironment()
-                agent = TemporalClueAgent(model_name=model)
-
-            else:
-                continue
-
+    def make_job(game_name: str) -> Job:
+        async def run(ctx: JobContext) -> dict:
+            start_time = time.time()
+            env, agent = create_trainable(game_name, model)
             config = TrainingConfig(
                 model_name=model,
                 max_steps=steps,
@@ -348,89 +631,50 @@ async def run_pipelines(
 
             trainer = GRPOTrainer(env=env, agent=agent, config=config)
             pipeline_results = await trainer.pipeline(steps, eval_episodes)
+            ctx.advance()
 
-            # Create result
-            baseline = BenchmarkResult(
-                game=game_name,
-                agent_type=model,
-                episodes=eval_episodes,
-                wins=int(pipeline_results["baseline"]["win_rate"] * eval_episodes),
-                losses=eval_episodes - int(pipeline_results["baseline"]["win_rate"] * eval_episodes),
-                draws=0,
-                avg_reward=pipeline_results["baseline"]["avg_reward"],
-                max_reward=pipeline_results["baseline"]["max_reward"],
-                min_reward=pipeline_results["baseline"]["min_reward"],
-                duration_seconds=0,
-            )
-
-            final = BenchmarkResult(
-                game=game_name,
-                agent_type=f"{model} (trained)",
-                episodes=eval_episodes,
-                wins=int(pipeline_results["final"]["win_rate"] * eval_episodes),
-                losses=eval_episodes - int(pipeline_results["final"]["win_rate"] * eval_episodes),
-                draws=0,
-                avg_reward=pipeline_results["final"]["avg_reward"],
-                max_reward=pipeline_results["final"]["max_reward"],
-                min_reward=pipeline_results["final"]["min_reward"],
-                duration_seconds=0,
-            )
-
-            results[game_name] = PipelineResult(
+            return PipelineResult(
                 game=game_name,
                 model=model,
-                baseline=baseline,
-                final=final,
+                baseline=_pipeline_benchmark(
+                    game_name, model, eval_episodes, pipeline_results["baseline"]
+                ),
+                final=_pipeline_benchmark(
+                    game_name, f"{model} (trained)", eval_episodes, pipeline_results["final"]
+                ),
                 training_steps=steps,
                 training_trajectories=len(pipeline_results.get("training", [])) * 8,
-                training_duration_seconds=0,
+                training_duration_seconds=time.time() - start_time,
                 improvement_pct=pipeline_results["improvement"]["avg_reward_pct"],
-            )
-
-            console.print(f"  [green]✓[/green] {game_name}: {results[game_name].improvement_pct:+.1f}% improvement")
-
-        except Exception as e:
-            console.print(f"  [red]✗[/red] {game_name}: {e}")
-
-    # Display summary
-    if results:
-        table = Table(title="Training Pipeline Results")
-        table.add_column("Game")
-        table.add_column("Baseline", justify="right")
-        table.add_column("Trained", justify="right")
-        table.add_column("Improvement", justify="right")
+            ).to_dict()
 
-        for game, result in results.items():
-            table.add_row(
-                game,
-                f"{result.baseline.avg_reward:.1f}",
-                f"{result.final.avg_reward:.1f}",
-                f"{result.improvement_pct:+.1f}%",
-            )
-
-        console.print("\n")
-        console.print(table)
+        return Job(name=game_name, run=run, cpu_slots=1, inference_slots=1, total=1)
 
-    # Save results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_file = output_path / f"pipelines_{timestamp}.json"
-    with open(results_file, "w") as f:
-        json.dump(
-            {
-                g: {
-                    "game": r.game,
-                    "model": r.model,
-                    "baseline": r.baseline.to_dict(),
-                    "final": r.final.to_dict(),
-                    "improvement_pct": r.improvement_pct,
-                    "training_steps": r.training_steps,
-                }
-                for g, r in results.items()
-            },
-            f,
-            indent=2,
-        )
+    scheduler = JobScheduler(
+        cpu_budget=max_parallel,
+        inference_budget=inference_slots,
+        state_path=output_path / "pipelines.state.json",
+        fingerprint=f"pipelines:model={model}:steps={steps}:eval_episodes={eval_episodes}",
+        console=console,
+    )
+    states = await scheduler.run([make_job(game) for game in games], resume=resume)
+
+    console.print()
+    scheduler.print_summary(
+        states,
+        title="Training Pipeline Results",
+        columns=[
+            ("Baseline", lambda r: f"{r['baseline']['avg_reward']:.1f}"),
+            ("Trained", lambda r: f"{r['final']['avg_reward']:.1f}"),
+            ("Improvement", lambda r: f"{r['improvement_pct']:+.1f}%"),
+        ],
+    )
 
-    console.print(f"\n[green]Results saved to {results_file}[/green]")
+    results = {
+        name: PipelineResult.from_dict(state.result)
+        for name, state in states.items()
+        if state.status == "done"
+    }
+    _save_results(output_path, "pipelines", results)
 
     return results
@@ -75,18 +75,51 @@ def status() -> None:
     console.print(table)
 
 
+def _parse_games(games: str | None) -> list[str] | None:
+    if not games:
+        return None
+    from elizaos_art.benchmark_runner import ALL_GAMES
+
+    names = [name.strip() for name in games.split(",") if name.strip()]
+    unknown = [name for name in names if name not in ALL_GAMES]
+    if unknown:
+        console.print(f"[red]Unknown game(s): {', '.join(unknown)}[/red]")
+        raise typer.Exit(1)
+    return names
+
+
 @app.command("benchmark")
 def benchmark_all(
     episodes: int = typer.Option(100, help="Episodes per game"),
     output_dir: str = typer.Option("./benchmark_results/art", help="Output directory"),
+    games: str = typer.Option(None, help="Comma-separated games (default: all)"),
+    max_parallel: int = typer.Option(None, help="Games run at once (default: CPU count)"),
+    resume: bool = typer.Option(False, "--resume", help="Skip games finished in a previous run"),
+    workers: int = typer.Option(
+        None, help="Worker processes for seed sharding (default: CPU count)"
+    ),
+    agent: str = typer.Option(
+        "heuristic", help="Baseline agent: heuristic, or expectimax (2048 only)"
+    ),
 ) -> None:
     """Run baseline benchmarks across all games."""
     from elizaos_art.benchmark_runner import run_baselines
 
     console.print(f"\n[bold]Running baseline benchmarks[/bold]")
+    console.print(f"Agent: {agent}")
     console.print(f"Episodes per game: {episodes}\n")
 
-    asyncio.run(run_baselines(episodes=episodes, output_dir=output_dir))
+    asyncio.run(
+        run_baselines(
+            episodes=episodes,
+            output_dir=output_dir,
+            games=_parse_games(games),
+            max_parallel=max_parallel,
+            resume=resume,
+            workers=workers,
+            agent=agent,
+        )
+    )
 
 
 @app.command("train-all")
@@ -98,6 +131,10 @@ def train_all(
         help="Model to train",
     ),
     output_dir: str = typer.Option("./benchmark_results/art", help="Output directory"),
+    games: str = typer.Option(None, help="Comma-separated games (default: all)"),
+    max_parallel: int = typer.Option(None, help="CPU slots (default: CPU count)"),
+    inference_slots: int = typer.Option(4, help="Pipelines using the model at once"),
+    resume: bool = typer.Option(False, "--resume", help="Skip games finished in a previous run"),
 ) -> None:
     """Run full training pipelines for all games."""
     from elizaos_art.benchmark_runner import run_pipelines
@@ -113,10 +150,86 @@ def train_all(
             steps=steps,
             eval_episodes=eval_episodes,
             output_dir=output_dir,
+            games=_parse_games(games),
+            max_parallel=max_parallel,
+            inference_slots=inference_slots,
+            resume=resume,
         )
     )
 
 
+@app.command("bench-envs")
+def bench_envs(
+    games: str = typer.Option(None, help="Comma-separated games (default: all)"),
+    seeds: int = typer.Option(20, help="Seeded episodes per round"),
+    rounds: int = typer.Option(5, help="Rounds per game (fastest is kept)"),
+    baseline: str = typer.Option(
+        "./benchmark_results/env/baseline.json", help="Baseline JSON file"
+    ),
+    save_baseline: bool = typer.Option(
+        False, "--save-baseline", help="Save this run as the new baseline"
+    ),
+    threshold: float = typer.Option(0.25, help="Allowed slowdown before failing (0.25 = 25%)"),
+) -> None:
+    """Benchmark environment reset/step/actions/prompt cost (no model needed)."""
+    from elizaos_art.benchmark_runner import ALL_GAMES
+    from elizaos_art.env_benchmark import (
+        EnvBenchmarkConfig,
+        compare_to_baseline,
+        load_baseline,
+        run_env_benchmarks,
+    )
+    from elizaos_art.env_benchmark import save_baseline as write_baseline
+
+    names = _parse_games(games) or ALL_GAMES
+    config = EnvBenchmarkConfig(seeds=seeds, rounds=rounds)
+    report = asyncio.run(run_env_benchmarks(names, config))
+
+    table = Table(title="Environment Benchmarks")
+    table.add_column("Game", style="cyan")
+    table.add_column("Reset (µs)", justify="right")
+    table.add_column("Step (µs)", justify="right")
+    table.add_column("Steps/s", justify="right")
+    table.add_column("Actions (µs)", justify="right")
+    table.add_column("to_prompt (µs)", justify="right")
+    for name, result in report["results"].items():
+        table.add_row(
+            name,
+            f"{result['reset_us']:.1f}",
+            f"{result['step_us']:.1f}",
+            f"{result['steps_per_sec']:,.0f}",
+            f"{result['actions_us']:.1f}",
+            f"{result['to_prompt_us']:.1f}",
+        )
+    console.print(table)
+
+    if save_baseline:
+        path = write_baseline(report, baseline)
+        console.print(f"\n[green]Baseline saved to {path}[/green]")
+        return
+
+    if not Path(baseline).exists():
+        console.print(f"\n[dim]No baseline at {baseline}; run with --save-baseline[/dim]")
+        return
+
+    try:
+        regressions = compare_to_baseline(report, load_baseline(baseline), threshold)
+    except ValueError as e:
+        console.print(f"\n[red]Cannot compare to baseline: {e}[/red]")
+        raise typer.Exit(1)
+
+    if regressions:
+        console.print(f"\n[red]{len(regressions)} regression(s) beyond {threshold:.0%}:[/red]")
+        for r in regressions:
+            console.print(
+                f"  {r['game']} {r['metric']}: {r['baseline']:.1f} → {r['current']:.1f} "
+                f"({r['change']:+.0%})"
+            )
+        raise typer.Exit(1)
+
+    console.print(f"\n[green]No regressions beyond {threshold:.0%}[/green]")
+
+
 @app.command()
 def clean(
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
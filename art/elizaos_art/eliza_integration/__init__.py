@@ -17,26 +17,36 @@ Integrates with ElizaOS plugins:
 from elizaos_art.eliza_integration.runtime_integration import (
     ARTRuntime,
     ARTRuntimeConfig,
+    RolloutContext,
     create_art_plugin,
     create_art_runtime,
     create_game_action,
     create_game_state_provider,
 )
+from elizaos_art.eliza_integration.runtime_pool import AgentRuntimePool
 from elizaos_art.eliza_integration.storage_adapter import (
     ElizaStorageAdapter,
+    SpillingTrajectoryBuffer,
+    StorageIOExecutor,
     TrajectoryStore,
 )
 from elizaos_art.eliza_integration.trajectory_adapter import (
+    CaptureTier,
     ElizaEnvironmentState,
     ElizaLLMCall,
     ElizaTrajectoryLogger,
+    TrajectoryWriteBehind,
     convert_to_eliza_trajectory,
 )
 from elizaos_art.eliza_integration.local_ai_adapter import (
     ElizaLocalAIProvider,
+    EmbeddingResult,
+    InferenceWorker,
     LocalModelConfig,
     MockLocalAIProvider,
+    PrefixKVCache,
 )
+from elizaos_art.eliza_integration.embedding_cache import EmbeddingCache
 from elizaos_art.eliza_integration.export import (
     export_trajectories_art_format,
     export_trajectories_jsonl,
@@ -46,22 +56,32 @@ __all__ = [
     # Core Runtime
     "ARTRuntime",
     "ARTRuntimeConfig",
+    "RolloutContext",
+    "AgentRuntimePool",
     "create_art_runtime",
     # Plugin creation
     "create_art_plugin",
     "create_game_action",
     "create_game_state_provider",
     # Trajectory logging
+    "CaptureTier",
     "ElizaTrajectoryLogger",
     "ElizaLLMCall",
     "ElizaEnvironmentState",
+    "TrajectoryWriteBehind",
     "convert_to_eliza_trajectory",
     # Local AI
     "ElizaLocalAIProvider",
+    "EmbeddingResult",
+    "InferenceWorker",
     "LocalModelConfig",
     "MockLocalAIProvider",
+    "PrefixKVCache",
+    "EmbeddingCache",
     # Storage
     "ElizaStorageAdapter",
+    "SpillingTrajectoryBuffer",
+    "StorageIOExecutor",
     "TrajectoryStore",
     # Export
     "export_trajectories_art_format",
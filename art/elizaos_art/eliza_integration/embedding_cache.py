@@ -0,0 +1,140 @@
+"""
+Persistent embedding cache.
+
+Trajectory and memory texts are embedded again and again (re-indexing,
+similarity search, repeated game states). `EmbeddingCache` stores each
+vector once on disk, keyed by (model, text hash), and evicts the least
+recently used entries beyond `max_entries`.
+
+Each entry is a small binary file: a uint16 backend-name length, the
+UTF-8 backend name, then the float32 vector. Recency is kept in the
+file mtimes, so LRU order survives restarts. Opening a cache does not
+touch its entries; the LRU index is built from the mtimes the first
+time it is needed (the first `put`, or `len()`).
+"""
+
+import array
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class EmbeddingCache:
+    """
+    Disk-backed LRU cache of embedding vectors.
+
+    Args:
+        cache_dir: Directory for cache entries
+        max_entries: Entries kept before the least recently used are evicted
+    """
+
+    def __init__(self, cache_dir: str | Path, max_entries: int = 100_000):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # Oldest first, by last use; None until first needed (see _get_index)
+        self._index: OrderedDict[str, None] | None = None
+
+    def _get_index(self) -> OrderedDict[str, None]:
+        """Get the LRU index, scanning the entry mtimes on first use."""
+        with self._lock:
+            if self._index is not None:
+                return self._index
+
+        entries = []
+        for path in self.cache_dir.glob("*/*.emb"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path.stem))
+            except FileNotFoundError:
+                continue
+
+        with self._lock:
+            if self._index is None:
+                self._index = OrderedDict((key, None) for _, key in sorted(entries))
+            return self._index
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        """Cache key for a text embedded by a model."""
+        return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.emb"
+
+    def get(self, model: str, text: str) -> tuple[list[float], str] | None:
+        """Get a cached (vector, backend) for a text, or None."""
+        key = self.key(model, text)
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+                if self._index is not None:
+                    self._index.pop(key, None)
+            return None
+
+        (name_len,) = struct.unpack_from("<H", data)
+        backend = data[2 : 2 + name_len].decode()
+        vector = array.array("f")
+        vector.frombytes(data[2 + name_len :])
+
+        with self._lock:
+            self.hits += 1
+            if self._index is not None:
+                self._index[key] = None
+                self._index.move_to_end(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return vector.tolist(), backend
+
+    def put(self, model: str, text: str, vector: list[float], backend: str) -> None:
+        """Store a vector (written atomically), evicting old entries if full."""
+        key = self.key(model, text)
+        path = self._entry_path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        name = backend.encode()
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack("<H", len(name)))
+            f.write(name)
+            f.write(array.array("f", vector).tobytes())
+        os.replace(tmp_path, path)
+
+        index = self._get_index()
+        with self._lock:
+            index[key] = None
+            index.move_to_end(key)
+            evicted = []
+            while len(index) > self.max_entries:
+                old_key, _ = index.popitem(last=False)
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            self._entry_path(old_key).unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._get_index())
+
+    def get_stats(self) -> dict:
+        """Get hit/miss counts; `entries` is None until the index is loaded."""
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = len(self._index) if self._index is not None else None
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -6,18 +6,36 @@ Provides export to:
 - HuggingFace datasets
 - GRPO grouped format
 - RULER scoring format
+- Columnar Parquet / Arrow IPC (optional, needs pyarrow)
 
 All exports are compatible with the plugin-trajectory-logger format
 for seamless integration with ElizaOS training pipelines.
 """
 
+import asyncio
+import hashlib
 import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
 
 from elizaos_art.eliza_integration.storage_adapter import ElizaStorageAdapter
+from elizaos_art.eliza_integration.tokenization import (
+    ChatTokenizer,
+    TokenizationCache,
+    length_histogram,
+    pretokenize,
+)
+from elizaos_art.eliza_integration.trajectory_adapter import CaptureTier
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -44,6 +62,19 @@ class ExportOptions:
     validation_ratio: float = 0.1
     test_ratio: float = 0.1
 
+    # Parallel conversion (workers <= 1 converts inline on the event loop)
+    workers: int = 1
+    chunk_size: int = 64
+
+    # GRPO groups: store shared message prefixes once per group (changes the
+    # groups.jsonl layout; read it back with read_grpo_groups)
+    dedupe_prefixes: bool = False
+
+    # Pre-tokenization: adds inputIds/assistantMask/numTokens to each record.
+    # With a cache dir, repeated exports skip tokenization entirely.
+    tokenizer: ChatTokenizer | None = None
+    token_cache_dir: str | None = None
+
 
 @dataclass
 class ExportResult:
@@ -55,6 +86,49 @@ class ExportResult:
     test_count: int
     output_files: list[str]
 
+    # Throughput stats (populated by streaming exporters)
+    records_per_sec: float | None = None
+    peak_rss_mb: float | None = None
+
+    # Token length histogram and cache stats (pre-tokenized exports)
+    token_stats: dict | None = None
+
+    # Matching trajectories left out because their capture tier has no
+    # prompt/response text (see CaptureTier)
+    skipped_trajectories: int = 0
+
+
+class _Pretokenizer:
+    """Adds token fields to ART records and tracks their lengths."""
+
+    def __init__(self, tokenizer: ChatTokenizer, cache_dir: str | Path | None = None):
+        self.tokenizer = tokenizer
+        self.cache = TokenizationCache(cache_dir, tokenizer) if cache_dir else None
+        self.lengths: list[int] = []
+
+    @classmethod
+    def from_options(cls, opts: ExportOptions) -> "_Pretokenizer | None":
+        if opts.tokenizer is None:
+            return None
+        return cls(opts.tokenizer, opts.token_cache_dir)
+
+    def apply(self, art_traj: dict) -> dict:
+        tokenized = pretokenize(art_traj, self.tokenizer, self.cache)
+        self.lengths.append(tokenized["numTokens"])
+        return tokenized
+
+    def write_stats(self, output_dir: Path) -> dict:
+        """Write `token_lengths.json` next to the splits and return it."""
+        stats = {
+            "tokenizer": self.tokenizer.fingerprint,
+            "templateHash": self.tokenizer.template_hash,
+            "histogram": length_histogram(self.lengths),
+            "cache": self.cache.get_stats() if self.cache else None,
+        }
+        with open(output_dir / "token_lengths.json", "w") as f:
+            json.dump(stats, f, indent=2)
+        return stats
+
 
 async def export_for_art(
     storage: ElizaStorageAdapter,
@@ -72,29 +146,26 @@ async def export_for_art(
     output_dir = Path(opts.output_dir) / "openpipe-art"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build filter predicate
-    def matches_filter(traj: dict) -> bool:
-        if opts.scenario_ids and traj.get("scenarioId") not in opts.scenario_ids:
-            return False
-        if opts.agent_ids and traj.get("agentId") not in opts.agent_ids:
-            return False
-        if opts.min_reward is not None and traj.get("totalReward", 0) < opts.min_reward:
-            return False
-        if opts.max_reward is not None and traj.get("totalReward", 0) > opts.max_reward:
-            return False
-        return True
-
     # Get matching trajectories
-    trajectories = await storage.trajectories.get_trajectories_where(matches_filter)
+    matching = await storage.trajectories.get_trajectories_where(
+        lambda t: _matches_filter(t, opts)
+    )
+    trajectories = [t for t in matching if _has_training_text(t)]
 
     if opts.max_trajectories:
         trajectories = trajectories[: opts.max_trajectories]
 
     # Convert to ART format
-    art_trajectories = []
-    for traj in trajectories:
-        art_traj = _convert_to_art_format(traj)
-        art_trajectories.append(art_traj)
+    art_trajectories = [
+        art_traj
+        async for art_traj in convert_trajectories(
+            trajectories, workers=opts.workers, chunk_size=opts.chunk_size
+        )
+    ]
+
+    pretokenizer = _Pretokenizer.from_options(opts)
+    if pretokenizer:
+        art_trajectories = [pretokenizer.apply(t) for t in art_trajectories]
 
     # Split into train/validation/test
     n = len(art_trajectories)
@@ -125,9 +196,419 @@ async def export_for_art(
         validation_count=len(splits["validation"]),
         test_count=len(splits["test"]),
         output_files=output_files,
+        token_stats=pretokenizer.write_stats(output_dir) if pretokenizer else None,
+        skipped_trajectories=len(matching) - len(trajectories),
     )
 
 
+async def export_for_art_streaming(
+    storage: ElizaStorageAdapter,
+    options: ExportOptions | None = None,
+    batch_size: int = 64,
+) -> ExportResult:
+    """
+    Export trajectories in OpenPipe ART format with constant memory.
+
+    Unlike `export_for_art`, trajectories are read lazily from storage,
+    converted one at a time and appended to the split files as they
+    arrive. Each trajectory is assigned to train/validation/test by a
+    stable hash of its ID, so splits are deterministic across runs and
+    need no global shuffle; split sizes follow the configured ratios in
+    expectation rather than exactly.
+
+    Conversion can be spread over processes with `options.workers`;
+    record order (and therefore every output file) is identical for any
+    worker count.
+
+    The result includes records/sec and the process peak RSS.
+    """
+    opts = options or ExportOptions()
+    output_dir = Path(opts.output_dir) / "openpipe-art"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start_time = time.perf_counter()
+    counts = {"train": 0, "validation": 0, "test": 0}
+    files: dict = {}
+    total = 0
+    skipped = 0
+    pretokenizer = _Pretokenizer.from_options(opts)
+
+    async def matching() -> AsyncIterator[dict]:
+        nonlocal skipped
+        matched = 0
+        async for traj in storage.trajectories.iter_trajectories(batch_size):
+            if not _matches_filter(traj, opts):
+                continue
+            if not _has_training_text(traj):
+                skipped += 1
+                continue
+            if opts.max_trajectories and matched >= opts.max_trajectories:
+                return
+            matched += 1
+            yield traj
+
+    try:
+        async for art_traj in convert_trajectories(
+            matching(), workers=opts.workers, chunk_size=opts.chunk_size
+        ):
+            if pretokenizer:
+                art_traj = pretokenizer.apply(art_traj)
+            split_name = _split_for_id(
+                str(art_traj["metadata"].get("trajectoryId") or ""),
+                opts.train_ratio,
+                opts.validation_ratio,
+            )
+            if split_name not in files:
+                files[split_name] = open(output_dir / f"{split_name}.jsonl", "w")
+            files[split_name].write(json.dumps(art_traj) + "\n")
+
+            counts[split_name] += 1
+            total += 1
+    finally:
+        for f in files.values():
+            f.close()
+
+    elapsed = time.perf_counter() - start_time
+
+    return ExportResult(
+        total_trajectories=total,
+        train_count=counts["train"],
+        validation_count=counts["validation"],
+        test_count=counts["test"],
+        output_files=[
+            str(output_dir / f"{name}.jsonl") for name in counts if name in files
+        ],
+        records_per_sec=total / elapsed if elapsed > 0 else None,
+        peak_rss_mb=_peak_rss_mb(),
+        token_stats=pretokenizer.write_stats(output_dir) if pretokenizer else None,
+        skipped_trajectories=skipped,
+    )
+
+
+WATERMARK_FILE = "_watermark.json"
+
+
+async def export_for_art_incremental(
+    storage: ElizaStorageAdapter,
+    options: ExportOptions | None = None,
+    rebuild: bool = False,
+    source: str | None = None,
+    batch_size: int = 64,
+    dedupe_window: int = 10_000,
+) -> ExportResult:
+    """
+    Append newly saved trajectories to an existing ART export.
+
+    Produces the same `openpipe-art/{train,validation,test}.jsonl` layout
+    as `export_for_art_streaming`. A watermark (`_watermark.json` in the
+    output directory) records, per source, a cursor: the save time of
+    the newest trajectory exported and the IDs exported at exactly that
+    time. Later runs only open, convert and append trajectories saved
+    after it; finding them takes one directory listing and no file
+    reads. Splits are assigned by a stable hash of the trajectory ID, so
+    appending never moves an existing record to another split.
+
+    The watermark also keeps the last `dedupe_window` exported IDs. A
+    trajectory re-saved after export (and so with a newer mtime) is
+    skipped if its ID is among them; trajectories re-saved long after
+    they fell out of the window are exported again.
+
+    The watermark is written after the shards, together with their
+    sizes. If a run dies in between, the next run truncates the shards
+    back to the recorded sizes before appending, so nothing is exported
+    twice.
+
+    The shards share `openpipe-art/` with `export_for_art`. Shards that
+    exist without a watermark were not written by this function, so they
+    are left alone and a ValueError is raised unless `rebuild` is set.
+
+    Args:
+        storage: Storage adapter to read trajectories from
+        options: Export options (filters apply to new trajectories only)
+        rebuild: Discard existing shards and the watermark, then export
+            everything from scratch
+        source: Watermark key; defaults to the storage's trajectories dir,
+            so several stores can feed one export directory
+        batch_size: Trajectories read from storage per batch
+        dedupe_window: Recently exported IDs remembered to skip re-saves
+
+    Returns:
+        ExportResult counting the trajectories appended by this run
+
+    Raises:
+        ValueError: If shards exist that this function does not own
+    """
+    opts = options or ExportOptions()
+    output_dir = Path(opts.output_dir) / "openpipe-art"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    watermark_path = output_dir / WATERMARK_FILE
+    source = source or str(storage.trajectories.trajectories_dir.resolve())
+    split_names = ("train", "validation", "test")
+    shards = {name: output_dir / f"{name}.jsonl" for name in split_names}
+
+    state = {"sources": {}, "shards": {}, "counts": {}, "recentIds": []}
+    if rebuild:
+        for shard in shards.values():
+            shard.unlink(missing_ok=True)
+        watermark_path.unlink(missing_ok=True)
+    elif watermark_path.exists():
+        with open(watermark_path) as f:
+            state = json.load(f)
+    else:
+        existing = [str(shard) for shard in shards.values() if shard.exists()]
+        if existing:
+            raise ValueError(
+                f"{', '.join(existing)} exist but were not written by an incremental export "
+                "(no watermark); pass rebuild=True to replace them"
+            )
+
+    # Roll back anything appended after the last committed watermark
+    committed_sizes = {name: state["shards"].get(name, 0) for name in split_names}
+    for name, path in shards.items():
+        size = path.stat().st_size if path.exists() else 0
+        if size < committed_sizes[name]:
+            raise ValueError(
+                f"{path} is smaller than the watermark records; it was rewritten "
+                "by another exporter. Pass rebuild=True to start over"
+            )
+        if size > committed_sizes[name]:
+            with open(path, "r+") as f:
+                f.truncate(committed_sizes[name])
+
+    recent_ids = deque(state.get("recentIds", []), maxlen=max(dedupe_window, 0))
+    recent_set = set(recent_ids)
+
+    source_state = state["sources"].get(source)
+    cursor_time = source_state["timestamp"] if source_state else None
+    cursor_ids = list(source_state["seenIds"]) if source_state else []
+
+    start_time = time.perf_counter()
+    counts = {name: 0 for name in split_names}
+    files: dict = {}
+    total = 0
+    skipped = 0
+    pretokenizer = _Pretokenizer.from_options(opts)
+
+    async def new_trajectories() -> AsyncIterator[dict]:
+        nonlocal cursor_time, cursor_ids, skipped
+        cursor = (cursor_time, set(cursor_ids)) if cursor_time is not None else None
+        matched = 0
+        async for traj, (mtime_ns, trajectory_id) in (
+            storage.trajectories.iter_trajectories_since(cursor, batch_size)
+        ):
+            if opts.max_trajectories and matched >= opts.max_trajectories:
+                return
+            # Advance past filtered-out and re-saved trajectories too
+            if mtime_ns != cursor_time:
+                cursor_time, cursor_ids = mtime_ns, []
+            cursor_ids.append(trajectory_id)
+            if trajectory_id in recent_set or not _matches_filter(traj, opts):
+                continue
+            if not _has_training_text(traj):
+                skipped += 1
+                continue
+            matched += 1
+            yield traj
+
+    try:
+        async for art_traj in convert_trajectories(
+            new_trajectories(), workers=opts.workers, chunk_size=opts.chunk_size
+        ):
+            if pretokenizer:
+                art_traj = pretokenizer.apply(art_traj)
+            trajectory_id = str(art_traj["metadata"].get("trajectoryId") or "")
+            split_name = _split_for_id(
+                trajectory_id, opts.train_ratio, opts.validation_ratio
+            )
+            if split_name not in files:
+                files[split_name] = open(shards[split_name], "a")
+            files[split_name].write(json.dumps(art_traj) + "\n")
+            if recent_ids.maxlen:
+                if len(recent_ids) == recent_ids.maxlen:
+                    recent_set.discard(recent_ids[0])
+                recent_ids.append(trajectory_id)
+                recent_set.add(trajectory_id)
+
+            counts[split_name] += 1
+            total += 1
+    finally:
+        for f in files.values():
+            f.close()
+
+    # Commit: shard sizes and watermark are replaced atomically together
+    if cursor_time is not None:
+        state["sources"][source] = {"timestamp": cursor_time, "seenIds": cursor_ids}
+    for name, shard in shards.items():
+        state["shards"][name] = shard.stat().st_size if shard.exists() else 0
+        state["counts"][name] = state["counts"].get(name, 0) + counts[name]
+    state["recentIds"] = list(recent_ids)
+    state["updatedAt"] = int(time.time() * 1000)
+
+    tmp_path = watermark_path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, watermark_path)
+
+    elapsed = time.perf_counter() - start_time
+
+    return ExportResult(
+        total_trajectories=total,
+        train_count=counts["train"],
+        validation_count=counts["validation"],
+        test_count=counts["test"],
+        output_files=[
+            str(output_dir / f"{name}.jsonl")
+            for name in split_names
+            if (output_dir / f"{name}.jsonl").exists()
+        ],
+        records_per_sec=total / elapsed if elapsed > 0 else None,
+        peak_rss_mb=_peak_rss_mb(),
+        token_stats=pretokenizer.write_stats(output_dir) if pretokenizer else None,
+        skipped_trajectories=skipped,
+    )
+
+
+async def convert_trajectories(
+    trajectories: Iterable[dict] | AsyncIterable[dict],
+    workers: int | None = 1,
+    chunk_size: int = 64,
+    ordered: bool = True,
+) -> AsyncIterator[dict]:
+    """
+    Convert ElizaOS trajectories to ART format, optionally across processes.
+
+    Each conversion is independent CPU-bound work, so trajectories are
+    grouped into chunks of `chunk_size` and converted in a process pool.
+    At most `2 * workers` chunks are in flight, keeping memory bounded
+    for streamed inputs.
+
+    Args:
+        trajectories: ElizaOS-format trajectories (sync or async iterable)
+        workers: Number of processes; `None` uses all CPUs, `<= 1` converts inline
+        chunk_size: Trajectories per work unit
+        ordered: Yield results in input order (deterministic). When False,
+            chunks are yielded as soon as they finish.
+
+    Yields:
+        ART-format trajectories
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        async for traj in _aiter(trajectories):
+            yield _convert_to_art_format(traj)
+        return
+
+    loop = asyncio.get_running_loop()
+    max_inflight = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[asyncio.Future] = deque()
+
+        async def drain_one() -> list[dict]:
+            if ordered:
+                return await pending.popleft()
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            future = done.pop()
+            pending.remove(future)
+            return future.result()
+
+        chunk: list[dict] = []
+        async for traj in _aiter(trajectories):
+            chunk.append(traj)
+            if len(chunk) < chunk_size:
+                continue
+            pending.append(loop.run_in_executor(pool, _convert_chunk, chunk))
+            chunk = []
+            if len(pending) >= max_inflight:
+                for art_traj in await drain_one():
+                    yield art_traj
+
+        if chunk:
+            pending.append(loop.run_in_executor(pool, _convert_chunk, chunk))
+
+        while pending:
+            for art_traj in await drain_one():
+                yield art_traj
+
+
+def _convert_chunk(chunk: list[dict]) -> list[dict]:
+    """Process-pool work unit: convert a chunk of trajectories."""
+    return [_convert_to_art_format(traj) for traj in chunk]
+
+
+async def _aiter(items: Iterable[dict] | AsyncIterable[dict]) -> AsyncIterator[dict]:
+    """Iterate a sync or async iterable uniformly."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _has_training_text(traj: dict) -> bool:
+    """Check that a trajectory was captured with its prompts and responses."""
+    return traj.get("captureTier", CaptureTier.FULL.value) == CaptureTier.FULL.value
+
+
+async def _training_only(
+    trajectories: Iterable[dict] | AsyncIterable[dict],
+) -> AsyncIterator[dict]:
+    """Drop trajectories without prompt/response text, logging how many."""
+    skipped = 0
+    async for traj in _aiter(trajectories):
+        if _has_training_text(traj):
+            yield traj
+        else:
+            skipped += 1
+    if skipped:
+        logger.info("Skipped %d trajectories without prompt/response text", skipped)
+
+
+def _matches_filter(traj: dict, opts: ExportOptions) -> bool:
+    """Check a trajectory against the export filters."""
+    if opts.scenario_ids and traj.get("scenarioId") not in opts.scenario_ids:
+        return False
+    if opts.agent_ids and traj.get("agentId") not in opts.agent_ids:
+        return False
+    if opts.min_reward is not None and traj.get("totalReward", 0) < opts.min_reward:
+        return False
+    if opts.max_reward is not None and traj.get("totalReward", 0) > opts.max_reward:
+        return False
+    return True
+
+
+def _split_for_id(
+    trajectory_id: str,
+    train_ratio: float,
+    validation_ratio: float,
+) -> str:
+    """Assign a split from a stable hash of the trajectory ID."""
+    digest = hashlib.sha256(trajectory_id.encode()).digest()
+    position = int.from_bytes(digest[:8], "big") / 2**64
+    if position < train_ratio:
+        return "train"
+    if position < train_ratio + validation_ratio:
+        return "validation"
+    return "test"
+
+
+def _peak_rss_mb() -> float | None:
+    """Get the peak resident set size of this process in MB."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
 async def export_grouped_for_grpo(
     storage: ElizaStorageAdapter,
     options: ExportOptions | None = None,
@@ -144,54 +625,233 @@ async def export_grouped_for_grpo(
         "sharedPrefix": [...]
     }
     ```
+
+    Groups are read from storage one scenario at a time through the
+    store's scenario index, so memory holds a single group. Trajectories
+    captured without text (`captureTier` other than "full") are left out
+    of their group and counted in `skipped_trajectories`.
+
+    With `options.dedupe_prefixes` each group is written in the compact
+    prefix-trie encoding produced by `dedupe_group_prefixes`: shared
+    message prefixes are stored once and trajectories keep only their
+    suffix. Read such a file with `read_grpo_groups` to get the format
+    above back.
     """
     opts = options or ExportOptions()
     output_dir = Path(opts.output_dir) / "grpo-groups"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Get all trajectories
-    all_trajectories = await storage.trajectories.get_all_trajectories()
-
-    # Group by scenario
-    groups: dict[str, list[dict]] = {}
-    for traj in all_trajectories:
-        scenario_id = traj.get("scenarioId", "default")
-        if scenario_id not in groups:
-            groups[scenario_id] = []
-        groups[scenario_id].append(traj)
-
-    # Filter to scenarios with multiple trajectories
-    valid_groups = {k: v for k, v in groups.items() if len(v) >= 2}
-
-    # Convert to GRPO format
-    grpo_groups = []
-    for scenario_id, trajs in valid_groups.items():
-        art_trajs = [_convert_to_art_format(t) for t in trajs]
-        shared_prefix = _extract_shared_prefix(art_trajs)
-
-        grpo_groups.append({
-            "groupId": f"group-{len(grpo_groups)}",
-            "scenarioId": scenario_id,
-            "trajectories": art_trajs,
-            "sharedPrefix": shared_prefix,
-            "createdAt": int(datetime.now().timestamp() * 1000),
-        })
-
-    # Write output
+    # Convert and write one group at a time
     output_file = output_dir / "groups.jsonl"
+    group_count = 0
+    total = 0
+    skipped = 0
     with open(output_file, "w") as f:
-        for group in grpo_groups:
+        async for scenario_id, group_trajs in storage.trajectories.iter_scenario_groups():
+            trajs = [t for t in group_trajs if _has_training_text(t)]
+            skipped += len(group_trajs) - len(trajs)
+            # GRPO needs at least two trajectories to compare
+            if len(trajs) < 2:
+                continue
+
+            art_trajs = [_convert_to_art_format(t) for t in trajs]
+            group = {
+                "groupId": f"group-{group_count}",
+                "scenarioId": scenario_id,
+                "trajectories": art_trajs,
+                "sharedPrefix": _extract_shared_prefix(art_trajs),
+                "createdAt": int(datetime.now().timestamp() * 1000),
+            }
+            if opts.dedupe_prefixes:
+                group = dedupe_group_prefixes(group)
+
             f.write(json.dumps(group) + "\n")
+            group_count += 1
+            total += len(art_trajs)
 
     return ExportResult(
-        total_trajectories=sum(len(g["trajectories"]) for g in grpo_groups),
-        train_count=len(grpo_groups),
+        total_trajectories=total,
+        train_count=group_count,
         validation_count=0,
         test_count=0,
         output_files=[str(output_file)],
+        skipped_trajectories=skipped,
     )
 
 
+PREFIX_ENCODING = "prefix-trie-v1"
+
+
+class _PrefixTrie:
+    """
+    Message-level trie over a group of conversations.
+
+    Each node is one message (keyed by role and content) and counts the
+    conversations passing through it, so every shared prefix is found in
+    a single pass over the messages.
+    """
+
+    def __init__(self):
+        self.children: list[dict[tuple, int]] = [{}]
+        self.parent: list[int] = [-1]
+        self.message: list[dict | None] = [None]
+        self.count: list[int] = [0]
+
+    def insert(self, messages: list[dict]) -> list[int]:
+        """Add a conversation and return the node ids along its path."""
+        node = 0
+        self.count[0] += 1
+        path = []
+        for msg in messages:
+            key = (msg.get("role"), msg.get("content"))
+            child = self.children[node].get(key)
+            if child is None:
+                child = len(self.message)
+                self.children[node][key] = child
+                self.children.append({})
+                self.parent.append(node)
+                self.message.append(msg)
+                self.count.append(0)
+            self.count[child] += 1
+            path.append(child)
+            node = child
+        return path
+
+    def is_segment_end(self, node: int) -> bool:
+        """Check whether a shared run of messages stops at this node."""
+        children = self.children[node]
+        if len(children) != 1:
+            return True
+        (child,) = children.values()
+        return self.count[child] != self.count[node]
+
+
+def dedupe_group_prefixes(group: dict) -> dict:
+    """
+    Store the shared message prefixes of a GRPO group once.
+
+    Conversations are inserted into a prefix trie; every run of messages
+    shared by two or more trajectories becomes one entry in `prefixes`
+    (`{"parent": index or -1, "messages": [...]}`), and each trajectory
+    keeps only its unshared suffix plus a `prefixRef` into that table.
+    The group's `sharedPrefix` becomes a `sharedPrefixRef`.
+
+    Args:
+        group: Group in the expanded format written by the GRPO exporters
+
+    Returns:
+        Compact group; `expand_group_prefixes` restores the original
+    """
+    trajectories = group.get("trajectories", [])
+    trie = _PrefixTrie()
+    paths = [trie.insert(t.get("messages", [])) for t in trajectories]
+
+    prefixes: list[dict] = []
+    segment_ids: dict[int, int] = {}
+
+    def segment_for(node: int) -> int:
+        if node in segment_ids:
+            return segment_ids[node]
+        messages = []
+        current = node
+        while True:
+            messages.append(trie.message[current])
+            current = trie.parent[current]
+            if current <= 0 or trie.is_segment_end(current):
+                break
+        parent = segment_for(current) if current > 0 else -1
+        segment_ids[node] = len(prefixes)
+        prefixes.append({"parent": parent, "messages": messages[::-1]})
+        return segment_ids[node]
+
+    compact_trajectories = []
+    for traj, path in zip(trajectories, paths):
+        # Counts never increase along a path, so shared nodes form a prefix
+        shared_len = 0
+        while shared_len < len(path) and trie.count[path[shared_len]] >= 2:
+            shared_len += 1
+
+        compact = dict(traj)
+        compact["messages"] = traj.get("messages", [])[shared_len:]
+        compact["prefixRef"] = segment_for(path[shared_len - 1]) if shared_len else None
+        compact_trajectories.append(compact)
+
+    # The group-wide prefix ends at the deepest node every trajectory shares
+    shared_ref = None
+    if len(trajectories) >= 2 and paths:
+        common = [n for n in paths[0] if trie.count[n] == len(trajectories)]
+        if common:
+            shared_ref = segment_for(common[-1])
+
+    compact_group = {k: v for k, v in group.items() if k != "sharedPrefix"}
+    compact_group.update({
+        "prefixEncoding": PREFIX_ENCODING,
+        "prefixes": prefixes,
+        "sharedPrefixRef": shared_ref,
+        "trajectories": compact_trajectories,
+    })
+    return compact_group
+
+
+def expand_group_prefixes(group: dict) -> dict:
+    """
+    Expand a group written by `dedupe_group_prefixes`.
+
+    Groups without a prefix encoding are returned unchanged.
+    """
+    if group.get("prefixEncoding") != PREFIX_ENCODING:
+        return group
+
+    prefixes = group.get("prefixes", [])
+    resolved: dict[int, list[dict]] = {}
+
+    def full_prefix(index: int | None) -> list[dict]:
+        if index is None:
+            return []
+        if index not in resolved:
+            entry = prefixes[index]
+            parent = entry["parent"]
+            head = full_prefix(parent) if parent >= 0 else []
+            resolved[index] = head + entry["messages"]
+        return resolved[index]
+
+    trajectories = []
+    for compact in group.get("trajectories", []):
+        traj = {k: v for k, v in compact.items() if k != "prefixRef"}
+        traj["messages"] = full_prefix(compact.get("prefixRef")) + compact["messages"]
+        trajectories.append(traj)
+
+    expanded = {
+        k: v
+        for k, v in group.items()
+        if k not in ("prefixEncoding", "prefixes", "sharedPrefixRef")
+    }
+    expanded["trajectories"] = trajectories
+    expanded["sharedPrefix"] = list(full_prefix(group.get("sharedPrefixRef")))
+    return expanded
+
+
+def read_grpo_groups(path: str | Path, expand: bool = True) -> Iterator[dict]:
+    """
+    Read a GRPO groups JSONL file.
+
+    Args:
+        path: File written by `export_grouped_for_grpo`
+        expand: Expand prefix-deduplicated groups to the full format. Pass
+            False to get the compact prefix table, e.g. to reuse prefix KV
+            caches across a group.
+
+    Yields:
+        One group per line
+    """
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            group = json.loads(line)
+            yield expand_group_prefixes(group) if expand else group
+
+
 def _convert_to_art_format(eliza_traj: dict) -> dict:
     """
     Convert ElizaOS trajectory to ART format.
@@ -312,37 +972,33 @@ def _extract_shared_prefix(trajectories: list[dict]) -> list[dict]:
     if not trajectories:
         return []
 
-    all_messages = [t.get("messages", []) for t in trajectories]
-    if not all_messages:
-        return []
+    trie = _PrefixTrie()
+    for traj in trajectories:
+        trie.insert(traj.get("messages", []))
 
-    first_messages = all_messages[0]
+    # Follow the single path every trajectory takes through the trie
     shared = []
-
-    for i, msg in enumerate(first_messages):
-        all_match = all(
-            len(msgs) > i
-            and msgs[i].get("role") == msg.get("role")
-            and msgs[i].get("content") == msg.get("content")
-            for msgs in all_messages
-        )
-        if all_match:
-            shared.append(msg)
-        else:
+    node = 0
+    while len(trie.children[node]) == 1:
+        (child,) = trie.children[node].values()
+        if trie.count[child] != len(trajectories):
             break
+        shared.append(trie.message[child])
+        node = child
 
     return shared
 
 
 async def export_trajectories_art_format(
-    trajectories: list[dict],
+    trajectories: Iterable[dict] | AsyncIterable[dict],
     output_path: str | Path,
 ) -> str:
     """
     Export trajectories to ART-compatible JSONL format.
     
     Args:
-        trajectories: List of trajectories to export
+        trajectories: Trajectories to export (any iterable or async
+            iterable; streamed)
         output_path: Output file path
         
     Returns:
@@ -352,22 +1008,29 @@ async def export_trajectories_art_format(
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_path, "w") as f:
-        for traj in trajectories:
+        skipped = 0
+        async for traj in _aiter(trajectories):
+            if not _has_training_text(traj):
+                skipped += 1
+                continue
             art_traj = _convert_to_art_format(traj)
             f.write(json.dumps(art_traj) + "\n")
+    if skipped:
+        logger.info("Skipped %d trajectories without prompt/response text", skipped)
     
     return str(output_path)
 
 
 async def export_trajectories_jsonl(
-    trajectories: list[dict],
+    trajectories: Iterable[dict] | AsyncIterable[dict],
     output_path: str | Path,
 ) -> str:
     """
     Export trajectories to JSONL format.
     
     Args:
-        trajectories: List of trajectories to export
+        trajectories: Trajectories to export (any iterable or async
+            iterable; streamed)
         output_path: Output file path
         
     Returns:
@@ -377,7 +1040,7 @@ async def export_trajectories_jsonl(
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_path, "w") as f:
-        for traj in trajectories:
+        async for traj in _aiter(trajectories):
             f.write(json.dumps(traj) + "\n")
     
     return str(output_path)
@@ -406,6 +1069,8 @@ async def export_for_ruler_scoring(
     # Group by scenario
     groups: dict[str, list[dict]] = {}
     for traj in trajectories:
+        if not _has_training_text(traj):
+            continue
         scenario_id = traj.get("scenarioId", "default")
         if scenario_id not in groups:
             groups[scenario_id] = []
@@ -460,6 +1125,8 @@ async def export_grouped_trajectories_for_grpo(
     # Group by scenario
     groups: dict[str, list[dict]] = {}
     for traj in trajectories:
+        if not _has_training_text(traj):
+            continue
         scenario_id = traj.get("scenarioId", "default")
         if scenario_id not in groups:
             groups[scenario_id] = []
@@ -506,6 +1173,9 @@ async def export_for_huggingface(
     dataset_name: str = "elizaos-trajectories",
     train_ratio: float = 0.8,
     validation_ratio: float = 0.1,
+    workers: int = 1,
+    tokenizer: ChatTokenizer | None = None,
+    token_cache_dir: str | Path | None = None,
 ) -> dict[str, str]:
     """
     Export trajectories in HuggingFace datasets format.
@@ -518,6 +1188,10 @@ async def export_for_huggingface(
         dataset_name: Name for the dataset
         train_ratio: Ratio of data for training
         validation_ratio: Ratio of data for validation
+        workers: Processes used for conversion (output is identical for any value)
+        tokenizer: Optional tokenizer; adds token ids, assistant masks and
+            lengths to each record and writes `token_lengths.json`
+        token_cache_dir: Reuse tokenization across exports (needs `tokenizer`)
         
     Returns:
         Dict mapping split names to file paths
@@ -526,7 +1200,14 @@ async def export_for_huggingface(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Convert all trajectories
-    art_trajectories = [_convert_to_art_format(t) for t in trajectories]
+    art_trajectories = [
+        art_traj
+        async for art_traj in convert_trajectories(_training_only(trajectories), workers=workers)
+    ]
+
+    pretokenizer = _Pretokenizer(tokenizer, token_cache_dir) if tokenizer else None
+    if pretokenizer:
+        art_trajectories = [pretokenizer.apply(t) for t in art_trajectories]
 
     # Split data
     n = len(art_trajectories)
@@ -588,6 +1269,10 @@ Each record contains:
         f.write(dataset_card)
     
     output_files["readme"] = str(output_dir / "README.md")
+
+    if pretokenizer:
+        pretokenizer.write_stats(output_dir)
+        output_files["token_lengths"] = str(output_dir / "token_lengths.json")
     
     return output_files
 
@@ -604,3 +1289,315 @@ def _size_category(n: int) -> str:
         return "100K<n<1M"
     else:
         return "n>1M"
+
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def _require_pyarrow():
+    """Import pyarrow, which is only needed for columnar exports."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "pyarrow not installed. "
+            "Install with: pip install 'elizaos-art[export]'"
+        )
+    return pyarrow
+
+
+def columnar_schema(include_token_ids: bool = False):
+    """
+    Get the Arrow schema used by columnar exports.
+
+    Fields that training reads every step (messages, reward, group) are
+    native columns; the free-form metadata is a JSON string column that
+    is only decoded when a sample actually asks for it.
+
+    Args:
+        include_token_ids: Add `inputIds`/`assistantMask`/`numTokens` columns
+            for pre-tokenized data
+
+    Returns:
+        pyarrow.Schema
+    """
+    pa = _require_pyarrow()
+
+    fields = [
+        pa.field("trajectoryId", pa.string()),
+        pa.field("agentId", pa.string()),
+        pa.field("scenarioId", pa.string()),
+        pa.field("groupId", pa.string()),
+        pa.field("groupIndex", pa.int64()),
+        pa.field(
+            "messages",
+            pa.list_(pa.struct([("role", pa.string()), ("content", pa.string())])),
+        ),
+        pa.field("reward", pa.float64()),
+        pa.field("episodeLength", pa.int64()),
+        pa.field("durationMs", pa.int64()),
+        pa.field("metadata", pa.string()),
+    ]
+    if include_token_ids:
+        fields.append(pa.field("inputIds", pa.list_(pa.int32())))
+        fields.append(pa.field("assistantMask", pa.list_(pa.int8())))
+        fields.append(pa.field("numTokens", pa.int32()))
+
+    return pa.schema(fields)
+
+
+def _columnar_row(art_traj: dict) -> dict:
+    """Flatten an ART-format trajectory into a columnar row."""
+    metadata = art_traj.get("metadata", {})
+    metrics = art_traj.get("metrics", {})
+    scenario_id = metadata.get("scenarioId")
+
+    row = {
+        "trajectoryId": metadata.get("trajectoryId"),
+        "agentId": metadata.get("agentId"),
+        "scenarioId": scenario_id,
+        # Same grouping key as the GRPO exporters
+        "groupId": scenario_id or "default",
+        "groupIndex": metadata.get("groupIndex"),
+        "messages": [
+            {"role": m.get("role"), "content": m.get("content")}
+            for m in art_traj.get("messages", [])
+        ],
+        "reward": float(art_traj.get("reward") or 0.0),
+        "episodeLength": int(metrics.get("episodeLength") or 0),
+        "durationMs": int(metrics.get("durationMs") or 0),
+        "metadata": json.dumps(metadata),
+    }
+    if "inputIds" in art_traj:
+        row["inputIds"] = art_traj["inputIds"]
+        row["assistantMask"] = art_traj["assistantMask"]
+        row["numTokens"] = art_traj["numTokens"]
+
+    return row
+
+
+class _ColumnarSplitWriter:
+    """Buffers rows for one split and writes them a row group at a time."""
+
+    def __init__(self, path: Path, schema, format: str, row_group_size: int):
+        pa = _require_pyarrow()
+        self._pa = pa
+        self.path = path
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._buffer: list[dict] = []
+        self._sink = None
+
+        if format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(str(path), schema)
+        else:
+            import pyarrow.ipc
+
+            self._sink = pa.OSFile(str(path), "wb")
+            self._writer = pyarrow.ipc.new_file(self._sink, schema)
+
+    def write(self, row: dict) -> None:
+        self._buffer.append(row)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        table = self._pa.Table.from_pylist(self._buffer, schema=self.schema)
+        if self._sink is None:
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+        else:
+            self._writer.write_table(table, max_chunksize=self.row_group_size)
+        self.rows += len(self._buffer)
+        self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+
+async def export_columnar(
+    trajectories: Iterable[dict] | AsyncIterable[dict],
+    output_dir: str | Path,
+    dataset_name: str = "elizaos-trajectories",
+    format: str = "parquet",
+    train_ratio: float = 0.8,
+    validation_ratio: float = 0.1,
+    row_group_size: int = 1024,
+    tokenizer: ChatTokenizer | None = None,
+    token_cache_dir: str | Path | None = None,
+    workers: int = 1,
+) -> dict[str, str]:
+    """
+    Export trajectories as columnar Parquet or Arrow IPC files.
+
+    Training loaders can memory-map the output (see `ColumnarDataset`)
+    and random-access samples without re-parsing JSON every epoch.
+    Rows are streamed into row groups of `row_group_size`, so memory use
+    is bounded by one row group per split. Splits are assigned by a
+    stable hash of the trajectory ID, as in `export_for_art_streaming`.
+
+    Args:
+        trajectories: ElizaOS-format trajectories (sync or async iterable,
+            e.g. `storage.trajectories.iter_trajectories()`)
+        output_dir: Output directory
+        dataset_name: Name for the dataset
+        format: "parquet" (compressed, portable) or "arrow" (zero-copy mmap)
+        train_ratio: Ratio of data for training
+        validation_ratio: Ratio of data for validation
+        row_group_size: Rows per Parquet row group / Arrow record batch
+        tokenizer: Optional tokenizer; adds `inputIds`, `assistantMask` and
+            `numTokens` columns and writes `token_lengths.json`
+        token_cache_dir: Reuse tokenization across exports (needs `tokenizer`)
+        workers: Processes used for conversion
+
+    Returns:
+        Dict mapping split names (and "readme") to file paths
+    """
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format: {format}")
+
+    schema = columnar_schema(include_token_ids=tokenizer is not None)
+    output_dir = Path(output_dir) / dataset_name
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pretokenizer = _Pretokenizer(tokenizer, token_cache_dir) if tokenizer else None
+
+    writers: dict[str, _ColumnarSplitWriter] = {}
+    try:
+        async for art_traj in convert_trajectories(_training_only(trajectories), workers=workers):
+            if pretokenizer:
+                art_traj = pretokenizer.apply(art_traj)
+            row = _columnar_row(art_traj)
+            split_name = _split_for_id(
+                str(row["trajectoryId"] or ""), train_ratio, validation_ratio
+            )
+            if split_name not in writers:
+                writers[split_name] = _ColumnarSplitWriter(
+                    output_dir / f"{split_name}.{format}", schema, format, row_group_size
+                )
+            writers[split_name].write(row)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    counts = {name: 0 for name in ("train", "validation", "test")}
+    output_files = {}
+    for split_name, writer in writers.items():
+        counts[split_name] = writer.rows
+        output_files[split_name] = str(writer.path)
+
+    readme = output_dir / "README.md"
+    with open(readme, "w") as f:
+        f.write(_columnar_dataset_card(dataset_name, format, counts, schema))
+    output_files["readme"] = str(readme)
+
+    if pretokenizer:
+        pretokenizer.write_stats(output_dir)
+        output_files["token_lengths"] = str(output_dir / "token_lengths.json")
+
+    return output_files
+
+
+class ColumnarDataset:
+    """
+    Random-access reader for `export_columnar` output.
+
+    Arrow IPC files are memory-mapped and read zero-copy; Parquet files
+    are read through a memory map and decoded once. Indexing returns one
+    sample as a dict, decoding only that row.
+    """
+
+    def __init__(self, path: str | Path):
+        pa = _require_pyarrow()
+        self.path = Path(path)
+
+        if self.path.suffix == ".arrow":
+            import pyarrow.ipc
+
+            self._source = pa.memory_map(str(self.path), "r")
+            self.table = pyarrow.ipc.open_file(self._source).read_all()
+        else:
+            import pyarrow.parquet as pq
+
+            self._source = None
+            self.table = pq.read_table(str(self.path), memory_map=True)
+
+    @property
+    def schema(self):
+        return self.table.schema
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __getitem__(self, index: int) -> dict:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        row = self.table.slice(index, 1).to_pylist()[0]
+        row["metadata"] = json.loads(row["metadata"]) if row["metadata"] else {}
+        return row
+
+    def column(self, name: str) -> list:
+        """Get a whole column as a Python list (e.g. rewards for bucketing)."""
+        return self.table.column(name).to_pylist()
+
+    def close(self) -> None:
+        if self._source is not None:
+            self._source.close()
+
+
+def _columnar_dataset_card(
+    dataset_name: str,
+    format: str,
+    counts: dict[str, int],
+    schema,
+) -> str:
+    """Build a dataset card that records the columnar schema."""
+    n = sum(counts.values())
+    features = "\n".join(
+        f"    - name: {field.name}\n      dtype: {field.type}" for field in schema
+    )
+    return f"""---
+dataset_info:
+  name: {dataset_name}
+  description: ElizaOS agent trajectories for RL training
+  format: {format}
+  features:
+{features}
+  size_categories:
+    - {_size_category(n)}
+  license: mit
+  task_categories:
+    - reinforcement-learning
+    - text-generation
+---
+
+# {dataset_name}
+
+ElizaOS agent trajectories exported for RL training in columnar
+({format}) form.
+
+## Dataset Statistics
+
+- Total trajectories: {n}
+- Train: {counts['train']}
+- Validation: {counts['validation']}
+- Test: {counts['test']}
+
+## Schema
+
+```
+{schema.to_string(show_schema_metadata=False)}
+```
+
+`metadata` is the JSON-encoded ART metadata (environment context,
+game knowledge, reward components). `groupId` is the GRPO grouping key.
+"""
@@ -11,12 +11,22 @@ Supports:
 - Custom GGUF models
 - Embeddings generation
 - Tokenization
+
+Model calls never run on the event loop: they are queued to a dedicated
+inference worker thread that serves whatever requests are waiting as a
+batch and reports queue depth and tokens/sec.
 """
 
+import asyncio
 import os
+import queue
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Any, Callable, Protocol, runtime_checkable
+
+from elizaos_art.eliza_integration.embedding_cache import EmbeddingCache
 
 
 @dataclass
@@ -64,6 +74,22 @@ class LocalModelConfig:
     # Embedding dimensions
     embedding_dimensions: int = 384
 
+    # Persistent embedding cache; opt-in (None disables)
+    embedding_cache_dir: str | None = field(
+        default_factory=lambda: os.environ.get("EMBEDDING_CACHE_DIR")
+    )
+    embedding_cache_entries: int = 100_000
+
+    # Inference worker: requests served per batch, and how long the worker
+    # lingers for more requests before starting a batch (0 = only take
+    # requests that are already queued)
+    max_batch_size: int = 8
+    batch_wait_ms: float = 0.0
+
+    # Memory budget for saved prompt-prefix KV states (0 disables)
+    prefix_cache_mb: int = 1024
+    prefix_cache_min_tokens: int = 32
+
     @property
     def small_model_path(self) -> Path:
         return Path(self.models_dir) / self.small_model
@@ -97,19 +123,351 @@ class ModelProvider(Protocol):
         ...
 
 
+@dataclass
+class _InferenceRequest:
+    kind: str
+    payload: Any
+    future: asyncio.Future
+    loop: asyncio.AbstractEventLoop
+
+
+# A batch handler gets the payloads of one batch and returns, per payload
+# and in order, a (result, generated_tokens) pair or the Exception that
+# request failed with. Raising fails the whole batch.
+BatchHandler = Callable[[list[Any]], list[tuple[Any, int] | Exception]]
+
+
+class InferenceWorker:
+    """
+    Dedicated thread that runs model calls off the event loop.
+
+    Callers `await submit(kind, payload)`; the worker takes every request
+    that is waiting (up to `max_batch_size`, optionally lingering
+    `batch_wait_s` for more) and passes each kind's payloads to its batch
+    handler in one call. Handlers for backends that cannot batch simply
+    loop over the payloads - they still run off-loop and in order.
+
+    Args:
+        handlers: Batch handler per request kind
+        max_batch_size: Maximum requests served per batch
+        batch_wait_s: Time to wait for more requests before starting a batch
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, BatchHandler],
+        max_batch_size: int = 8,
+        batch_wait_s: float = 0.0,
+    ):
+        self.handlers = handlers
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_wait_s = batch_wait_s
+
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+        self._in_flight = 0
+        self._requests = 0
+        self._batches = 0
+        self._tokens = 0
+        self._busy_s = 0.0
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="local-ai-inference", daemon=True
+                )
+                self._thread.start()
+
+    async def submit(self, kind: str, payload: Any) -> Any:
+        """Queue a request and wait for its result."""
+        if kind not in self.handlers:
+            raise ValueError(f"No handler for request kind: {kind}")
+        self._ensure_started()
+
+        loop = asyncio.get_running_loop()
+        request = _InferenceRequest(kind, payload, loop.create_future(), loop)
+        self._queue.put(request)
+        return await request.future
+
+    def _run(self) -> None:
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+
+            batch = [request]
+            stop = False
+            deadline = time.monotonic() + self.batch_wait_s
+            while len(batch) < self.max_batch_size:
+                try:
+                    timeout = deadline - time.monotonic()
+                    if timeout > 0:
+                        item = self._queue.get(timeout=timeout)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: list[_InferenceRequest]) -> None:
+        with self._lock:
+            self._in_flight = len(batch)
+            self._batches += 1
+
+        by_kind: dict[str, list[_InferenceRequest]] = {}
+        for request in batch:
+            by_kind.setdefault(request.kind, []).append(request)
+
+        for kind, requests in by_kind.items():
+            start = time.perf_counter()
+            try:
+                results = self.handlers[kind]([r.payload for r in requests])
+            except Exception as e:
+                results = [e] * len(requests)
+            elapsed = time.perf_counter() - start
+
+            if len(results) < len(requests):
+                missing = RuntimeError(
+                    f"{kind} handler returned {len(results)} results for "
+                    f"{len(requests)} requests"
+                )
+                results = [*results, *[missing] * (len(requests) - len(results))]
+
+            tokens = 0
+            for request, result in zip(requests, results):
+                if isinstance(result, Exception):
+                    self._resolve(request, error=result)
+                    continue
+                value, generated = result
+                tokens += generated
+                self._resolve(request, value=value)
+
+            with self._lock:
+                self._busy_s += elapsed
+                self._tokens += tokens
+                self._requests += len(requests)
+
+        with self._lock:
+            self._in_flight = 0
+
+    @staticmethod
+    def _resolve(
+        request: _InferenceRequest,
+        value: Any = None,
+        error: Exception | None = None,
+    ) -> None:
+        def deliver() -> None:
+            if request.future.done():
+                return
+            if error is not None:
+                request.future.set_exception(error)
+            else:
+                request.future.set_result(value)
+
+        try:
+            request.loop.call_soon_threadsafe(deliver)
+        except RuntimeError:
+            pass  # Caller's loop is closed
+
+    def close(self) -> None:
+        """Finish queued requests and stop the worker thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "in_flight": self._in_flight,
+                "requests": self._requests,
+                "batches": self._batches,
+                "mean_batch_size": self._requests / self._batches if self._batches else 0.0,
+                "tokens": self._tokens,
+                "busy_s": self._busy_s,
+                "tokens_per_sec": self._tokens / self._busy_s if self._busy_s else 0.0,
+            }
+
+
+class PrefixKVCache:
+    """
+    llama-cpp-python's `LlamaRAMCache` with a minimum shared prefix and stats.
+
+    Installed via `Llama.set_cache`: after each completion the evaluated
+    state is stored under its tokens, and a new prompt restores the
+    stored state sharing its longest token prefix, so only the suffix
+    (the new game turn) is evaluated. Prefix lookup and the byte-bounded
+    LRU are the library's; this wrapper only refuses restores that share
+    too few tokens (every chat prompt shares the BOS/template header, and
+    loading a state to save a handful of tokens costs more than it saves)
+    and states that would flush the whole cache. It uses only the cache's
+    public mapping interface and measures the shared prefix against the
+    tokens recorded in the returned state.
+
+    Args:
+        capacity_bytes: Total size of stored states before LRU eviction
+        min_prefix_tokens: Shortest shared prefix worth restoring
+
+    Raises:
+        ImportError: If llama-cpp-python is not installed
+    """
+
+    def __init__(self, capacity_bytes: int = 1 << 30, min_prefix_tokens: int = 32):
+        try:
+            from llama_cpp import Llama, LlamaRAMCache
+        except ImportError:
+            raise ImportError(
+                "llama-cpp-python not installed. "
+                "Install with: pip install llama-cpp-python"
+            )
+
+        self.capacity_bytes = capacity_bytes
+        self.min_prefix_tokens = min_prefix_tokens
+        self._cache = LlamaRAMCache(capacity_bytes=capacity_bytes)
+        self._longest_token_prefix = Llama.longest_token_prefix
+
+        self.hits = 0
+        self.misses = 0
+        self.reused_tokens = 0
+
+    def _lookup(self, tokens: tuple[int, ...]) -> tuple[Any, int]:
+        """Get the state sharing the longest prefix with `tokens`, and that length."""
+        try:
+            state = self._cache[tokens]
+        except KeyError:
+            return None, 0
+        return state, self._longest_token_prefix(state.input_ids[: state.n_tokens], tokens)
+
+    def __contains__(self, tokens) -> bool:
+        return self._lookup(tuple(tokens))[1] >= self.min_prefix_tokens
+
+    def __getitem__(self, tokens) -> Any:
+        state, length = self._lookup(tuple(tokens))
+        if length < self.min_prefix_tokens:
+            self.misses += 1
+            raise KeyError("No cached prefix")
+
+        self.hits += 1
+        self.reused_tokens += length
+        return state
+
+    def __setitem__(self, tokens, state: Any) -> None:
+        if state.llama_state_size > self.capacity_bytes:
+            return
+        self._cache[tokens] = state
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._cache.cache_state),
+            "bytes": self._cache.cache_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "reused_tokens": self.reused_tokens,
+        }
+
+
+# Backend name reported for the sha384 stand-in vectors
+HASH_EMBEDDING_BACKEND = "hash-sha384"
+
+
+@dataclass
+class EmbeddingResult:
+    """An embedding vector and the backend that produced it."""
+
+    vector: list[float]
+    backend: str
+    cached: bool = False
+
+
+def _hash_embedding(text: str) -> list[float]:
+    """Deterministic stand-in embedding (sha384 bytes scaled to [0, 1])."""
+    import hashlib
+
+    hash_bytes = hashlib.sha384(text.encode()).digest()
+    return [float(b) / 255.0 for b in hash_bytes]
+
+
+async def _embed_with_cache(
+    texts: list[str],
+    backend: str,
+    cache: EmbeddingCache | None,
+    worker: InferenceWorker,
+) -> list[EmbeddingResult]:
+    """Serve embeddings from the cache, embedding each distinct miss once."""
+    results: list[EmbeddingResult | None] = [None] * len(texts)
+
+    if cache is not None:
+        cached = await asyncio.to_thread(lambda: [cache.get(backend, t) for t in texts])
+        for i, hit in enumerate(cached):
+            if hit is not None:
+                results[i] = EmbeddingResult(vector=hit[0], backend=hit[1], cached=True)
+
+    missing: dict[str, list[int]] = {}
+    for i, text in enumerate(texts):
+        if results[i] is None:
+            missing.setdefault(text, []).append(i)
+
+    computed = await asyncio.gather(*(worker.submit("embed", text) for text in missing))
+    for (text, indices), (vector, produced_by) in zip(missing.items(), computed):
+        for i in indices:
+            results[i] = EmbeddingResult(vector=vector, backend=produced_by)
+
+    if cache is not None and missing:
+
+        def store() -> None:
+            for text, (vector, produced_by) in zip(missing, computed):
+                cache.put(backend, text, vector, produced_by)
+
+        await asyncio.to_thread(store)
+
+    return results
+
+
 class ElizaLocalAIProvider:
     """
     Local AI provider for ART training.
     
     Wraps llama-cpp-python for local GGUF model inference,
     compatible with plugin-local-ai patterns.
+
+    All model calls go through an `InferenceWorker`. llama-cpp-python's
+    chat API evaluates one sequence at a time, so chat requests in a
+    batch run back to back; embedding requests in a batch are embedded
+    with a single `embed` call.
     """
 
     def __init__(self, config: LocalModelConfig | None = None):
         self.config = config or LocalModelConfig()
         self._llm = None
         self._embedding_model = None
+        self._embedding_backend = HASH_EMBEDDING_BACKEND
         self._initialized = False
+        self._prefix_cache: PrefixKVCache | None = None
+        self._embedding_cache: EmbeddingCache | None = None
+        self._worker = InferenceWorker(
+            {
+                "chat": self._run_chat_batch,
+                "embed": self._run_embed_batch,
+                "tokenize": self._run_tokenize_batch,
+                "detokenize": self._run_detokenize_batch,
+            },
+            max_batch_size=self.config.max_batch_size,
+            batch_wait_s=self.config.batch_wait_ms / 1000,
+        )
 
     async def initialize(self) -> None:
         """Initialize the local models."""
@@ -124,10 +482,11 @@ class ElizaLocalAIProvider:
                 "Install with: pip install llama-cpp-python"
             )
 
-        # Initialize main model
+        # Initialize main model (loading takes seconds; keep it off the loop)
         model_path = self.config.small_model_path
         if model_path.exists():
-            self._llm = Llama(
+            self._llm = await asyncio.to_thread(
+                Llama,
                 model_path=str(model_path),
                 n_ctx=self.config.context_length,
                 n_gpu_layers=self.config.gpu_layers,
@@ -140,8 +499,49 @@ class ElizaLocalAIProvider:
                 f"Download a GGUF model to {self.config.models_dir}"
             )
 
+        if self.config.prefix_cache_mb > 0:
+            self._prefix_cache = PrefixKVCache(
+                capacity_bytes=self.config.prefix_cache_mb << 20,
+                min_prefix_tokens=self.config.prefix_cache_min_tokens,
+            )
+            self._llm.set_cache(self._prefix_cache)
+
+        await self._initialize_embeddings(Llama)
+
         self._initialized = True
 
+    async def _initialize_embeddings(self, llama_cls) -> None:
+        """Pick the embedding backend: dedicated model, chat model, or hash."""
+        embedding_path = self.config.embedding_model_path
+        if embedding_path.exists():
+            self._embedding_model = await asyncio.to_thread(
+                llama_cls,
+                model_path=str(embedding_path),
+                embedding=True,
+                n_gpu_layers=self.config.gpu_layers,
+                verbose=False,
+            )
+            self._embedding_backend = f"llama.cpp:{self.config.embedding_model}"
+        else:
+            try:
+                await asyncio.to_thread(self._llm.embed, "probe")
+                self._embedding_backend = f"llama.cpp:{self.config.small_model}"
+            except Exception:
+                # Chat models loaded without embedding=True cannot embed
+                self._embedding_backend = HASH_EMBEDDING_BACKEND
+
+        # Hash vectors are cheaper to recompute than to read back
+        if self.config.embedding_cache_dir and self._embedding_backend != HASH_EMBEDDING_BACKEND:
+            self._embedding_cache = EmbeddingCache(
+                self.config.embedding_cache_dir,
+                max_entries=self.config.embedding_cache_entries,
+            )
+
+    @property
+    def embedding_backend(self) -> str:
+        """Name of the backend that produces new embeddings."""
+        return self._embedding_backend
+
     async def generate_text(
         self,
         prompt: str,
@@ -166,36 +566,71 @@ class ElizaLocalAIProvider:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = self._llm.create_chat_completion(
-            messages=messages,
-            temperature=temp,
-            max_tokens=tokens,
-            stop=stop_sequences,
+        return await self._worker.submit(
+            "chat",
+            {
+                "messages": messages,
+                "temperature": temp,
+                "max_tokens": tokens,
+                "stop": stop_sequences,
+            },
         )
 
-        return response["choices"][0]["message"]["content"]
+    def _run_chat_batch(self, requests: list[dict]) -> list[tuple[str, int] | Exception]:
+        """Worker-thread chat completions (one sequence at a time)."""
+        results: list[tuple[str, int] | Exception] = []
+        for request in requests:
+            try:
+                response = self._llm.create_chat_completion(**request)
+                usage = response.get("usage") or {}
+                results.append(
+                    (
+                        response["choices"][0]["message"]["content"],
+                        usage.get("completion_tokens", 0),
+                    )
+                )
+            except Exception as e:
+                # Fail only this request; the rest of the batch still completes
+                results.append(e)
+        return results
 
     async def generate_embedding(self, text: str) -> list[float]:
-        """Generate embedding vector."""
+        """Generate embedding vector (see `generate_embeddings` for the backend)."""
+        results = await self.generate_embeddings([text])
+        return results[0].vector
+
+    async def generate_embeddings(self, texts: list[str]) -> list[EmbeddingResult]:
+        """
+        Embed a batch of texts.
+
+        Cached vectors are returned without touching the model; the rest
+        are embedded in worker batches and added to the cache. Each
+        result names the backend that produced it - `hash-sha384` means
+        no embedding-capable model was available.
+
+        Returns:
+            One EmbeddingResult per input text, in order
+        """
         if not self._initialized:
             await self.initialize()
 
         if self._llm is None:
             raise RuntimeError("Model not initialized")
 
-        # Use the model's embedding function if available
-        # Otherwise use a simple hash-based embedding (for testing)
-        try:
-            embedding = self._llm.embed(text)
-            return list(embedding)
-        except (AttributeError, NotImplementedError):
-            # Fallback: generate from model output
-            # This is a placeholder - real implementation would use
-            # a dedicated embedding model
-            import hashlib
+        return await _embed_with_cache(
+            texts, self._embedding_backend, self._embedding_cache, self._worker
+        )
 
-            hash_bytes = hashlib.sha384(text.encode()).digest()
-            return [float(b) / 255.0 for b in hash_bytes]
+    def _run_embed_batch(
+        self, texts: list[str]
+    ) -> list[tuple[tuple[list[float], str], int]]:
+        """Worker-thread embeddings for a batch of texts."""
+        backend = self._embedding_backend
+        if backend == HASH_EMBEDDING_BACKEND:
+            return [((_hash_embedding(text), backend), 0) for text in texts]
+
+        model = self._embedding_model or self._llm
+        return [((list(vector), backend), 0) for vector in model.embed(texts)]
 
     async def tokenize(self, text: str) -> list[int]:
         """Tokenize text."""
@@ -205,7 +640,7 @@ class ElizaLocalAIProvider:
         if self._llm is None:
             raise RuntimeError("Model not initialized")
 
-        return self._llm.tokenize(text.encode())
+        return await self._worker.submit("tokenize", text)
 
     async def detokenize(self, tokens: list[int]) -> str:
         """Detokenize tokens."""
@@ -215,7 +650,29 @@ class ElizaLocalAIProvider:
         if self._llm is None:
             raise RuntimeError("Model not initialized")
 
-        return self._llm.detokenize(tokens).decode()
+        return await self._worker.submit("detokenize", tokens)
+
+    def _run_tokenize_batch(self, texts: list[str]) -> list[tuple[list[int], int] | Exception]:
+        """Worker-thread tokenization."""
+        results: list[tuple[list[int], int] | Exception] = []
+        for text in texts:
+            try:
+                results.append((self._llm.tokenize(text.encode()), 0))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _run_detokenize_batch(
+        self, batches: list[list[int]]
+    ) -> list[tuple[str, int] | Exception]:
+        """Worker-thread detokenization."""
+        results: list[tuple[str, int] | Exception] = []
+        for tokens in batches:
+            try:
+                results.append((self._llm.detokenize(tokens).decode(), 0))
+            except Exception as e:
+                results.append(e)
+        return results
 
     def get_model_info(self) -> dict:
         """Get information about loaded models."""
@@ -231,16 +688,48 @@ class ElizaLocalAIProvider:
             "gpu_layers": self.config.gpu_layers,
         }
 
+    def get_stats(self) -> dict:
+        """Get inference worker, prefix cache and embedding cache stats."""
+        stats = self._worker.get_stats()
+        stats["embedding_backend"] = self._embedding_backend
+        if self._prefix_cache is not None:
+            stats["prefix_cache"] = self._prefix_cache.get_stats()
+        if self._embedding_cache is not None:
+            stats["embedding_cache"] = self._embedding_cache.get_stats()
+        return stats
+
+    def close(self) -> None:
+        """Stop the inference worker after serving queued requests."""
+        self._worker.close()
+
 
 class MockLocalAIProvider:
     """
     Mock provider for testing without actual models.
     
     Generates deterministic responses based on input hashing.
+
+    Requests go through the same `InferenceWorker` as the real provider;
+    `latency_s` simulates the cost of one (batched) forward pass, so
+    queueing and batching behaviour can be tested on CPU.
     """
 
-    def __init__(self):
+    embedding_backend = "mock-sha384"
+
+    def __init__(
+        self,
+        latency_s: float = 0.0,
+        max_batch_size: int = 8,
+        embedding_cache: EmbeddingCache | None = None,
+    ):
         self._initialized = True
+        self.latency_s = latency_s
+        self.embedding_cache = embedding_cache
+        self.embedded_texts = 0
+        self._worker = InferenceWorker(
+            {"chat": self._run_chat_batch, "embed": self._run_embed_batch},
+            max_batch_size=max_batch_size,
+        )
 
     async def initialize(self) -> None:
         pass
@@ -254,18 +743,48 @@ class MockLocalAIProvider:
         stop_sequences: list[str] | None = None,
     ) -> str:
         """Generate mock response."""
+        return await self._worker.submit("chat", prompt)
+
+    def _run_chat_batch(self, prompts: list[str]) -> list[tuple[str, int]]:
         import hashlib
 
-        # Generate deterministic response based on prompt
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:8]
-        return f"Mock response for prompt hash {prompt_hash}"
+        if self.latency_s:
+            time.sleep(self.latency_s)
+
+        results = []
+        for prompt in prompts:
+            # Generate deterministic response based on prompt
+            prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:8]
+            text = f"Mock response for prompt hash {prompt_hash}"
+            results.append((text, len(text.split())))
+        return results
 
     async def generate_embedding(self, text: str) -> list[float]:
         """Generate mock embedding."""
-        import hashlib
+        results = await self.generate_embeddings([text])
+        return results[0].vector
+
+    async def generate_embeddings(self, texts: list[str]) -> list[EmbeddingResult]:
+        """Generate mock embeddings (optionally through an EmbeddingCache)."""
+        return await _embed_with_cache(
+            texts, self.embedding_backend, self.embedding_cache, self._worker
+        )
 
-        hash_bytes = hashlib.sha384(text.encode()).digest()
-        return [float(b) / 255.0 for b in hash_bytes]
+    def _run_embed_batch(
+        self, texts: list[str]
+    ) -> list[tuple[tuple[list[float], str], int]]:
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        self.embedded_texts += len(texts)
+        return [((_hash_embedding(text), self.embedding_backend), 0) for text in texts]
+
+    def get_stats(self) -> dict:
+        """Get inference worker stats (queue depth, batching, tokens/sec)."""
+        return self._worker.get_stats()
+
+    def close(self) -> None:
+        """Stop the inference worker after serving queued requests."""
+        self._worker.close()
 
 
 def get_recommended_model(available_memory_gb: float) -> str:
@@ -0,0 +1,231 @@
+"""
+Content-addressed storage for prompt text in trajectories.
+
+System prompts, and most of each user prompt, repeat across thousands
+of LLM calls. `PromptBlobStore` keeps every distinct piece of text once
+(hash -> text) and trajectories refer to it:
+
+```json
+{"systemPrompt": {"$blob": ["9f2c...", "41ab..."]}}
+```
+
+Text is split into chunks at paragraph boundaries so a prompt that
+shares only its instructions with earlier prompts still shares those
+chunks. Short strings are left inline.
+
+Blobs live in a `blobs/` directory next to the trajectory files that
+refer to them (`blob_dir_for`), so the trajectory logger and the
+trajectory store resolve the same references.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+BLOB_KEY = "$blob"
+
+BLOB_DIR_NAME = "blobs"
+
+# LLM call fields that are stored by reference
+DEDUPED_FIELDS = ("systemPrompt", "userPrompt", "response")
+
+_PARAGRAPH_END = re.compile(r"(?<=\n\n)")
+
+
+def blob_dir_for(trajectories_dir: str | Path) -> Path:
+    """Get the blob directory for trajectory files stored in `trajectories_dir`."""
+    return Path(trajectories_dir) / BLOB_DIR_NAME
+
+
+def has_blob_refs(trajectory: dict) -> bool:
+    """Check whether any LLM call of a trajectory holds a blob reference."""
+    for step in trajectory.get("steps", []):
+        for call in step.get("llmCalls") or []:
+            for key in DEDUPED_FIELDS:
+                value = call.get(key)
+                if isinstance(value, dict) and BLOB_KEY in value:
+                    return True
+    return False
+
+
+class PromptBlobStore:
+    """
+    Hash -> text store for prompt chunks, optionally persisted to disk.
+
+    Each chunk is written once as `<blob_dir>/<hh>/<hash>.txt`. Chunks
+    stay in memory until `save()` has written them; after that they are
+    kept in an LRU cache of at most `max_cached_chars` and read back
+    from disk once evicted, so memory does not grow with the number of
+    distinct prompts. A store opened on an existing directory can
+    rehydrate old trajectories. Without a `blob_dir` nothing can be
+    read back, so every chunk stays in memory.
+
+    Args:
+        blob_dir: Directory for chunk files (None: memory only)
+        min_chunk: Shortest text stored by reference; also the size
+            chunks are merged up to
+        max_cached_chars: Characters of saved chunks kept in memory
+    """
+
+    def __init__(
+        self,
+        blob_dir: str | Path | None = None,
+        min_chunk: int = 256,
+        max_cached_chars: int = 16 * 1024 * 1024,
+    ):
+        self.blob_dir = Path(blob_dir) if blob_dir else None
+        if self.blob_dir:
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.min_chunk = min_chunk
+        self.max_cached_chars = max_cached_chars
+
+        # Chunks not on disk yet; never evicted
+        self._unsaved: dict[str, str] = {}
+        # Saved chunks, least recently used first
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cached_chars = 0
+        self._lock = threading.Lock()
+        self._referenced_chars = 0
+        self._stored_chars = 0
+
+    def _chunks(self, text: str) -> list[str]:
+        """Split at paragraph ends, merging pieces up to `min_chunk` chars."""
+        chunks: list[str] = []
+        current = ""
+        for piece in _PARAGRAPH_END.split(text):
+            current += piece
+            if len(current) >= self.min_chunk:
+                chunks.append(current)
+                current = ""
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _blob_path(self, blob_id: str) -> Path:
+        return self.blob_dir / blob_id[:2] / f"{blob_id}.txt"
+
+    def put_text(self, text: str) -> str | dict:
+        """Store text and return a reference (short text is returned as-is)."""
+        if not isinstance(text, str) or len(text) < self.min_chunk:
+            return text
+
+        ids = []
+        with self._lock:
+            self._referenced_chars += len(text)
+            for chunk in self._chunks(text):
+                blob_id = hashlib.sha256(chunk.encode()).hexdigest()[:32]
+                if blob_id in self._cache:
+                    self._cache.move_to_end(blob_id)
+                elif blob_id not in self._unsaved:
+                    # Possibly evicted and already on disk; save() skips those
+                    self._unsaved[blob_id] = chunk
+                    self._stored_chars += len(chunk)
+                ids.append(blob_id)
+        return {BLOB_KEY: ids}
+
+    def _cache_chunk(self, blob_id: str, chunk: str) -> None:
+        """Add a saved chunk to the LRU cache (caller holds the lock)."""
+        if blob_id in self._cache:
+            self._cache.move_to_end(blob_id)
+            return
+        self._cache[blob_id] = chunk
+        self._cached_chars += len(chunk)
+        while self._cached_chars > self.max_cached_chars and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_chars -= len(evicted)
+
+    def get_text(self, value: str | dict) -> str:
+        """Resolve a reference produced by `put_text`; plain strings pass through."""
+        if not (isinstance(value, dict) and BLOB_KEY in value):
+            return value
+        return "".join(self._get_chunk(blob_id) for blob_id in value[BLOB_KEY])
+
+    def _get_chunk(self, blob_id: str) -> str:
+        with self._lock:
+            chunk = self._unsaved.get(blob_id)
+            if chunk is None:
+                chunk = self._cache.get(blob_id)
+                if chunk is not None:
+                    self._cache.move_to_end(blob_id)
+        if chunk is not None:
+            return chunk
+        if self.blob_dir is None:
+            raise KeyError(f"Unknown prompt blob: {blob_id}")
+
+        chunk = self._blob_path(blob_id).read_text()
+        with self._lock:
+            self._cache_chunk(blob_id, chunk)
+        return chunk
+
+    def save(self) -> int:
+        """
+        Write chunks that are not on disk yet. Returns the number written.
+
+        A chunk leaves the unsaved set only once its file is in place, so
+        after a failed write the remaining chunks are retried next time.
+        """
+        if self.blob_dir is None:
+            return 0
+
+        with self._lock:
+            pending = list(self._unsaved.items())
+
+        for blob_id, chunk in pending:
+            path = self._blob_path(blob_id)
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_text(chunk)
+                os.replace(tmp_path, path)
+            with self._lock:
+                self._unsaved.pop(blob_id, None)
+                self._cache_chunk(blob_id, chunk)
+        return len(pending)
+
+    def dehydrate_call(self, llm_call: dict) -> dict:
+        """Replace long prompt fields of an LLM call with references (in place)."""
+        for key in DEDUPED_FIELDS:
+            value = llm_call.get(key)
+            if isinstance(value, str):
+                llm_call[key] = self.put_text(value)
+        return llm_call
+
+    def dehydrate(self, trajectory: dict) -> dict:
+        """Get a copy of a trajectory with prompt text stored by reference."""
+        return _map_llm_calls(trajectory, lambda call: self.dehydrate_call(dict(call)))
+
+    def rehydrate(self, trajectory: dict) -> dict:
+        """Get a copy of a trajectory with all references resolved to text."""
+
+        def resolve(call: dict) -> dict:
+            resolved = dict(call)
+            for key in DEDUPED_FIELDS:
+                if key in resolved:
+                    resolved[key] = self.get_text(resolved[key])
+            return resolved
+
+        return _map_llm_calls(trajectory, resolve)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stored = self._stored_chars
+            return {
+                "unsaved_blobs": len(self._unsaved),
+                "cached_blobs": len(self._cache),
+                "cached_chars": self._cached_chars,
+                "stored_chars": stored,
+                "referenced_chars": self._referenced_chars,
+                "dedup_ratio": self._referenced_chars / stored if stored else 1.0,
+            }
+
+
+def _map_llm_calls(trajectory: dict, fn) -> dict:
+    """Copy a trajectory, applying `fn` to every LLM call of every step."""
+    steps = []
+    for step in trajectory.get("steps", []):
+        calls = step.get("llmCalls")
+        steps.append({**step, "llmCalls": [fn(c) for c in calls]} if calls else step)
+    return {**trajectory, "steps": steps}
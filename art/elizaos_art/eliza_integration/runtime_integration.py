@@ -19,7 +19,7 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Generic, TypeVar
 
 from elizaos import (
     Action,
@@ -46,6 +46,8 @@ from elizaos_art.base import (
     Trajectory,
     TrainingConfig,
 )
+from elizaos_art.eliza_integration.runtime_pool import AgentRuntimePool
+from elizaos_art.eliza_integration.storage_adapter import SpillingTrajectoryBuffer
 from elizaos_art.eliza_integration.trajectory_plugin_integration import (
     TrajectoryBackend,
     create_trajectory_backend,
@@ -92,18 +94,105 @@ class ARTRuntimeConfig:
     enable_trajectory_logging: bool = True
     auto_persist_trajectories: bool = True
 
+    # Rollouts in flight at once in rollout_batch / evaluate; more than one
+    # needs an env_factory on the ARTRuntime
+    max_concurrent_rollouts: int = 1
+
+    # AgentRuntime pool: 0 shares one runtime between all rollouts; N > 0
+    # pre-initializes N runtimes and gives each in-flight rollout its own
+    runtime_pool_size: int = 0
+    runtime_pool_parallel_init: bool = True
+    runtime_max_rollouts: int | None = None  # Recycle a pooled runtime after N rollouts
+
+    # Collected trajectories kept in memory; older ones spill to trajectory_dir
+    max_collected_in_memory: int = 1000
+
+
+@dataclass
+class RolloutContext:
+    """
+    State of one in-flight rollout, shared with the game provider and action.
+
+    Each rollout runs in its own room; the provider and action look up
+    the context by the message's room_id, so concurrent rollouts on one
+    AgentRuntime never see each other's state.
+    """
+
+    env: BaseEnvironment
+    room_id: str
+    state: GameState | None = None
+    trajectory_id: str | None = None
+    step_id: str | None = None
+    action_result: dict = field(default_factory=dict)
+
+
+class _HolderContext:
+    """RolloutContext view over the single-rollout holder dicts."""
+
+    def __init__(self, env: BaseEnvironment, current_state_holder: dict, action_result_holder: dict):
+        self.env = env
+        self._holder = current_state_holder
+        self.action_result = action_result_holder
+
+    @property
+    def state(self) -> GameState | None:
+        return self._holder.get("state")
+
+    @state.setter
+    def state(self, value: GameState | None) -> None:
+        self._holder["state"] = value
+
+    @property
+    def trajectory_id(self) -> str | None:
+        return self._holder.get("_trajectory_id")
+
+    @property
+    def step_id(self) -> str | None:
+        return self._holder.get("_step_id")
+
+
+def _context_resolver(
+    env: BaseEnvironment,
+    current_state_holder: dict | None,
+    action_result_holder: dict | None,
+    contexts: dict[str, RolloutContext] | None,
+) -> Callable[[Memory | None], RolloutContext | _HolderContext]:
+    """Map a message to its rollout context, falling back to the holder dicts."""
+    fallback = _HolderContext(
+        env,
+        current_state_holder if current_state_holder is not None else {},
+        action_result_holder if action_result_holder is not None else {},
+    )
+
+    def resolve(message: Memory | None) -> RolloutContext | _HolderContext:
+        if contexts and message is not None:
+            context = contexts.get(str(message.room_id))
+            if context is not None:
+                return context
+        return fallback
+
+    return resolve
+
 
 def create_game_state_provider(
     env: BaseEnvironment,
-    current_state_holder: dict,
+    current_state_holder: dict | None = None,
     trajectory_backend: TrajectoryBackend | None = None,
+    contexts: dict[str, RolloutContext] | None = None,
 ) -> Provider:
     """
     Create a Provider that supplies game state context to the agent.
 
     This is registered with the ElizaOS runtime and called during compose_state().
     Automatically logs provider access to the trajectory logger.
+
+    Args:
+        env: Environment used when no rollout context matches the message
+        current_state_holder: Single-rollout state dict (legacy)
+        trajectory_backend: Optional trajectory backend
+        contexts: Rollout contexts keyed by room_id (see ARTRuntime)
     """
+    resolve = _context_resolver(env, current_state_holder, None, contexts)
 
     async def get_game_state(
         runtime: IAgentRuntime,
@@ -111,8 +200,10 @@ def create_game_state_provider(
         state: State,
     ) -> ProviderResult:
         """Get current game state for context."""
-        game_state = current_state_holder.get("state")
-        trajectory_id = current_state_holder.get("_trajectory_id")
+        context = resolve(message)
+        game_env = context.env
+        game_state = context.state
+        trajectory_id = context.trajectory_id
 
         if game_state is None:
             return ProviderResult(
@@ -122,7 +213,7 @@ def create_game_state_provider(
             )
 
         # Get available actions
-        available_actions = env.get_available_actions(game_state)
+        available_actions = game_env.get_available_actions(game_state)
         action_names = [str(a) for a in available_actions]
 
         # Format state for LLM
@@ -140,7 +231,7 @@ Analyze the current state and decide on the best action to take."""
         result_data = {
             "game_state": game_state.to_dict() if hasattr(game_state, "to_dict") else {},
             "available_actions": action_names,
-            "env_name": env.name,
+            "env_name": game_env.name,
         }
 
         # Log provider access to trajectory
@@ -178,20 +269,32 @@ Analyze the current state and decide on the best action to take."""
 def create_game_action(
     env: BaseEnvironment,
     agent: BaseAgent,
-    current_state_holder: dict,
-    action_result_holder: dict,
+    current_state_holder: dict | None = None,
+    action_result_holder: dict | None = None,
     trajectory_backend: TrajectoryBackend | None = None,
+    contexts: dict[str, RolloutContext] | None = None,
 ) -> Action:
     """
     Create an Action that executes game moves.
 
     This is the canonical way to handle actions in ElizaOS.
     Automatically logs action execution to the trajectory logger.
+
+    Args:
+        env: Environment used when no rollout context matches the message
+        agent: Agent that parses the chosen action
+        current_state_holder: Single-rollout state dict (legacy)
+        action_result_holder: Single-rollout action result dict (legacy)
+        trajectory_backend: Optional trajectory backend
+        contexts: Rollout contexts keyed by room_id (see ARTRuntime)
     """
+    resolve = _context_resolver(env, current_state_holder, action_result_holder, contexts)
 
     async def validate_action(runtime: IAgentRuntime) -> bool:
         """Validate that we can execute a game action."""
-        return current_state_holder.get("state") is not None
+        if resolve(None).state is not None:
+            return True
+        return any(c.state is not None for c in (contexts or {}).values())
 
     async def handle_action(
         runtime: IAgentRuntime,
@@ -206,9 +309,11 @@ def create_game_action(
 
         This is called when the agent decides to take an action in the game.
         """
-        game_state = current_state_holder.get("state")
-        trajectory_id = current_state_holder.get("_trajectory_id")
-        step_id = current_state_holder.get("_step_id")
+        context = resolve(message)
+        game_env = context.env
+        game_state = context.state
+        trajectory_id = context.trajectory_id
+        step_id = context.step_id
 
         if game_state is None:
             return ActionResult(
@@ -217,7 +322,7 @@ def create_game_action(
             )
 
         # Get available actions
-        available_actions = env.get_available_actions(game_state)
+        available_actions = game_env.get_available_actions(game_state)
         if not available_actions:
             return ActionResult(
                 success=False,
@@ -240,15 +345,15 @@ def create_game_action(
             chosen_action = available_actions[0]
 
         # Execute the action in the environment
-        new_state, reward, done = await env.step(chosen_action)
+        new_state, reward, done = await game_env.step(chosen_action)
 
-        # Update state holder
-        current_state_holder["state"] = new_state
+        # Update rollout state
+        context.state = new_state
 
         # Store result for trajectory
-        action_result_holder["last_action"] = chosen_action
-        action_result_holder["last_reward"] = reward
-        action_result_holder["done"] = done
+        context.action_result["last_action"] = chosen_action
+        context.action_result["last_reward"] = reward
+        context.action_result["done"] = done
 
         # Format result message
         result_text = f"Executed action: {chosen_action}"
@@ -323,15 +428,19 @@ def create_game_action(
 def create_art_plugin(
     env: BaseEnvironment,
     agent: BaseAgent,
-    current_state_holder: dict,
-    action_result_holder: dict,
+    current_state_holder: dict | None = None,
+    action_result_holder: dict | None = None,
     trajectory_backend: TrajectoryBackend | None = None,
+    contexts: dict[str, RolloutContext] | None = None,
 ) -> Plugin:
     """
     Create a Plugin that provides game-specific actions and providers.
 
     This plugin is registered with the ElizaOS runtime alongside the bootstrap plugin.
     Includes trajectory logging for all interactions.
+
+    Pass `contexts` (room_id -> RolloutContext) to serve several
+    concurrent rollouts; the holder dicts serve a single rollout.
     """
 
     async def init_plugin(
@@ -350,10 +459,12 @@ def create_art_plugin(
         init=init_plugin,
         config={},
         providers=[
-            create_game_state_provider(env, current_state_holder, trajectory_backend),
+            create_game_state_provider(env, current_state_holder, trajectory_backend, contexts),
         ],
         actions=[
-            create_game_action(env, agent, current_state_holder, action_result_holder, trajectory_backend),
+            create_game_action(
+                env, agent, current_state_holder, action_result_holder, trajectory_backend, contexts
+            ),
         ],
     )
 
@@ -370,6 +481,12 @@ class ARTRuntime(Generic[S, A]):
     - End-to-end trajectory logging for RL training
 
     NO SHORTCUTS - this is canonical ElizaOS agent usage with full telemetry.
+
+    Rollouts may run concurrently on one runtime: each gets its own room,
+    RolloutContext and environment instance. Environments keep game state
+    on the instance, so every rollout beyond the first in flight needs an
+    environment built by `env_factory`; without one, rollouts run one at
+    a time and asking for more concurrency raises ValueError.
     """
 
     def __init__(
@@ -377,17 +494,23 @@ class ARTRuntime(Generic[S, A]):
         env: BaseEnvironment[S, A],
         agent: BaseAgent[S, A],
         config: ARTRuntimeConfig | None = None,
+        env_factory: Callable[[], BaseEnvironment[S, A]] | None = None,
     ):
         self.env = env
         self.agent = agent
         self.config = config or ARTRuntimeConfig()
+        self._env_factory = env_factory
 
-        # State holders for the game (shared with providers/actions)
-        self._current_state_holder: dict = {}
-        self._action_result_holder: dict = {}
+        # In-flight rollouts by room_id (shared with providers/actions)
+        self._contexts: dict[str, RolloutContext] = {}
 
-        # ElizaOS runtime
+        # Idle environment instances for rollouts
+        self._idle_envs: list[BaseEnvironment[S, A]] = [env]
+        self._all_envs: list[BaseEnvironment[S, A]] = [env]
+
+        # ElizaOS runtime (or a pool of them, see runtime_pool_size)
         self._runtime: AgentRuntime | None = None
+        self._pool: AgentRuntimePool | None = None
         self._initialized = False
 
         # Room/entity IDs for message handling
@@ -400,8 +523,14 @@ class ARTRuntime(Generic[S, A]):
         if self.config.enable_trajectory_logging:
             self._trajectory_backend = create_trajectory_backend(output_dir=self.config.trajectory_dir)
 
-        # Collected trajectories for batch export
-        self._collected_trajectories: list[dict] = []
+        # Collected trajectories for batch export (bounded in memory, the
+        # rest spilled next to the backend's trajectory files; the spill
+        # file is removed on clear/close)
+        spill_name = f"collected-{uuid.uuid4().hex[:12]}.spill.jsonl"
+        self._collected_trajectories = SpillingTrajectoryBuffer(
+            Path(self.config.trajectory_dir) / spill_name,
+            max_in_memory=self.config.max_collected_in_memory,
+        )
 
     @property
     def trajectory_backend(self) -> TrajectoryBackend | None:
@@ -430,13 +559,27 @@ class ARTRuntime(Generic[S, A]):
         )
 
     async def initialize(self) -> None:
-        """Initialize the full ElizaOS runtime."""
+        """Initialize the full ElizaOS runtime (or the runtime pool)."""
         if self._initialized:
             return
 
         # Initialize environment
         await self.env.initialize()
 
+        if self.config.runtime_pool_size > 0:
+            self._pool = AgentRuntimePool(
+                self._create_agent_runtime,
+                size=self.config.runtime_pool_size,
+                max_uses=self.config.runtime_max_rollouts,
+            )
+            await self._pool.start(parallel=self.config.runtime_pool_parallel_init)
+        else:
+            self._runtime = await self._create_agent_runtime()
+
+        self._initialized = True
+
+    async def _create_agent_runtime(self) -> AgentRuntime:
+        """Create and initialize one AgentRuntime with the game plugin."""
         # Create character
         character = self._create_character()
 
@@ -444,9 +587,8 @@ class ARTRuntime(Generic[S, A]):
         game_plugin = create_art_plugin(
             env=self.env,
             agent=self.agent,
-            current_state_holder=self._current_state_holder,
-            action_result_holder=self._action_result_holder,
             trajectory_backend=self._trajectory_backend,
+            contexts=self._contexts,
         )
 
         # Get model provider plugin
@@ -461,7 +603,7 @@ class ARTRuntime(Generic[S, A]):
             pass
 
         # Create the REAL AgentRuntime
-        self._runtime = AgentRuntime(
+        runtime = AgentRuntime(
             character=character,
             plugins=plugins,
             log_level=self.config.log_level,
@@ -473,14 +615,33 @@ class ARTRuntime(Generic[S, A]):
         )
 
         # Initialize runtime (this registers bootstrap plugin with basicCapabilities)
-        await self._runtime.initialize()
+        await runtime.initialize()
+        return runtime
+
+    async def _acquire_env(self) -> BaseEnvironment[S, A]:
+        """Take an idle environment instance, creating one if all are busy."""
+        if self._idle_envs:
+            return self._idle_envs.pop()
+        if self._env_factory is None:
+            raise RuntimeError(
+                "The environment is in use by another rollout; "
+                "pass env_factory to run rollouts concurrently"
+            )
 
-        self._initialized = True
+        env = self._env_factory()
+        await env.initialize()
+        self._all_envs.append(env)
+        return env
+
+    def _release_env(self, env: BaseEnvironment[S, A]) -> None:
+        self._idle_envs.append(env)
 
     async def _send_message_to_agent(
         self,
         text: str,
         collect_response: bool = True,
+        context: RolloutContext | None = None,
+        runtime: AgentRuntime | None = None,
     ) -> tuple[str, list[ActionResult]]:
         """
         Send a message to the agent and get response.
@@ -493,8 +654,12 @@ class ARTRuntime(Generic[S, A]):
         5. Response is generated
 
         NO BYPASSES. All interactions are logged to trajectory.
+
+        The message is sent to the rollout's own room, which is how the
+        game provider and action find the rollout's context.
         """
-        if self._runtime is None:
+        runtime = runtime or self._runtime
+        if runtime is None:
             raise RuntimeError("Runtime not initialized")
 
         # Create message
@@ -502,7 +667,7 @@ class ARTRuntime(Generic[S, A]):
         message = Memory(
             id=message_id,
             entity_id=self._user_id,
-            room_id=self._room_id,
+            room_id=context.room_id if context else self._room_id,
             content=Content(text=text),
             created_at=int(time.time() * 1000),
         )
@@ -520,8 +685,8 @@ class ARTRuntime(Generic[S, A]):
             return []
 
         # Process message through the FULL pipeline
-        result = await self._runtime.message_service.handle_message(
-            self._runtime,
+        result = await runtime.message_service.handle_message(
+            runtime,
             message,
             callback=response_callback if collect_response else None,
         )
@@ -530,7 +695,7 @@ class ARTRuntime(Generic[S, A]):
         latency_ms = int((time.time() - start_time) * 1000)
 
         # Log LLM call to trajectory
-        trajectory_id = self._current_state_holder.get("_trajectory_id")
+        trajectory_id = context.trajectory_id if context else None
         if self._trajectory_backend and trajectory_id:
             self._trajectory_backend.log_llm_call_by_trajectory_id(
                 trajectory_id,
@@ -548,7 +713,7 @@ class ARTRuntime(Generic[S, A]):
             )
 
         # Get action results
-        action_results = self._runtime.get_action_results(message_id)
+        action_results = runtime.get_action_results(message_id)
 
         return response_text, action_results
 
@@ -567,14 +732,48 @@ class ARTRuntime(Generic[S, A]):
         if not self._initialized:
             await self.initialize()
 
+        if self._pool is None:
+            return await self._rollout_with(None, scenario_id, seed, max_steps)
+
+        # Hold a pooled runtime for the whole episode
+        async with self._pool.lease() as runtime:
+            return await self._rollout_with(runtime, scenario_id, seed, max_steps)
+
+    async def _rollout_with(
+        self,
+        runtime: AgentRuntime | None,
+        scenario_id: str,
+        seed: int | None,
+        max_steps: int,
+    ) -> Trajectory:
+        """Set up a rollout context and environment, then play the episode."""
+        env = await self._acquire_env()
+        room_id = string_to_uuid(f"art-game-{self.env.name}-{uuid.uuid4()}")
+        context = RolloutContext(env=env, room_id=str(room_id))
+        self._contexts[context.room_id] = context
+        try:
+            return await self._run_rollout(context, scenario_id, seed, max_steps, runtime)
+        finally:
+            del self._contexts[context.room_id]
+            self._release_env(env)
+
+    async def _run_rollout(
+        self,
+        context: RolloutContext,
+        scenario_id: str,
+        seed: int | None,
+        max_steps: int,
+        runtime: AgentRuntime | None = None,
+    ) -> Trajectory:
+        """Play one episode in `context` (see rollout)."""
+        env = context.env
         messages: list[dict] = []
         total_reward = 0.0
         step_count = 0
 
         # Reset environment
-        state = await self.env.reset(seed)
-        self._current_state_holder["state"] = state
-        self._action_result_holder.clear()
+        state = await env.reset(seed)
+        context.state = state
 
         # Add system prompt
         system_prompt = self.agent.get_system_prompt()
@@ -595,12 +794,12 @@ class ARTRuntime(Generic[S, A]):
                     "max_steps": max_steps,
                 },
             )
-            self._current_state_holder["_trajectory_id"] = trajectory_id
+            context.trajectory_id = trajectory_id
 
         done = False
         while not done and step_count < max_steps:
             # Check available actions
-            available_actions = self.env.get_available_actions(state)
+            available_actions = env.get_available_actions(state)
             if not available_actions:
                 break
 
@@ -617,36 +816,38 @@ class ARTRuntime(Generic[S, A]):
                     },
                 }
                 step_id = self._trajectory_backend.start_step(trajectory_id, env_state)
-                self._current_state_holder["_step_id"] = step_id
+                context.step_id = step_id
 
             # Format user message (the "environment" speaking to the agent)
             user_prompt = self.agent.format_action_prompt(state, available_actions)
             messages.append({"role": "user", "content": user_prompt})
 
             # Send message through FULL ElizaOS pipeline
-            response_text, action_results = await self._send_message_to_agent(user_prompt)
+            response_text, action_results = await self._send_message_to_agent(
+                user_prompt, context=context, runtime=runtime
+            )
 
             messages.append({"role": "assistant", "content": response_text})
 
             # Get action result from the handler
-            if self._action_result_holder.get("last_action") is not None:
-                reward = self._action_result_holder.get("last_reward", 0.0)
-                done = self._action_result_holder.get("done", False)
+            if context.action_result.get("last_action") is not None:
+                reward = context.action_result.get("last_reward", 0.0)
+                done = context.action_result.get("done", False)
                 total_reward += reward
                 step_count += 1
 
                 # Update state
-                state = self._current_state_holder.get("state")
+                state = context.state
                 if state is None:
                     break
 
                 # Clear for next step
-                self._action_result_holder.clear()
+                context.action_result.clear()
             else:
                 # Agent didn't take action - force one and log it
                 action = available_actions[0]
-                state, reward, done = await self.env.step(action)
-                self._current_state_holder["state"] = state
+                state, reward, done = await env.step(action)
+                context.state = state
                 total_reward += reward
                 step_count += 1
 
@@ -683,10 +884,6 @@ class ARTRuntime(Generic[S, A]):
             if trajectory_data:
                 self._collected_trajectories.append(trajectory_data)
 
-        # Clear trajectory context
-        self._current_state_holder.pop("_trajectory_id", None)
-        self._current_state_holder.pop("_step_id", None)
-
         return Trajectory(
             trajectory_id=trajectory_id or f"{scenario_id}-{int(time.time() * 1000)}",
             scenario_id=scenario_id,
@@ -705,46 +902,66 @@ class ARTRuntime(Generic[S, A]):
             },
         )
 
+    async def _gather_rollouts(
+        self,
+        jobs: list[tuple[str, int | None]],
+        concurrency: int | None,
+    ) -> list[Trajectory]:
+        """Run (scenario_id, seed) rollouts with bounded concurrency, in order."""
+        if not self._initialized:
+            await self.initialize()
+
+        limit = max(1, concurrency or self.config.max_concurrent_rollouts)
+        if limit > 1 and self._env_factory is None:
+            raise ValueError(
+                f"Running {limit} rollouts at once needs an env_factory to build "
+                "an environment per rollout"
+            )
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(scenario_id: str, seed: int | None) -> Trajectory:
+            async with semaphore:
+                return await self.rollout(scenario_id=scenario_id, seed=seed)
+
+        return list(await asyncio.gather(*(run(s, seed) for s, seed in jobs)))
+
     async def rollout_batch(
         self,
         scenario_id: str,
         num_rollouts: int,
         seeds: list[int] | None = None,
         batch_id: str | None = None,
+        concurrency: int | None = None,
     ) -> list[Trajectory]:
-        """Execute multiple rollouts for GRPO training with trajectory logging."""
+        """
+        Execute multiple rollouts for GRPO training with trajectory logging.
+
+        Up to `concurrency` rollouts (default `config.max_concurrent_rollouts`)
+        run at once; more than one requires an `env_factory`. Results are in
+        seed order.
+        """
         if seeds is None:
             seeds = list(range(num_rollouts))
 
         batch_id = batch_id or f"batch-{int(time.time() * 1000)}"
-        trajectories = []
-
-        for i, seed in enumerate(seeds[:num_rollouts]):
-            traj = await self.rollout(
-                scenario_id=f"{scenario_id}-{batch_id}-{i}",
-                seed=seed,
-            )
-            trajectories.append(traj)
-
-        return trajectories
+        jobs = [
+            (f"{scenario_id}-{batch_id}-{i}", seed)
+            for i, seed in enumerate(seeds[:num_rollouts])
+        ]
+        return await self._gather_rollouts(jobs, concurrency)
 
     async def evaluate(
         self,
         num_episodes: int = 100,
         seed_offset: int = 0,
+        concurrency: int | None = None,
     ) -> dict:
         """Evaluate current model performance with trajectory logging."""
-        rewards: list[float] = []
-        wins = 0
+        jobs = [(f"eval-{i}", seed_offset + i) for i in range(num_episodes)]
+        trajectories = await self._gather_rollouts(jobs, concurrency)
 
-        for i in range(num_episodes):
-            traj = await self.rollout(
-                scenario_id=f"eval-{i}",
-                seed=seed_offset + i,
-            )
-            rewards.append(traj.reward)
-            if traj.reward > 0:
-                wins += 1
+        rewards = [traj.reward for traj in trajectories]
+        wins = sum(1 for reward in rewards if reward > 0)
 
         return {
             "episodes": num_episodes,
@@ -754,14 +971,54 @@ class ARTRuntime(Generic[S, A]):
             "win_rate": wins / num_episodes if num_episodes > 0 else 0,
         }
 
-    def get_collected_trajectories(self) -> list[dict]:
-        """Get all collected trajectory data for export."""
-        return self._collected_trajectories
+    async def get_collected_trajectories(self) -> list[dict]:
+        """
+        Get all collected trajectory data for export.
+
+        This loads spilled trajectories back into memory; prefer
+        `iter_collected_trajectories` for large collections.
+        """
+        return [traj async for traj in self._collected_trajectories]
+
+    def iter_collected_trajectories(self) -> AsyncIterator[dict]:
+        """Stream collected trajectories (spilled first, then in-memory)."""
+        return aiter(self._collected_trajectories)
+
+    def get_collection_stats(self) -> dict:
+        """Get in-memory / spilled counts of collected trajectories."""
+        return self._collected_trajectories.get_stats()
 
     def clear_collected_trajectories(self) -> None:
         """Clear collected trajectories after export."""
         self._collected_trajectories.clear()
 
+    async def export_collected_trajectories(
+        self,
+        output_path: str | Path,
+        export_format: str = "art",
+    ) -> str:
+        """
+        Export collected trajectories, streaming from both retention tiers.
+
+        - export_format="art"   -> OpenPipe ART JSONL
+        - export_format="jsonl" -> raw ElizaOS trajectory JSONL
+
+        Returns:
+            Path to the output file
+        """
+        from elizaos_art.eliza_integration.export import (
+            export_trajectories_art_format,
+            export_trajectories_jsonl,
+        )
+
+        if export_format == "jsonl":
+            return await export_trajectories_jsonl(self.iter_collected_trajectories(), output_path)
+        if export_format == "art":
+            return await export_trajectories_art_format(
+                self.iter_collected_trajectories(), output_path
+            )
+        raise ValueError(f"Unsupported export format: {export_format}")
+
     def export_training_dataset(
         self,
         *,
@@ -790,13 +1047,18 @@ class ARTRuntime(Generic[S, A]):
         """Clean up resources."""
         if self._runtime:
             await self._runtime.stop()
-        await self.env.close()
+        if self._pool:
+            await self._pool.close()
+        for env in self._all_envs:
+            await env.close()
+        await self._collected_trajectories.close()
 
 
 def create_art_runtime(
     env: BaseEnvironment,
     agent: BaseAgent,
     config: ARTRuntimeConfig | None = None,
+    env_factory: Callable[[], BaseEnvironment] | None = None,
 ) -> ARTRuntime:
     """
     Create an ART runtime with FULL ElizaOS integration and trajectory logging.
@@ -809,6 +1071,9 @@ def create_art_runtime(
     - basicCapabilities enabled by default
     - End-to-end trajectory logging for RL training
 
+    Rollouts run one at a time unless `env_factory` builds a fresh
+    environment for each concurrent rollout (see `ARTRuntime`).
+
     Example:
         ```python
         from elizaos_art.games.game_2048 import Game2048Environment, Game2048Agent
@@ -836,9 +1101,7 @@ def create_art_runtime(
         )
 
         # Export collected trajectories for training
-        collected = runtime.get_collected_trajectories()
-        from elizaos_art.eliza_integration.export import export_trajectories_art_format
-        await export_trajectories_art_format(collected, "training_data.jsonl")
+        await runtime.export_collected_trajectories("training_data.jsonl")
         ```
     """
-    return ARTRuntime(env=env, agent=agent, config=config)
+    return ARTRuntime(env=env, agent=agent, config=config, env_factory=env_factory)
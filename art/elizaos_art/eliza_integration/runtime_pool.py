@@ -0,0 +1,230 @@
+"""
+Pool of pre-initialized AgentRuntimes for ART rollouts.
+
+Creating an AgentRuntime loads the character and every plugin, which
+dwarfs the cost of a single game turn. `AgentRuntimePool` pays that
+cost up front for a fixed number of runtimes and hands them out to
+rollouts:
+
+```python
+pool = AgentRuntimePool(create_runtime, size=4)
+await pool.start()
+
+async with pool.lease() as runtime:
+    await runtime.message_service.handle_message(runtime, message)
+```
+
+Runtimes returned as unhealthy (or after `max_uses` rollouts) are
+stopped and replaced, so one wedged runtime never poisons the pool. If
+a replacement cannot be created, its slot stays in the pool empty and
+the next checkout that reaches it tries again.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Queue markers: a slot whose runtime must be (re)created, and a closed pool
+_EMPTY_SLOT = object()
+_CLOSED = object()
+
+
+class AgentRuntimePool:
+    """
+    Fixed-size pool of initialized runtimes with async checkout/checkin.
+
+    Args:
+        factory: Coroutine function that creates and initializes one runtime
+        size: Number of runtimes kept in the pool
+        max_uses: Recycle a runtime after this many checkouts (None = never)
+        health_check: Optional coroutine run at checkin; False recycles
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        size: int = 4,
+        max_uses: int | None = None,
+        health_check: Callable[[Any], Awaitable[bool]] | None = None,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.health_check = health_check
+
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._uses: dict[int, int] = {}
+        self._runtimes: list[Any] = []
+        self._checked_out = 0
+        self._started = False
+        self._closed = False
+
+        self._stats = {
+            "created": 0,
+            "create_failures": 0,
+            "recycled": 0,
+            "checkouts": 0,
+            "wait_s": 0.0,
+            "init_s": 0.0,
+        }
+
+    async def _create(self) -> Any:
+        start = time.perf_counter()
+        runtime = await self.factory()
+        self._stats["init_s"] += time.perf_counter() - start
+        self._stats["created"] += 1
+        self._uses[id(runtime)] = 0
+        self._runtimes.append(runtime)
+        return runtime
+
+    async def start(self, parallel: bool = True) -> None:
+        """
+        Create and initialize all runtimes.
+
+        Args:
+            parallel: Initialize the runtimes concurrently instead of one by one
+        """
+        if self._started:
+            return
+
+        if parallel:
+            results = await asyncio.gather(
+                *(self._create() for _ in range(self.size)), return_exceptions=True
+            )
+        else:
+            results = []
+            for _ in range(self.size):
+                try:
+                    results.append(await self._create())
+                except Exception as e:
+                    results.append(e)
+                    break
+
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            # Don't leak the runtimes that did start
+            for runtime in list(self._runtimes):
+                await self._discard(runtime)
+            raise errors[0]
+
+        for runtime in results:
+            self._idle.put_nowait(runtime)
+        self._started = True
+
+    async def checkout(self) -> Any:
+        """
+        Wait for an idle runtime and take it out of the pool.
+
+        Raises:
+            RuntimeError: If the pool is (or gets) closed while waiting
+            Exception: The factory's error, if this checkout had to
+                recreate a lost runtime and failed
+        """
+        if self._closed:
+            raise RuntimeError("Runtime pool is closed")
+        if not self._started:
+            await self.start()
+
+        start = time.perf_counter()
+        runtime = await self._idle.get()
+        if runtime is _CLOSED:
+            # Pass the marker on so every other waiter wakes up too
+            self._idle.put_nowait(_CLOSED)
+            raise RuntimeError("Runtime pool is closed")
+        if runtime is _EMPTY_SLOT:
+            try:
+                runtime = await self._create()
+            except Exception:
+                self._stats["create_failures"] += 1
+                self._idle.put_nowait(_EMPTY_SLOT)
+                raise
+        self._stats["wait_s"] += time.perf_counter() - start
+        self._stats["checkouts"] += 1
+        self._uses[id(runtime)] += 1
+        self._checked_out += 1
+        return runtime
+
+    async def checkin(self, runtime: Any, healthy: bool = True) -> None:
+        """
+        Return a runtime to the pool, replacing it if it should be recycled.
+
+        Args:
+            runtime: Runtime obtained from `checkout`
+            healthy: False if the caller saw the runtime fail
+        """
+        if healthy and self.health_check is not None:
+            try:
+                healthy = await self.health_check(runtime)
+            except Exception:
+                healthy = False
+
+        self._checked_out -= 1
+        worn_out = self.max_uses is not None and self._uses[id(runtime)] >= self.max_uses
+        if self._closed or not healthy or worn_out:
+            await self._discard(runtime)
+            if self._closed:
+                return
+            self._stats["recycled"] += 1
+            try:
+                runtime = await self._create()
+            except Exception:
+                # Keep the slot; the next checkout that reaches it retries
+                logger.exception("Failed to replace a recycled runtime")
+                self._stats["create_failures"] += 1
+                runtime = _EMPTY_SLOT
+
+        self._idle.put_nowait(runtime)
+
+    async def _discard(self, runtime: Any) -> None:
+        self._uses.pop(id(runtime), None)
+        self._runtimes.remove(runtime)
+        try:
+            await runtime.stop()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Any]:
+        """Check out a runtime for the duration of a block.
+
+        An exception escaping the block marks the runtime unhealthy.
+        """
+        runtime = await self.checkout()
+        healthy = True
+        try:
+            yield runtime
+        except BaseException:
+            healthy = False
+            raise
+        finally:
+            await self.checkin(runtime, healthy=healthy)
+
+    async def close(self) -> None:
+        """
+        Stop all runtimes; runtimes still checked out are stopped at checkin.
+
+        Callers waiting in `checkout` get a RuntimeError.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        while not self._idle.empty():
+            runtime = self._idle.get_nowait()
+            if runtime is not _EMPTY_SLOT and runtime is not _CLOSED:
+                await self._discard(runtime)
+        self._idle.put_nowait(_CLOSED)
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "size": self.size,
+            "idle": len(self._runtimes) - self._checked_out,
+            "in_use": self._checked_out,
+        }
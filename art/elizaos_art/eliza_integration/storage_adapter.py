@@ -5,13 +5,38 @@ Provides trajectory and checkpoint storage using:
 - Local JSON files (compatible with plugin-localdb format)
 - Vector search for similar trajectories
 - Export to training datasets
+
+All file I/O runs on a dedicated I/O executor so that the async APIs never
+block the event loop. Writes to the same file are applied in submission
+order, and repeated whole-file rewrites that have not started yet are
+coalesced into the latest one. Call `flush()` (or `close()`) to wait for
+everything that has been scheduled.
 """
 
+import asyncio
+import concurrent.futures
+import itertools
 import json
+import logging
+import os
+import threading
 import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable
+from typing import Any, AsyncIterator, Awaitable, Callable, Container, TypeVar
+
+from elizaos_art.eliza_integration.prompt_store import (
+    PromptBlobStore,
+    blob_dir_for,
+    has_blob_refs,
+)
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -28,6 +53,236 @@ class TrajectoryRecord:
     data: dict
 
 
+@dataclass
+class _PendingWrite:
+    """A queued write for a single key."""
+
+    fn: Callable[[], object]
+    future: Future
+    coalesce: bool
+
+
+class StorageIOExecutor:
+    """
+    Dedicated thread pool for storage file I/O.
+
+    Guarantees:
+    - Writes for the same key (usually a file path) run one at a time,
+      in the order they were submitted.
+    - A coalescing write that is still queued is replaced by a newer
+      coalescing write for the same key (e.g. rewriting an index file).
+      Both callers observe the same completion.
+    - Appends (`coalesce=False`) are never dropped or merged.
+    - Reads of a key wait for that key's queued writes first.
+    - `flush()` is a barrier for everything scheduled before it, and
+      raises the first failure of a write nobody awaited.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="eliza-storage-io",
+        )
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[_PendingWrite]] = {}
+        self._running: set[str] = set()
+        self._inflight: dict[str, Future] = {}
+        self._failures: list[tuple[str, Exception]] = []
+        self._closed = False
+
+        # Stats
+        self.writes_submitted = 0
+        self.writes_coalesced = 0
+        self.writes_completed = 0
+
+    def submit_write(
+        self,
+        key: str,
+        fn: Callable[[], object],
+        coalesce: bool = True,
+    ) -> Future:
+        """Schedule a write for `key`. Returns a concurrent future."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("StorageIOExecutor is closed")
+            self.writes_submitted += 1
+            queue = self._queues.setdefault(key, deque())
+
+            if coalesce and queue and queue[-1].coalesce:
+                queue[-1].fn = fn
+                self.writes_coalesced += 1
+                return queue[-1].future
+
+            pending = _PendingWrite(fn=fn, future=Future(), coalesce=coalesce)
+            queue.append(pending)
+            if key not in self._running:
+                self._running.add(key)
+                self._pool.submit(self._drain, key)
+            return pending.future
+
+    def _drain(self, key: str) -> None:
+        """Run queued writes for a key until its queue is empty."""
+        while True:
+            with self._lock:
+                queue = self._queues.get(key)
+                if not queue:
+                    self._queues.pop(key, None)
+                    self._running.discard(key)
+                    return
+                pending = queue.popleft()
+                self._inflight[key] = pending.future
+
+            try:
+                result = pending.fn()
+            except Exception as e:  # propagate to awaiting callers
+                with self._lock:
+                    # Kept until an awaiting caller or `flush()` reports it
+                    self._failures.append((key, e))
+                pending.future.set_exception(e)
+            else:
+                pending.future.set_result(result)
+
+            with self._lock:
+                self._inflight.pop(key, None)
+                self.writes_completed += 1
+
+    def _pending_futures(self, key: str | None = None) -> list[Future]:
+        with self._lock:
+            if key is not None:
+                futures = [p.future for p in self._queues.get(key, ())]
+                if key in self._inflight:
+                    futures.append(self._inflight[key])
+                return futures
+            futures = [p.future for q in self._queues.values() for p in q]
+            futures.extend(self._inflight.values())
+            return futures
+
+    async def write(
+        self,
+        key: str,
+        fn: Callable[[], object],
+        coalesce: bool = True,
+    ) -> object:
+        """Schedule a write and wait for it to complete."""
+        try:
+            return await asyncio.wrap_future(self.submit_write(key, fn, coalesce))
+        except Exception as e:
+            # Reported here, so a later flush() doesn't raise it again
+            with self._lock:
+                self._failures = [f for f in self._failures if f[1] is not e]
+            raise
+
+    def _pop_failure(self, key: str | None) -> Exception | None:
+        with self._lock:
+            for i, (failed_key, error) in enumerate(self._failures):
+                if key is None or failed_key == key:
+                    del self._failures[i]
+                    return error
+        return None
+
+    async def read(self, fn: Callable[[], T], key: str | None = None) -> T:
+        """
+        Run a read off the event loop.
+
+        If `key` is given, queued writes for that key complete first so
+        the read observes them.
+        """
+        if key is not None:
+            await self.flush(key)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, fn)
+
+    async def flush(self, key: str | None = None) -> None:
+        """
+        Wait until all writes scheduled so far (or for `key`) complete.
+
+        Raises:
+            Exception: The first failure of a fire-and-forget write (for
+                `key`, if given), once every write has settled
+        """
+        while True:
+            futures = self._pending_futures(key)
+            if not futures:
+                break
+            await asyncio.gather(
+                *(asyncio.wrap_future(f) for f in futures),
+                return_exceptions=True,
+            )
+
+        error = self._pop_failure(key)
+        if error is not None:
+            raise error
+
+    def wait(self, key: str | None = None) -> None:
+        """Blocking `flush()` for synchronous callers (never on the event loop)."""
+        while True:
+            futures = self._pending_futures(key)
+            if not futures:
+                break
+            concurrent.futures.wait(futures)
+
+        error = self._pop_failure(key)
+        if error is not None:
+            raise error
+
+    async def close(self) -> None:
+        """
+        Flush outstanding writes and stop the worker threads.
+
+        Raises:
+            Exception: As `flush()`; the executor is closed regardless
+        """
+        try:
+            await self.flush()
+        finally:
+            with self._lock:
+                self._closed = True
+            self._pool.shutdown(wait=True)
+
+    def get_stats(self) -> dict:
+        """Get write counters."""
+        with self._lock:
+            return {
+                "writes_submitted": self.writes_submitted,
+                "writes_coalesced": self.writes_coalesced,
+                "writes_completed": self.writes_completed,
+                "pending_keys": len(self._queues),
+            }
+
+
+def _write_json(path: Path, data: object, indent: int | None = 2) -> None:
+    # Write aside and rename, so readers never see a half-written file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=indent)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> dict | None:
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _read_json_if_complete(path: Path) -> dict | None:
+    """Read a JSON file, skipping (with a warning) one that does not parse."""
+    try:
+        return _read_json(path)
+    except json.JSONDecodeError as e:
+        logger.warning("Skipping unreadable trajectory file %s: %s", path, e)
+        return None
+
+
+def _read_json_files(paths: list[Path]) -> list[dict]:
+    results = []
+    for path in paths:
+        data = _read_json(path)
+        if data is not None:
+            results.append(data)
+    return results
+
+
 class SimpleHNSW:
     """
     Simple HNSW-like vector index.
@@ -74,13 +329,16 @@ class SimpleHNSW:
             return 0.0
         return dot_product / (norm_a * norm_b)
 
+    def snapshot(self) -> dict:
+        """Get a serializable snapshot of the index."""
+        return {
+            "dimensions": self.dimensions,
+            "vectors": list(self.vectors),
+        }
+
     def save(self, path: Path) -> None:
         """Save index to file."""
-        with open(path, "w") as f:
-            json.dump({
-                "dimensions": self.dimensions,
-                "vectors": self.vectors,
-            }, f)
+        _write_json(path, self.snapshot(), indent=None)
 
     def load(self, path: Path) -> None:
         """Load index from file."""
@@ -90,6 +348,21 @@ class SimpleHNSW:
         self.vectors = [(v[0], v[1]) for v in data["vectors"]]
 
 
+def trajectory_embedding_text(trajectory: dict, max_chars: int = 2000) -> str:
+    """Text used to embed a trajectory: scenario, then each step's prompt and action."""
+    parts = [str(trajectory.get("scenarioId") or "")]
+    for step in trajectory.get("steps", []):
+        for call in step.get("llmCalls") or []:
+            if isinstance(call.get("userPrompt"), str):
+                parts.append(call["userPrompt"])
+        action = step.get("action") or {}
+        if action.get("actionName"):
+            parts.append(str(action["actionName"]))
+        if sum(len(p) for p in parts) >= max_chars:
+            break
+    return "\n".join(parts)[:max_chars]
+
+
 class TrajectoryStore:
     """
     Trajectory storage with vector search capabilities.
@@ -98,6 +371,18 @@ class TrajectoryStore:
     - JSON file per record
     - HNSW vector index
     - Query by predicates
+
+    With `dedupe_prompts=True`, prompt text is saved once under
+    `trajectories/blobs` (see `PromptBlobStore`). Every read API returns
+    trajectories with the text restored whether or not this store
+    deduplicates, so files written by a deduplicating
+    `ElizaTrajectoryLogger` into the same directory read back as text.
+
+    `iter_scenario_groups` loads one scenario's trajectories at a time,
+    using an in-memory map of trajectory ID -> scenario ID. The map is
+    checked against the directory listing on every call, so trajectories
+    written by other processes are included; only new or changed files
+    are re-read.
     """
 
     COLLECTION = "trajectories"
@@ -106,6 +391,8 @@ class TrajectoryStore:
         self,
         data_dir: str | Path = "./data",
         embedding_dimensions: int = 384,
+        io_executor: StorageIOExecutor | None = None,
+        dedupe_prompts: bool = False,
     ):
         self.data_dir = Path(data_dir)
         self.trajectories_dir = self.data_dir / self.COLLECTION
@@ -114,9 +401,114 @@ class TrajectoryStore:
         self.vectors_dir = self.data_dir / "vectors"
         self.vectors_dir.mkdir(parents=True, exist_ok=True)
 
+        # Shared executors are owned (and closed) by whoever created them
+        self._owns_io = io_executor is None
+        self._io = io_executor or StorageIOExecutor()
+
         self.vector_index = SimpleHNSW(embedding_dimensions)
         self._load_vector_index()
 
+        self._dedupe_prompts = dedupe_prompts
+        self._prompts: PromptBlobStore | None = None
+        self._prompts_lock = threading.Lock()
+        if dedupe_prompts:
+            self._prompts = PromptBlobStore(blob_dir_for(self.trajectories_dir))
+
+        # trajectory ID -> ((mtime_ns, size), scenarioId) of the file as last read
+        self._scenario_of: dict[str, tuple[tuple[int, int], Any]] = {}
+
+    @property
+    def io(self) -> StorageIOExecutor:
+        """Get the I/O executor used by this store."""
+        return self._io
+
+    def _trajectory_path(self, trajectory_id: str) -> Path:
+        return self.trajectories_dir / f"{trajectory_id}.json"
+
+    def _blob_store(self) -> PromptBlobStore:
+        # Created on first use when only reading references
+        with self._prompts_lock:
+            if self._prompts is None:
+                self._prompts = PromptBlobStore(blob_dir_for(self.trajectories_dir))
+            return self._prompts
+
+    def _hydrate(self, trajectory: dict | None) -> dict | None:
+        """Resolve prompt references, if the trajectory has any."""
+        if trajectory is None or not has_blob_refs(trajectory):
+            return trajectory
+        return self._blob_store().rehydrate(trajectory)
+
+    def _read_trajectories(self, paths: list[Path]) -> list[dict]:
+        return [self._hydrate(t) for t in _read_json_files(paths)]
+
+    async def _get_scenario_index(self, batch_size: int = 64) -> dict[Any, list[str]]:
+        """
+        Group trajectory IDs by scenario, re-reading only changed files.
+
+        The directory is listed on every call, so files written by other
+        processes or store instances are picked up and deleted ones are
+        dropped; only files whose mtime or size changed are opened.
+        """
+        await self._io.flush()
+
+        def _scan() -> dict[str, tuple[int, int]]:
+            stamps = {}
+            with os.scandir(self.trajectories_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        stamps[entry.name[: -len(".json")]] = (stat.st_mtime_ns, stat.st_size)
+            return stamps
+
+        stamps = await self._io.read(_scan)
+        for trajectory_id in self._scenario_of.keys() - stamps.keys():
+            del self._scenario_of[trajectory_id]
+
+        changed = [
+            tid for tid, stamp in stamps.items()
+            if self._scenario_of.get(tid, (None,))[0] != stamp
+        ]
+        for start in range(0, len(changed), batch_size):
+            batch = changed[start : start + batch_size]
+            trajectories = await self._io.read(
+                lambda: [_read_json_if_complete(self._trajectory_path(tid)) for tid in batch]
+            )
+            for trajectory_id, trajectory in zip(batch, trajectories):
+                if trajectory is None:
+                    # Deleted since the scan, or half-written: retried next time
+                    self._scenario_of.pop(trajectory_id, None)
+                    continue
+                scenario_id = trajectory.get("scenarioId", "default")
+                self._scenario_of[trajectory_id] = (stamps[trajectory_id], scenario_id)
+
+        index: dict[Any, list[str]] = {}
+        for trajectory_id in stamps:
+            if trajectory_id in self._scenario_of:
+                index.setdefault(self._scenario_of[trajectory_id][1], []).append(trajectory_id)
+        return index
+
+    async def iter_scenario_groups(
+        self, batch_size: int = 64
+    ) -> AsyncIterator[tuple[Any, list[dict]]]:
+        """
+        Iterate over trajectories grouped by scenario, one group at a time.
+
+        Trajectories without a `scenarioId` are grouped under "default".
+        Only the current group is held in memory. The scenario of each
+        file is cached by mtime and size, so repeated calls only open new
+        or changed files.
+
+        Yields:
+            `(scenario_id, trajectories)` pairs
+        """
+        index = await self._get_scenario_index(batch_size)
+        for scenario_id, ids in index.items():
+            group: list[dict] = []
+            for start in range(0, len(ids), batch_size):
+                paths = [self._trajectory_path(tid) for tid in ids[start : start + batch_size]]
+                group.extend(await self._io.read(lambda: self._read_trajectories(paths)))
+            yield scenario_id, group
+
     def _load_vector_index(self) -> None:
         """Load existing vector index."""
         index_path = self.vectors_dir / "hnsw_index.json"
@@ -124,9 +516,13 @@ class TrajectoryStore:
             self.vector_index.load(index_path)
 
     def _save_vector_index(self) -> None:
-        """Save vector index."""
+        """Schedule a (coalesced) rewrite of the vector index."""
         index_path = self.vectors_dir / "hnsw_index.json"
-        self.vector_index.save(index_path)
+        snapshot = self.vector_index.snapshot()
+        self._io.submit_write(
+            str(index_path),
+            lambda: _write_json(index_path, snapshot, indent=None),
+        )
 
     async def save_trajectory(
         self,
@@ -136,12 +532,16 @@ class TrajectoryStore:
         """Save a trajectory and optionally index its embedding."""
         trajectory_id = trajectory["trajectoryId"]
 
+        if self._dedupe_prompts:
+            trajectory = self._prompts.dehydrate(trajectory)
+            # Blobs land before the trajectory that references them
+            await self._io.write(str(self._prompts.blob_dir), self._prompts.save)
+
         # Save JSON file
-        file_path = self.trajectories_dir / f"{trajectory_id}.json"
-        with open(file_path, "w") as f:
-            json.dump(trajectory, f, indent=2)
+        file_path = self._trajectory_path(trajectory_id)
+        await self._io.write(str(file_path), lambda: _write_json(file_path, trajectory))
 
-        # Index embedding if provided
+        # Index embedding if provided; the index file is persisted in the background
         if embedding:
             self.vector_index.add(trajectory_id, embedding)
             self._save_vector_index()
@@ -150,19 +550,92 @@ class TrajectoryStore:
 
     async def get_trajectory(self, trajectory_id: str) -> dict | None:
         """Get a trajectory by ID."""
-        file_path = self.trajectories_dir / f"{trajectory_id}.json"
-        if not file_path.exists():
-            return None
-        with open(file_path) as f:
-            return json.load(f)
+        file_path = self._trajectory_path(trajectory_id)
+        return await self._io.read(
+            lambda: self._hydrate(_read_json(file_path)), key=str(file_path)
+        )
 
     async def get_all_trajectories(self) -> list[dict]:
         """Get all trajectories."""
-        trajectories = []
-        for file_path in self.trajectories_dir.glob("*.json"):
-            with open(file_path) as f:
-                trajectories.append(json.load(f))
-        return trajectories
+        await self._io.flush()
+        return await self._io.read(
+            lambda: self._read_trajectories(list(self.trajectories_dir.glob("*.json")))
+        )
+
+    async def iter_trajectories(self, batch_size: int = 64) -> AsyncIterator[dict]:
+        """
+        Iterate over all trajectories without loading them all at once.
+
+        Files are listed and read lazily in batches on the I/O executor,
+        so memory stays proportional to `batch_size`.
+        """
+        await self._io.flush()
+        paths = self.trajectories_dir.glob("*.json")
+
+        def _next_batch() -> tuple[int, list[dict]]:
+            batch_paths = list(itertools.islice(paths, batch_size))
+            return len(batch_paths), self._read_trajectories(batch_paths)
+
+        while True:
+            num_paths, batch = await self._io.read(_next_batch)
+            if num_paths == 0:
+                return
+            for trajectory in batch:
+                yield trajectory
+
+    async def iter_trajectories_since(
+        self,
+        cursor: tuple[int, Container[str]] | None = None,
+        batch_size: int = 64,
+    ) -> AsyncIterator[tuple[dict, tuple[int, str]]]:
+        """
+        Iterate over trajectories saved after a cursor, oldest first.
+
+        A cursor is `(mtime_ns, ids)`: the save time of the newest
+        trajectory already consumed, and the IDs consumed at exactly that
+        time. Files saved earlier, or at that time with an ID in `ids`,
+        are skipped without being opened. Keying ties on the set of IDs
+        seen (not on ID order) keeps files that share a coarse filesystem
+        mtime with the cursor but were written after it. Files that do
+        not parse (e.g. written by another process without an atomic
+        rename) are skipped; their next write moves them past the cursor
+        again.
+
+        Yields:
+            `(trajectory, (mtime_ns, trajectory_id))` pairs, in that order
+        """
+        await self._io.flush()
+        since, seen = cursor if cursor is not None else (None, ())
+
+        def _scan() -> list[tuple[int, str]]:
+            keys = []
+            with os.scandir(self.trajectories_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    trajectory_id = entry.name[: -len(".json")]
+                    mtime_ns = entry.stat().st_mtime_ns
+                    if (
+                        since is None
+                        or mtime_ns > since
+                        or (mtime_ns == since and trajectory_id not in seen)
+                    ):
+                        keys.append((mtime_ns, trajectory_id))
+            return sorted(keys)
+
+        keys = await self._io.read(_scan)
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start : start + batch_size]
+            trajectories = await self._io.read(
+                lambda: [
+                    self._hydrate(_read_json_if_complete(self._trajectory_path(tid)))
+                    for _, tid in batch
+                ]
+            )
+            for key, trajectory in zip(batch, trajectories):
+                # Deleted since the scan, or unreadable
+                if trajectory is not None:
+                    yield trajectory, key
 
     async def get_trajectories_where(
         self,
@@ -189,20 +662,275 @@ class TrajectoryStore:
 
         return trajectories_with_scores
 
+    async def index_trajectories(
+        self,
+        embed: Callable[[list[str]], Awaitable[list[Any]]],
+        batch_size: int = 64,
+        reindex: bool = False,
+        text_fn: Callable[[dict], str] = trajectory_embedding_text,
+    ) -> dict:
+        """
+        Embed stored trajectories into the vector index as a batch job.
+
+        Trajectories are streamed from disk and embedded `batch_size` at a
+        time with one `embed` call per batch (e.g.
+        `ElizaLocalAIProvider.generate_embeddings`); the index file is
+        written once at the end.
+
+        Args:
+            embed: Async batch embedder returning vectors or EmbeddingResults
+            batch_size: Texts per embed call
+            reindex: Re-embed trajectories that are already indexed
+            text_fn: Text to embed for a trajectory
+
+        Returns:
+            Dict with indexed/skipped counts, batch count and backends used
+        """
+        indexed_ids = {id for id, _ in self.vector_index.vectors}
+        if reindex:
+            self.vector_index.vectors.clear()
+            indexed_ids.clear()
+
+        stats = {"indexed": 0, "skipped": 0, "batches": 0, "backends": {}}
+        batch: list[tuple[str, str]] = []
+
+        async def flush_batch() -> None:
+            results = await embed([text for _, text in batch])
+            for (trajectory_id, _), result in zip(batch, results):
+                self.vector_index.add(trajectory_id, list(getattr(result, "vector", result)))
+                backend = getattr(result, "backend", "unknown")
+                stats["backends"][backend] = stats["backends"].get(backend, 0) + 1
+            stats["indexed"] += len(batch)
+            stats["batches"] += 1
+            batch.clear()
+
+        async for trajectory in self.iter_trajectories(batch_size):
+            trajectory_id = trajectory["trajectoryId"]
+            if trajectory_id in indexed_ids:
+                stats["skipped"] += 1
+                continue
+            indexed_ids.add(trajectory_id)
+            batch.append((trajectory_id, text_fn(trajectory)))
+            if len(batch) >= batch_size:
+                await flush_batch()
+        if batch:
+            await flush_batch()
+
+        if stats["indexed"] or reindex:
+            self._save_vector_index()
+        return stats
+
     async def delete_trajectory(self, trajectory_id: str) -> bool:
         """Delete a trajectory."""
-        file_path = self.trajectories_dir / f"{trajectory_id}.json"
-        if file_path.exists():
-            file_path.unlink()
-            return True
-        return False
+        file_path = self._trajectory_path(trajectory_id)
+
+        def _delete() -> bool:
+            if file_path.exists():
+                file_path.unlink()
+                return True
+            return False
+
+        # Goes through the write queue so it is ordered after pending saves
+        return bool(await self._io.write(str(file_path), _delete, coalesce=False))
 
     async def count(self, predicate: Callable[[dict], bool] | None = None) -> int:
         """Count trajectories, optionally filtered by predicate."""
         if predicate:
             trajectories = await self.get_trajectories_where(predicate)
             return len(trajectories)
-        return len(list(self.trajectories_dir.glob("*.json")))
+        await self._io.flush()
+        return await self._io.read(lambda: len(list(self.trajectories_dir.glob("*.json"))))
+
+    async def flush(self) -> None:
+        """Wait for all scheduled writes (including the vector index) to land."""
+        await self._io.flush()
+
+    async def close(self) -> None:
+        """Flush pending writes and release the I/O executor if owned."""
+        if self._owns_io:
+            await self._io.close()
+        else:
+            await self._io.flush()
+
+
+def _append_spill(path: Path, trajectories: list[dict]) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = "".join(json.dumps(t, separators=(",", ":")) + "\n" for t in trajectories)
+    with open(path, "a") as f:
+        f.write(data)
+    return len(data)
+
+
+def _remove_spill(io: StorageIOExecutor, path: Path) -> None:
+    # Let queued appends land first so they cannot recreate the file
+    try:
+        io.wait(str(path))
+    finally:
+        path.unlink(missing_ok=True)
+
+
+class SpillingTrajectoryBuffer:
+    """
+    Append-only trajectory collection with a bounded in-memory window.
+
+    The newest `max_in_memory` trajectories stay in memory; older ones
+    are appended to a JSONL spill file on the storage I/O executor, so
+    `append` never blocks the event loop. Iteration streams both tiers
+    in collection order (spilled first, then in-memory), so long
+    collection jobs run at flat memory and exports never materialize the
+    full set. On the event loop use `async for`, which waits for and
+    reads the spill file on the executor; plain iteration blocks and is
+    meant for synchronous callers.
+
+    The spill file only lives as long as the buffer: it is removed by
+    `clear()`, `close()`, or when the buffer is garbage collected (at
+    the latest at interpreter exit).
+
+    Args:
+        spill_path: JSONL file for spilled trajectories
+        max_in_memory: Trajectories kept in memory before spilling
+        io_executor: Shared I/O executor (a private one is created if None)
+    """
+
+    # Spilled lines read per executor call by `async for`
+    READ_BATCH = 256
+
+    def __init__(
+        self,
+        spill_path: str | Path,
+        max_in_memory: int = 1000,
+        io_executor: StorageIOExecutor | None = None,
+    ):
+        if max_in_memory < 0:
+            raise ValueError("max_in_memory must be >= 0")
+        self.spill_path = Path(spill_path)
+        self.max_in_memory = max_in_memory
+
+        self._owns_io = io_executor is None
+        self._io = io_executor or StorageIOExecutor(max_workers=1)
+        self._key = str(self.spill_path)
+
+        self._memory: deque[dict] = deque()
+        self._spilled = 0
+        # Updated from the I/O thread; guarded by _lock
+        self._lock = threading.Lock()
+        self._spill_bytes = 0
+        self._error: BaseException | None = None
+
+        self._finalizer = weakref.finalize(self, _remove_spill, self._io, self.spill_path)
+
+    def append(self, trajectory: dict) -> None:
+        """Add a trajectory, spilling the oldest in-memory one if over the limit."""
+        self._memory.append(trajectory)
+        if len(self._memory) <= self.max_in_memory:
+            return
+
+        overflow = []
+        while len(self._memory) > self.max_in_memory:
+            overflow.append(self._memory.popleft())
+
+        future = self._io.submit_write(
+            self._key, lambda: _append_spill(self.spill_path, overflow), coalesce=False
+        )
+        future.add_done_callback(self._on_spilled)
+        self._spilled += len(overflow)
+
+    def _on_spilled(self, future: Future) -> None:
+        error = future.exception()
+        with self._lock:
+            if error is not None:
+                if self._error is None:
+                    self._error = error
+            else:
+                self._spill_bytes += future.result()
+
+    def _raise_error(self) -> None:
+        with self._lock:
+            error = self._error
+        if error is not None:
+            raise error
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._memory)
+
+    def __iter__(self):
+        # Snapshot both tiers first so appends during iteration are not
+        # seen twice (or skipped) when they spill
+        in_memory = list(self._memory)
+        spilled = self._spilled
+
+        if spilled:
+            self._io.wait(self._key)
+            self._raise_error()
+            with open(self.spill_path) as f:
+                for line in itertools.islice(f, spilled):
+                    yield json.loads(line)
+        yield from in_memory
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        # Same snapshot as __iter__, but the spill file is read in batches
+        # on the I/O executor
+        in_memory = list(self._memory)
+        spilled = self._spilled
+
+        if spilled:
+            await self.flush()
+            f = await self._io.read(lambda: open(self.spill_path))
+            try:
+                while spilled > 0:
+                    lines = await self._io.read(
+                        lambda: list(itertools.islice(f, min(spilled, self.READ_BATCH)))
+                    )
+                    if not lines:
+                        break
+                    spilled -= len(lines)
+                    for line in lines:
+                        yield json.loads(line)
+            finally:
+                await self._io.read(f.close)
+        for trajectory in in_memory:
+            yield trajectory
+
+    async def flush(self) -> None:
+        """
+        Wait for scheduled spill writes to land.
+
+        Raises:
+            Exception: The first error a spill write failed with
+        """
+        await self._io.flush(self._key)
+        self._raise_error()
+
+    def clear(self) -> None:
+        """Drop both tiers (removes the spill file once queued writes land)."""
+        self._memory.clear()
+        self._spilled = 0
+        self._io.submit_write(self._key, self._remove_spill_file, coalesce=False)
+
+    def _remove_spill_file(self) -> None:
+        # Runs after every write queued before it, so the counters match
+        self.spill_path.unlink(missing_ok=True)
+        with self._lock:
+            self._spill_bytes = 0
+            self._error = None
+
+    async def close(self) -> None:
+        """Drop both tiers, remove the spill file and release the executor if owned."""
+        self.clear()
+        await self._io.flush(self._key)
+        self._finalizer.detach()
+        if self._owns_io:
+            await self._io.close()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            spill_bytes = self._spill_bytes
+        return {
+            "total": len(self),
+            "in_memory": len(self._memory),
+            "spilled": self._spilled,
+            "spill_bytes": spill_bytes,
+        }
 
 
 class ElizaStorageAdapter:
@@ -216,15 +944,26 @@ class ElizaStorageAdapter:
     - Log storage
     """
 
-    def __init__(self, data_dir: str | Path = "./data"):
+    def __init__(
+        self,
+        data_dir: str | Path = "./data",
+        io_workers: int = 4,
+        dedupe_prompts: bool = False,
+    ):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+        # Single I/O executor shared by all collections
+        self._io = StorageIOExecutor(max_workers=io_workers)
+
         # Collections
-        self.trajectories = TrajectoryStore(self.data_dir)
+        self.trajectories = TrajectoryStore(
+            self.data_dir, io_executor=self._io, dedupe_prompts=dedupe_prompts
+        )
         self._cache: dict[str, tuple[dict, int | None]] = {}  # key -> (value, expires_at)
         self._logs_dir = self.data_dir / "logs"
         self._logs_dir.mkdir(exist_ok=True)
+        self._checkpoints_dir = self.data_dir / "checkpoints"
 
     # Trajectory operations
     async def save_trajectory(
@@ -297,11 +1036,16 @@ class ElizaStorageAdapter:
             "createdAt": int(time.time() * 1000),
         }
 
-        # Append to daily log file
+        # Append to daily log file (appends are ordered, never coalesced)
         date_str = time.strftime("%Y-%m-%d")
         log_file = self._logs_dir / f"{date_str}.jsonl"
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        line = json.dumps(log_entry) + "\n"
+
+        def _append() -> None:
+            with open(log_file, "a") as f:
+                f.write(line)
+
+        await self._io.write(str(log_file), _append, coalesce=False)
 
     async def get_logs(
         self,
@@ -311,23 +1055,28 @@ class ElizaStorageAdapter:
         limit: int = 100,
     ) -> list[dict]:
         """Get log entries."""
-        logs = []
 
-        for log_file in sorted(self._logs_dir.glob("*.jsonl"), reverse=True):
-            with open(log_file) as f:
-                for line in f:
-                    entry = json.loads(line)
-                    if log_type and entry.get("type") != log_type:
-                        continue
-                    if entity_id and entry.get("entityId") != entity_id:
-                        continue
-                    if room_id and entry.get("roomId") != room_id:
-                        continue
-                    logs.append(entry)
-                    if len(logs) >= limit:
-                        return logs
+        def _read_logs() -> list[dict]:
+            logs = []
 
-        return logs
+            for log_file in sorted(self._logs_dir.glob("*.jsonl"), reverse=True):
+                with open(log_file) as f:
+                    for line in f:
+                        entry = json.loads(line)
+                        if log_type and entry.get("type") != log_type:
+                            continue
+                        if entity_id and entry.get("entityId") != entity_id:
+                            continue
+                        if room_id and entry.get("roomId") != room_id:
+                            continue
+                        logs.append(entry)
+                        if len(logs) >= limit:
+                            return logs
+
+            return logs
+
+        await self._io.flush()
+        return await self._io.read(_read_logs)
 
     # Checkpoint operations
     async def save_checkpoint(
@@ -336,24 +1085,37 @@ class ElizaStorageAdapter:
         checkpoint_data: dict,
     ) -> None:
         """Save a training checkpoint."""
-        checkpoints_dir = self.data_dir / "checkpoints"
-        checkpoints_dir.mkdir(exist_ok=True)
-
+        checkpoints_dir = self._checkpoints_dir
         file_path = checkpoints_dir / f"{checkpoint_id}.json"
-        with open(file_path, "w") as f:
-            json.dump(checkpoint_data, f, indent=2)
+
+        def _save() -> None:
+            checkpoints_dir.mkdir(exist_ok=True)
+            _write_json(file_path, checkpoint_data)
+
+        await self._io.write(str(file_path), _save)
 
     async def get_checkpoint(self, checkpoint_id: str) -> dict | None:
         """Get a training checkpoint."""
-        file_path = self.data_dir / "checkpoints" / f"{checkpoint_id}.json"
-        if not file_path.exists():
-            return None
-        with open(file_path) as f:
-            return json.load(f)
+        file_path = self._checkpoints_dir / f"{checkpoint_id}.json"
+        return await self._io.read(lambda: _read_json(file_path), key=str(file_path))
 
     async def list_checkpoints(self) -> list[str]:
         """List all checkpoint IDs."""
-        checkpoints_dir = self.data_dir / "checkpoints"
-        if not checkpoints_dir.exists():
-            return []
-        return [p.stem for p in checkpoints_dir.glob("*.json")]
+        checkpoints_dir = self._checkpoints_dir
+
+        def _list() -> list[str]:
+            if not checkpoints_dir.exists():
+                return []
+            return [p.stem for p in checkpoints_dir.glob("*.json")]
+
+        await self._io.flush()
+        return await self._io.read(_list)
+
+    # Lifecycle
+    async def flush(self) -> None:
+        """Wait for every scheduled write to complete."""
+        await self._io.flush()
+
+    async def close(self) -> None:
+        """Flush all pending writes and stop the I/O executor."""
+        await self._io.close()
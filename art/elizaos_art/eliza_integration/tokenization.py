@@ -0,0 +1,251 @@
+"""
+Pre-tokenization for exported training data.
+
+Applying the chat template and tokenizing every conversation is repeated
+by every training run and sweep. This module tokenizes ART-format
+trajectories once and caches the result on disk, keyed by:
+
+- tokenizer fingerprint (model / vocabulary)
+- chat template hash
+- content hash of the conversation
+
+so any later export with the same tokenizer and template skips
+tokenization entirely.
+"""
+
+import array
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class ChatTokenizer(Protocol):
+    """Protocol for tokenizers used by pre-tokenized exports."""
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable identifier of the tokenizer (model and vocabulary)."""
+        ...
+
+    @property
+    def template_hash(self) -> str:
+        """Hash of the chat template applied before tokenizing."""
+        ...
+
+    def encode_chat(self, messages: list[dict]) -> tuple[list[int], list[int]]:
+        """Tokenize a conversation into (input_ids, assistant_mask)."""
+        ...
+
+
+class HFChatTokenizer:
+    """
+    ChatTokenizer backed by a HuggingFace `transformers` tokenizer.
+
+    The conversation is rendered with the tokenizer's chat template and
+    tokenized once. Assistant spans are found by rendering growing
+    prefixes of the conversation (string work only) and mapped onto
+    tokens through the offset mapping, which needs a fast tokenizer and
+    a prefix-stable template (true for the Llama 3 / Qwen / ChatML ones).
+    """
+
+    def __init__(self, tokenizer):
+        self._tokenizer = tokenizer
+
+        vocab = json.dumps(sorted(tokenizer.get_vocab().items())).encode()
+        name = getattr(tokenizer, "name_or_path", "") or type(tokenizer).__name__
+        self._fingerprint = f"{name}:{hashlib.sha256(vocab).hexdigest()[:16]}"
+
+        template = getattr(tokenizer, "chat_template", None) or ""
+        self._template_hash = hashlib.sha256(template.encode()).hexdigest()[:16]
+
+    @classmethod
+    def from_pretrained(cls, name_or_path: str) -> "HFChatTokenizer":
+        """Load a tokenizer by model name or path."""
+        try:
+            from transformers import AutoTokenizer
+        except ImportError:
+            raise ImportError(
+                "transformers not installed. "
+                "Install with: pip install transformers"
+            )
+        return cls(AutoTokenizer.from_pretrained(name_or_path))
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    @property
+    def template_hash(self) -> str:
+        return self._template_hash
+
+    def encode_chat(self, messages: list[dict]) -> tuple[list[int], list[int]]:
+        text = self._tokenizer.apply_chat_template(messages, tokenize=False)
+
+        spans = []
+        prev_len = 0
+        for i, message in enumerate(messages):
+            rendered = self._tokenizer.apply_chat_template(
+                messages[: i + 1], tokenize=False
+            )
+            if message.get("role") == "assistant":
+                spans.append((prev_len, len(rendered)))
+            prev_len = len(rendered)
+
+        encoded = self._tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True
+        )
+        input_ids = list(encoded["input_ids"])
+
+        # Offsets and spans are both sorted, so one merged walk suffices
+        mask = []
+        span_index = 0
+        for start, _ in encoded["offset_mapping"]:
+            while span_index < len(spans) and spans[span_index][1] <= start:
+                span_index += 1
+            in_span = span_index < len(spans) and spans[span_index][0] <= start
+            mask.append(1 if in_span else 0)
+
+        return input_ids, mask
+
+
+def conversation_hash(messages: list[dict]) -> str:
+    """Hash the parts of a conversation that affect tokenization."""
+    payload = json.dumps(
+        [(m.get("role"), m.get("content")) for m in messages],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TokenizationCache:
+    """
+    On-disk cache of tokenized conversations.
+
+    Entries live under a namespace derived from the tokenizer fingerprint
+    and template hash, one small binary file per conversation hash:
+    a uint32 length followed by int32 token ids and uint8 assistant mask.
+    Changing the tokenizer or template simply selects a new namespace.
+    """
+
+    def __init__(self, cache_dir: str | Path, tokenizer: ChatTokenizer):
+        self.tokenizer = tokenizer
+        namespace = hashlib.sha256(
+            f"{tokenizer.fingerprint}|{tokenizer.template_hash}".encode()
+        ).hexdigest()[:16]
+        self.cache_dir = Path(cache_dir) / namespace
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, content_hash: str) -> Path:
+        return self.cache_dir / content_hash[:2] / f"{content_hash}.bin"
+
+    def get(self, content_hash: str) -> tuple[list[int], list[int]] | None:
+        """Get cached (input_ids, assistant_mask) for a conversation hash."""
+        path = self._entry_path(content_hash)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        (length,) = struct.unpack_from("<I", data)
+        ids = array.array("i")
+        ids.frombytes(data[4 : 4 + 4 * length])
+        mask = list(data[4 + 4 * length :])
+        return ids.tolist(), mask
+
+    def put(self, content_hash: str, input_ids: list[int], mask: list[int]) -> None:
+        """Store a tokenized conversation (written atomically)."""
+        path = self._entry_path(content_hash)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack("<I", len(input_ids)))
+            f.write(array.array("i", input_ids).tobytes())
+            f.write(bytes(mask))
+        os.replace(tmp_path, path)
+
+    def encode(self, messages: list[dict]) -> tuple[list[int], list[int]]:
+        """Tokenize a conversation, reusing the cached result if present."""
+        content_hash = conversation_hash(messages)
+        cached = self.get(content_hash)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        input_ids, mask = self.tokenizer.encode_chat(messages)
+        self.put(content_hash, input_ids, mask)
+        return input_ids, mask
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+def pretokenize(
+    art_traj: dict,
+    tokenizer: ChatTokenizer,
+    cache: TokenizationCache | None = None,
+) -> dict:
+    """
+    Add `inputIds`, `assistantMask` and `numTokens` to an ART trajectory.
+
+    Returns:
+        A new dict; the input trajectory is not modified
+    """
+    messages = art_traj.get("messages", [])
+    if cache is not None:
+        input_ids, mask = cache.encode(messages)
+    else:
+        input_ids, mask = tokenizer.encode_chat(messages)
+
+    return {
+        **art_traj,
+        "inputIds": input_ids,
+        "assistantMask": mask,
+        "numTokens": len(input_ids),
+    }
+
+
+def length_histogram(lengths: list[int]) -> dict:
+    """
+    Summarize token lengths for length-bucketed batching.
+
+    Buckets are powers of two (the upper bound of each bucket is the
+    key), which is what bucketing samplers usually pad to.
+
+    Returns:
+        Dict with count, min/max/mean, p50/p90/p99 and the bucket counts
+    """
+    if not lengths:
+        return {"count": 0, "buckets": {}}
+
+    ordered = sorted(lengths)
+    buckets: dict[str, int] = {}
+    for length in ordered:
+        bound = 1 << max(0, length - 1).bit_length()
+        buckets[str(bound)] = buckets.get(str(bound), 0) + 1
+
+    def percentile(p: float) -> int:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    return {
+        "count": len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": sum(ordered) / len(ordered),
+        "p50": percentile(0.5),
+        "p90": percentile(0.9),
+        "p99": percentile(0.99),
+        "buckets": buckets,
+    }
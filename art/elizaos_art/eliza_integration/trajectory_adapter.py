@@ -14,14 +14,25 @@ This adapter provides end-to-end capture of the entire ElizaOS flow:
 - Environment state at each step
 """
 
+import atexit
+import hashlib
 import json
+import queue
+import random
+import threading
 import time
 import uuid
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
 from typing import Callable, Protocol, runtime_checkable
 
 from elizaos_art.base import EpisodeResult, State, Trajectory
+from elizaos_art.eliza_integration.prompt_store import (
+    PromptBlobStore,
+    blob_dir_for,
+    has_blob_refs,
+)
 
 
 @runtime_checkable
@@ -217,6 +228,251 @@ class ElizaActionAttempt:
         }
 
 
+class CaptureTier(str, Enum):
+    """How much of each trajectory the logger records."""
+
+    # Everything: prompts, responses, provider data, environment state
+    FULL = "full"
+    # Structure and metrics, with text/data replaced by hashes and lengths
+    HASHES = "hashes"
+    # Per-trajectory counters only (LLM calls, tokens, latency, rewards)
+    METRICS = "metrics"
+
+
+# LLM call fields that carry text (replaced by hashes in the HASHES tier)
+_LLM_TEXT_FIELDS = ("systemPrompt", "userPrompt", "response", "reasoning", "messages")
+
+
+def _content_hash(value: object) -> str:
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+def _hash_fields(record: dict, fields: tuple[str, ...]) -> dict:
+    """Replace content fields with `<field>Hash` (and `<field>Length` for text)."""
+    hashed = {k: v for k, v in record.items() if k not in fields}
+    for key in fields:
+        value = record.get(key)
+        if value is not None:
+            hashed[f"{key}Hash"] = _content_hash(value)
+            if isinstance(value, str):
+                hashed[f"{key}Length"] = len(value)
+    return hashed
+
+
+class TrajectoryWriteBehind:
+    """
+    Background persistence pipeline for completed trajectory steps.
+
+    Completed steps are handed to a worker thread through a bounded
+    queue and appended, in batches, to `<trajectory_id>.steps.jsonl`.
+    When a trajectory ends, the worker assembles the usual
+    `<trajectory_id>.json` file from the header and the step log.
+
+    - Backpressure: `submit_*` blocks when `max_pending` items are queued,
+      so memory stays bounded even if the disk falls behind.
+    - Drain on shutdown: `close()` (also registered with `atexit`)
+      writes everything that was submitted before returning.
+    - Failures: a batch that fails to write is recorded and skipped, so
+      the worker keeps draining the queue. The first error is raised from
+      `flush()` and `close()`, and from `wait_for()` for the trajectories
+      in the failed batch.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        data_dir: str | Path,
+        max_pending: int = 1024,
+        batch_size: int = 64,
+        linger_s: float = 0.01,
+    ):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.linger_s = linger_s
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._finalized: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._error: Exception | None = None
+        self._failed: dict[str, Exception] = {}
+        # Updated from both the caller and the worker thread; guarded by _lock
+        self._stats = {
+            "steps_written": 0,
+            "trajectories_written": 0,
+            "batches": 0,
+            "blocked_submits": 0,
+            "max_queue_depth": 0,
+        }
+
+        self._thread = threading.Thread(
+            target=self._run, name="trajectory-write-behind", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _submit(self, item: tuple) -> None:
+        if self._closed:
+            raise RuntimeError("Write-behind queue is closed")
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._stats["blocked_submits"] += 1
+            self._queue.put(item)
+        depth = self._queue.qsize()
+        with self._lock:
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+
+    def submit_step(self, trajectory_id: str, step: dict) -> None:
+        """Queue a completed step; the caller must not mutate it afterwards."""
+        self._submit(("step", trajectory_id, step))
+
+    def submit_end(self, trajectory_id: str, header: dict) -> None:
+        """Queue the final trajectory record (without steps)."""
+        with self._lock:
+            self._finalized[trajectory_id] = threading.Event()
+        self._submit(("end", trajectory_id, header))
+
+    def wait_for(self, trajectory_id: str, timeout: float | None = None) -> bool:
+        """
+        Wait until an ended trajectory has been written to disk.
+
+        Raises:
+            Exception: The write error, if a batch holding this
+                trajectory failed
+        """
+        with self._lock:
+            event = self._finalized.get(trajectory_id)
+        done = event.wait(timeout) if event else True
+        with self._lock:
+            error = self._failed.get(trajectory_id)
+        if error is not None:
+            raise error
+        return done
+
+    def flush(self) -> None:
+        """Block until everything submitted so far is on disk."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Drain the queue and stop the worker thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+        atexit.unregister(self.close)
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        with self._lock:
+            error = self._error
+        if error is not None:
+            raise error
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["failed_trajectories"] = len(self._failed)
+        return {**stats, "queue_depth": self._queue.qsize()}
+
+    def _steps_path(self, trajectory_id: str) -> Path:
+        return self.data_dir / f"{trajectory_id}.steps.jsonl"
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.linger_s
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    batch.append(
+                        self._queue.get(timeout=timeout) if timeout > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+
+            try:
+                stopping = self._write_batch(batch)
+            except Exception as exc:
+                stopping = any(item is self._STOP for item in batch)
+                self._fail_batch(batch, exc)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _fail_batch(self, batch: list, error: Exception) -> None:
+        """Record a failed batch and release everyone waiting on it."""
+        trajectory_ids = {item[1] for item in batch if item is not self._STOP}
+        with self._lock:
+            if self._error is None:
+                self._error = error
+            events = []
+            for trajectory_id in trajectory_ids:
+                self._failed[trajectory_id] = error
+                event = self._finalized.pop(trajectory_id, None)
+                if event:
+                    events.append(event)
+        for event in events:
+            event.set()
+
+    def _write_batch(self, batch: list) -> bool:
+        """Persist one batch; returns True when the stop sentinel was seen."""
+        stopping = False
+        step_lines: dict[str, list[str]] = {}
+        ends: list[tuple[str, dict]] = []
+
+        for item in batch:
+            if item is self._STOP:
+                stopping = True
+                continue
+            kind, trajectory_id, payload = item
+            if kind == "step":
+                step_lines.setdefault(trajectory_id, []).append(json.dumps(payload))
+            else:
+                ends.append((trajectory_id, payload))
+
+        for trajectory_id, lines in step_lines.items():
+            with open(self._steps_path(trajectory_id), "a") as f:
+                f.write("\n".join(lines) + "\n")
+            with self._lock:
+                self._stats["steps_written"] += len(lines)
+
+        for trajectory_id, header in ends:
+            self._finalize(trajectory_id, header)
+
+        with self._lock:
+            self._stats["batches"] += 1
+        return stopping
+
+    def _finalize(self, trajectory_id: str, header: dict) -> None:
+        steps_path = self._steps_path(trajectory_id)
+        steps = []
+        if steps_path.exists():
+            with open(steps_path) as f:
+                steps = [json.loads(line) for line in f if line.strip()]
+        steps.sort(key=lambda step: step.get("stepNumber", 0))
+
+        with open(self.data_dir / f"{trajectory_id}.json", "w") as f:
+            json.dump({**header, "steps": steps}, f, indent=2)
+        steps_path.unlink(missing_ok=True)
+
+        with self._lock:
+            self._stats["trajectories_written"] += 1
+            event = self._finalized.pop(trajectory_id, None)
+        if event:
+            event.set()
+
+
 class ElizaTrajectoryLogger:
     """
     Adapter that wraps ART trajectory logging to ElizaOS format.
@@ -230,6 +486,25 @@ class ElizaTrajectoryLogger:
     - Provider accesses (game state, context, etc.)
     - Action executions (parameters, results, rewards)
     - Environment state at each step
+
+    With `write_behind=True` (and `auto_persist`), completed steps leave
+    memory immediately and are persisted by a `TrajectoryWriteBehind`
+    worker, so memory is proportional to in-flight steps and the agent's
+    path never waits on disk. Steps can no longer be logged to once
+    completed, and `end_trajectory` returns the trajectory without its
+    steps; `load_trajectory` returns the full record. Call `close()` at
+    shutdown to drain pending writes.
+
+    With `dedupe_prompts=True`, prompt and response text is kept once in
+    a `PromptBlobStore` (under `data_dir/blobs`) and LLM calls hold
+    references, both in memory and in the saved files. `end_trajectory`
+    and `load_trajectory` return fully rehydrated trajectories.
+
+    Capture can be reduced for production use: `capture_tier` selects
+    what sampled trajectories record (see `CaptureTier`), and
+    `sample_rate` is the fraction of trajectories that are sampled; the
+    rest are recorded at the METRICS tier. The tier is decided once in
+    `start_trajectory` and stored as `captureTier` on the trajectory.
     """
 
     def __init__(
@@ -238,16 +513,44 @@ class ElizaTrajectoryLogger:
         data_dir: str | Path = "./data/trajectories",
         external_logger: TrajectoryLoggerService | None = None,
         auto_persist: bool = True,
+        write_behind: bool = False,
+        max_pending_steps: int = 1024,
+        dedupe_prompts: bool = False,
+        capture_tier: CaptureTier | str = CaptureTier.FULL,
+        sample_rate: float = 1.0,
+        sample_seed: int | None = None,
     ):
         self.agent_id = agent_id
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self._external_logger = external_logger
         self._auto_persist = auto_persist
+
+        self._write_behind: TrajectoryWriteBehind | None = None
+        if write_behind and auto_persist and not external_logger:
+            self._write_behind = TrajectoryWriteBehind(
+                self.data_dir, max_pending=max_pending_steps
+            )
+        # trajectory_id -> steps already handed to the write-behind queue
+        self._persisted_steps: dict[str, int] = {}
+
+        self.capture_tier = CaptureTier(capture_tier)
+        self.sample_rate = sample_rate
+        self._sampler = random.Random(sample_seed)
+
+        self._prompt_store: PromptBlobStore | None = None
+        if dedupe_prompts:
+            self._prompt_store = PromptBlobStore(
+                blob_dir_for(self.data_dir) if auto_persist else None
+            )
+        # Resolves references in files written by a deduplicating logger
+        self._blob_reader: PromptBlobStore | None = None
         
         # Active trajectories (when not using external logger)
         self._active_trajectories: dict[str, dict] = {}
         self._active_steps: dict[str, str] = {}  # trajectory_id -> current_step_id
+        # step_id -> (trajectory, step) for every step of an active trajectory
+        self._step_index: dict[str, tuple[dict, dict]] = {}
         
         # Hooks for intercepting LLM calls
         self._llm_call_hooks: list[Callable] = []
@@ -289,7 +592,11 @@ class ElizaTrajectoryLogger:
         trajectory_id = str(uuid.uuid4())
         now = int(time.time() * 1000)
 
-        self._active_trajectories[trajectory_id] = {
+        tier = self.capture_tier
+        if self.sample_rate < 1.0 and self._sampler.random() >= self.sample_rate:
+            tier = CaptureTier.METRICS
+
+        self._active_trajectories[trajectory_id] = trajectory = {
             "trajectoryId": trajectory_id,
             "agentId": self.agent_id,
             "startTime": now,
@@ -304,7 +611,16 @@ class ElizaTrajectoryLogger:
             "rewardComponents": {"environmentReward": 0.0},
             "metrics": {"episodeLength": 0, "finalStatus": "in_progress"},
             "metadata": metadata or {},
+            "captureTier": tier.value,
         }
+        if tier is CaptureTier.METRICS:
+            trajectory["metrics"]["llm"] = {
+                "calls": 0,
+                "promptTokens": 0,
+                "completionTokens": 0,
+                "latencyMs": 0,
+            }
+            trajectory["metrics"]["providerAccesses"] = 0
 
         return trajectory_id
 
@@ -325,28 +641,45 @@ class ElizaTrajectoryLogger:
             raise ValueError(f"Trajectory {trajectory_id} not found")
 
         step_id = str(uuid.uuid4())
-        step = {
-            "stepId": step_id,
-            "stepNumber": len(trajectory["steps"]),
-            "timestamp": env_state.get("timestamp", int(time.time() * 1000)),
-            "environmentState": env_state,
-            "observation": {},
-            "llmCalls": [],
-            "providerAccesses": [],
-            "action": {
-                "attemptId": "",
-                "timestamp": 0,
-                "actionType": "pending",
-                "actionName": "pending",
-                "parameters": {},
-                "success": False,
-            },
-            "reward": 0.0,
-            "done": False,
-        }
+        step_number = len(trajectory["steps"]) + self._persisted_steps.get(trajectory_id, 0)
+        tier = trajectory["captureTier"]
+
+        if tier == CaptureTier.METRICS.value:
+            # Only what reward and episode-length stats need
+            step = {
+                "stepId": step_id,
+                "stepNumber": step_number,
+                "action": {"actionName": "pending", "success": False},
+                "reward": 0.0,
+                "done": False,
+            }
+        else:
+            timestamp = env_state.get("timestamp", int(time.time() * 1000))
+            if tier == CaptureTier.HASHES.value:
+                env_state = {"stateHash": _content_hash(env_state)}
+            step = {
+                "stepId": step_id,
+                "stepNumber": step_number,
+                "timestamp": timestamp,
+                "environmentState": env_state,
+                "observation": {},
+                "llmCalls": [],
+                "providerAccesses": [],
+                "action": {
+                    "attemptId": "",
+                    "timestamp": 0,
+                    "actionType": "pending",
+                    "actionName": "pending",
+                    "parameters": {},
+                    "success": False,
+                },
+                "reward": 0.0,
+                "done": False,
+            }
 
         trajectory["steps"].append(step)
         self._active_steps[trajectory_id] = step_id
+        self._step_index[step_id] = (trajectory, step)
         return step_id
 
     def get_current_step_id(self, trajectory_id: str) -> str | None:
@@ -390,14 +723,26 @@ class ElizaTrajectoryLogger:
             )
             return
 
-        # Find the step
-        for trajectory in self._active_trajectories.values():
-            for step in trajectory["steps"]:
-                if step["stepId"] == step_id:
-                    call_dict["callId"] = str(uuid.uuid4())
-                    call_dict["timestamp"] = int(time.time() * 1000)
-                    step["llmCalls"].append(call_dict)
-                    return
+        # Find the step (unknown or ended steps are ignored)
+        entry = self._step_index.get(step_id)
+        if entry:
+            trajectory, step = entry
+            tier = trajectory["captureTier"]
+            if tier == CaptureTier.METRICS.value:
+                llm_metrics = trajectory["metrics"]["llm"]
+                llm_metrics["calls"] += 1
+                llm_metrics["promptTokens"] += call_dict.get("promptTokens") or 0
+                llm_metrics["completionTokens"] += call_dict.get("completionTokens") or 0
+                llm_metrics["latencyMs"] += call_dict.get("latencyMs") or 0
+                return
+            if tier == CaptureTier.HASHES.value:
+                call_dict = _hash_fields(call_dict, _LLM_TEXT_FIELDS)
+
+            call_dict["callId"] = str(uuid.uuid4())
+            call_dict["timestamp"] = int(time.time() * 1000)
+            if self._prompt_store:
+                self._prompt_store.dehydrate_call(call_dict)
+            step["llmCalls"].append(call_dict)
 
     def log_llm_call_by_trajectory_id(
         self,
@@ -437,14 +782,20 @@ class ElizaTrajectoryLogger:
             )
             return
 
-        # Find the step
-        for trajectory in self._active_trajectories.values():
-            for step in trajectory["steps"]:
-                if step["stepId"] == step_id:
-                    access_dict["providerId"] = str(uuid.uuid4())
-                    access_dict["timestamp"] = int(time.time() * 1000)
-                    step["providerAccesses"].append(access_dict)
-                    return
+        # Find the step (unknown or ended steps are ignored)
+        entry = self._step_index.get(step_id)
+        if entry:
+            trajectory, step = entry
+            tier = trajectory["captureTier"]
+            if tier == CaptureTier.METRICS.value:
+                trajectory["metrics"]["providerAccesses"] += 1
+                return
+            if tier == CaptureTier.HASHES.value:
+                access_dict = _hash_fields(access_dict, ("data", "query"))
+
+            access_dict["providerId"] = str(uuid.uuid4())
+            access_dict["timestamp"] = int(time.time() * 1000)
+            step["providerAccesses"].append(access_dict)
 
     def log_provider_access_by_trajectory_id(
         self,
@@ -496,21 +847,46 @@ class ElizaTrajectoryLogger:
         if not trajectory:
             return
 
-        for step in trajectory["steps"]:
-            if step["stepId"] == step_id:
+        # The step must belong to this trajectory
+        entry = self._step_index.get(step_id)
+        if entry and entry[0] is trajectory:
+            step = entry[1]
+            tier = trajectory["captureTier"]
+            if tier == CaptureTier.METRICS.value:
+                step["action"] = {
+                    "actionName": action_dict.get("actionName"),
+                    "success": action_dict.get("success", True),
+                }
+            else:
+                if tier == CaptureTier.HASHES.value:
+                    action_dict = _hash_fields(
+                        action_dict, ("parameters", "result", "reasoning")
+                    )
                 step["action"] = {
                     "attemptId": str(uuid.uuid4()),
                     "timestamp": int(time.time() * 1000),
                     **action_dict,
                 }
-                step["done"] = done
-                if reward is not None:
-                    step["reward"] = reward
-                    trajectory["totalReward"] += reward
-                break
+            step["done"] = done
+            if reward is not None:
+                step["reward"] = reward
+                trajectory["totalReward"] += reward
+
+            if self._write_behind:
+                self._hand_off_step(trajectory_id, trajectory, step)
 
         self._active_steps.pop(trajectory_id, None)
 
+    def _hand_off_step(self, trajectory_id: str, trajectory: dict, step: dict) -> None:
+        """Move a completed step from memory to the write-behind queue."""
+        steps = trajectory["steps"]
+        steps[:] = [s for s in steps if s is not step]
+        self._step_index.pop(step["stepId"], None)
+        self._persisted_steps[trajectory_id] = (
+            self._persisted_steps.get(trajectory_id, 0) + 1
+        )
+        self._write_behind.submit_step(trajectory_id, step)
+
     def complete_current_step(
         self,
         trajectory_id: str,
@@ -542,21 +918,45 @@ class ElizaTrajectoryLogger:
         if not trajectory:
             return {}
 
+        self._active_steps.pop(trajectory_id, None)
+        for step in trajectory["steps"]:
+            self._step_index.pop(step["stepId"], None)
+        persisted = self._persisted_steps.pop(trajectory_id, 0)
+
         now = int(time.time() * 1000)
         trajectory["endTime"] = now
         trajectory["durationMs"] = now - trajectory["startTime"]
         trajectory["metrics"]["finalStatus"] = status
-        trajectory["metrics"]["episodeLength"] = len(trajectory["steps"])
+        trajectory["metrics"]["episodeLength"] = len(trajectory["steps"]) + persisted
 
         if final_metrics:
             trajectory["metrics"].update(final_metrics)
 
+        # Referenced prompt text must be on disk before the trajectory is
+        if self._prompt_store and self._auto_persist:
+            self._prompt_store.save()
+
+        if self._write_behind:
+            # Steps that were never completed are persisted as they are
+            for step in trajectory["steps"]:
+                self._write_behind.submit_step(trajectory_id, step)
+            trajectory["steps"] = []
+            self._write_behind.submit_end(trajectory_id, trajectory)
+            return trajectory
+
         # Save to file if auto-persist is enabled
         if self._auto_persist:
             output_path = self.data_dir / f"{trajectory_id}.json"
             with open(output_path, "w") as f:
-                json.dump(trajectory, f, indent=2)
-
+                if trajectory["captureTier"] == CaptureTier.FULL.value:
+                    json.dump(trajectory, f, indent=2)
+                else:
+                    # Compact JSON goes through the C encoder (indent forces
+                    # the pure-Python one), keeping reduced tiers cheap
+                    f.write(json.dumps(trajectory))
+
+        if self._prompt_store:
+            return self._prompt_store.rehydrate(trajectory)
         return trajectory
 
     def get_active_trajectory(self, trajectory_id: str) -> dict | None:
@@ -569,16 +969,37 @@ class ElizaTrajectoryLogger:
 
     def load_trajectory(self, trajectory_id: str) -> dict | None:
         """Load a persisted trajectory from disk."""
+        if self._write_behind:
+            self._write_behind.wait_for(trajectory_id)
         path = self.data_dir / f"{trajectory_id}.json"
         if path.exists():
             with open(path) as f:
-                return json.load(f)
+                trajectory = json.load(f)
+            if not has_blob_refs(trajectory):
+                return trajectory
+            if self._prompt_store:
+                return self._prompt_store.rehydrate(trajectory)
+            if self._blob_reader is None:
+                self._blob_reader = PromptBlobStore(blob_dir_for(self.data_dir))
+            return self._blob_reader.rehydrate(trajectory)
         return None
 
     def list_trajectories(self) -> list[str]:
         """List all persisted trajectory IDs."""
+        if self._write_behind:
+            self._write_behind.flush()
         return [p.stem for p in self.data_dir.glob("*.json")]
 
+    def flush(self) -> None:
+        """Wait until all ended trajectories are on disk."""
+        if self._write_behind:
+            self._write_behind.flush()
+
+    def close(self) -> None:
+        """Drain pending writes and stop the write-behind worker."""
+        if self._write_behind:
+            self._write_behind.close()
+
 
 def convert_to_eliza_trajectory(
     art_trajectory: Trajectory,
@@ -0,0 +1,239 @@
+"""
+Environment microbenchmarks and regression checks.
+
+Measures the hot paths of each game environment with no model involved:
+
+- `reset` latency
+- `step` latency / throughput
+- `get_available_actions` cost
+- `State.to_prompt` cost
+
+Episodes are played by a seeded random policy over the available
+actions, so every run replays exactly the same states. Results can be
+saved as a versioned JSON baseline and later runs compared against it;
+a metric that got slower than the baseline by more than a threshold is
+reported as a regression.
+
+Usage:
+    elizaos-art bench-envs --save-baseline
+    elizaos-art bench-envs --threshold 0.25   # exits 1 on regression
+"""
+
+import gc
+import json
+import platform
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from elizaos_art.base import BaseEnvironment, render_cache
+from elizaos_art.benchmark_runner import ALL_GAMES, create_trainable
+
+BASELINE_SCHEMA_VERSION = 1
+
+DEFAULT_BASELINE_PATH = "./benchmark_results/env/baseline.json"
+
+# Per-game timings; lower is better for all of them
+TIMED_METRICS = ("reset_us", "step_us", "actions_us", "to_prompt_us")
+
+
+@dataclass
+class EnvBenchmarkConfig:
+    """Workload of an environment benchmark run.
+
+    Two runs are only comparable if their configs are equal.
+    """
+
+    seeds: int = 20
+    max_steps: int = 2000
+    rounds: int = 5
+
+    def to_dict(self) -> dict:
+        return {"seeds": self.seeds, "max_steps": self.max_steps, "rounds": self.rounds}
+
+
+async def _run_round(env: BaseEnvironment, config: EnvBenchmarkConfig) -> dict:
+    timings = {metric: 0.0 for metric in TIMED_METRICS}
+    counts = {metric: 0 for metric in TIMED_METRICS}
+    clock = time.perf_counter
+
+    def timed(metric: str, fn: Callable, *args):
+        start = clock()
+        result = fn(*args)
+        timings[metric] += clock() - start
+        counts[metric] += 1
+        return result
+
+    for seed in range(config.seeds):
+        policy = random.Random(seed)
+
+        start = clock()
+        state = await env.reset(seed=seed)
+        timings["reset_us"] += clock() - start
+        counts["reset_us"] += 1
+
+        for _ in range(config.max_steps):
+            if state.is_terminal():
+                break
+            timed("to_prompt_us", state.to_prompt)
+            actions = timed("actions_us", env.get_available_actions, state)
+            if not actions:
+                break
+
+            action = policy.choice(actions)
+            start = clock()
+            state, _, _ = await env.step(action)
+            timings["step_us"] += clock() - start
+            counts["step_us"] += 1
+
+    result = {
+        metric: timings[metric] / counts[metric] * 1e6 if counts[metric] else 0.0
+        for metric in TIMED_METRICS
+    }
+    result["steps"] = counts["step_us"]
+    return result
+
+
+async def benchmark_environment(
+    game_name: str,
+    config: EnvBenchmarkConfig | None = None,
+) -> dict:
+    """
+    Benchmark one game environment.
+
+    Each round replays the same seeded episodes with the garbage
+    collector off (as `timeit` does); the fastest round is kept per
+    metric to filter out scheduler noise.
+
+    Returns:
+        Dict with microseconds per reset/step/get_available_actions/
+        to_prompt, steps per second, and the number of steps played
+    """
+    config = config or EnvBenchmarkConfig()
+    env, _ = create_trainable(game_name)
+    await env.initialize()
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # Untimed warm-up round so imports and caches don't count
+        await _run_round(env, config)
+        rounds = []
+        for _ in range(max(1, config.rounds)):
+            # Time first renders of each state, not hits from the last round
+            render_cache.clear()
+            rounds.append(await _run_round(env, config))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        await env.close()
+
+    result = {metric: min(r[metric] for r in rounds) for metric in TIMED_METRICS}
+    result["steps_per_sec"] = 1e6 / result["step_us"] if result["step_us"] else 0.0
+    result["steps"] = rounds[0]["steps"]
+    return result
+
+
+async def run_env_benchmarks(
+    games: list[str] | None = None,
+    config: EnvBenchmarkConfig | None = None,
+) -> dict:
+    """
+    Benchmark several environments.
+
+    Returns:
+        A baseline document: schema version, workload config, machine
+        info and per-game results
+    """
+    config = config or EnvBenchmarkConfig()
+    results = {}
+    for game in games or ALL_GAMES:
+        results[game] = await benchmark_environment(game, config)
+
+    return {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "config": config.to_dict(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def save_baseline(report: dict, path: str | Path = DEFAULT_BASELINE_PATH) -> Path:
+    """Save a benchmark report as the baseline."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_baseline(path: str | Path = DEFAULT_BASELINE_PATH) -> dict:
+    """Load a saved baseline, rejecting other schema versions."""
+    with open(path) as f:
+        baseline = json.load(f)
+    version = baseline.get("schema_version")
+    if version != BASELINE_SCHEMA_VERSION:
+        raise ValueError(
+            f"Baseline schema version {version} is not supported "
+            f"(expected {BASELINE_SCHEMA_VERSION}); re-record the baseline"
+        )
+    return baseline
+
+
+def compare_to_baseline(report: dict, baseline: dict, threshold: float = 0.25) -> list[dict]:
+    """
+    Compare a benchmark report against a baseline.
+
+    Args:
+        report: Output of `run_env_benchmarks`
+        baseline: Saved baseline with the same schema version
+        threshold: Allowed slowdown as a fraction (0.25 = 25% slower)
+
+    Returns:
+        List of regressions, each with game, metric, baseline, current and
+        change (fractional slowdown). Games missing from the baseline are
+        skipped.
+
+    Raises:
+        ValueError: If the workloads differ, so timings are not comparable
+    """
+    if report["config"] != baseline["config"]:
+        raise ValueError(
+            f"Benchmark config {report['config']} differs from the baseline "
+            f"config {baseline['config']}"
+        )
+
+    regressions = []
+    for game, current in report["results"].items():
+        previous = baseline["results"].get(game)
+        if previous is None:
+            continue
+        if current["steps"] != previous["steps"]:
+            raise ValueError(
+                f"{game}: played {current['steps']} steps but the baseline played "
+                f"{previous['steps']}; the environment's behavior changed, re-record "
+                "the baseline"
+            )
+        for metric in TIMED_METRICS:
+            if not previous[metric]:
+                continue
+            change = current[metric] / previous[metric] - 1.0
+            if change > threshold:
+                regressions.append(
+                    {
+                        "game": game,
+                        "metric": metric,
+                        "baseline": previous[metric],
+                        "current": current[metric],
+                        "change": change,
+                    }
+                )
+    return regressions
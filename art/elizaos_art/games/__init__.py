@@ -23,6 +23,7 @@ from elizaos_art.games.codenames import (
 from elizaos_art.games.game_2048 import (
     Game2048Agent,
     Game2048Environment,
+    Game2048ExpectimaxAgent,
     Game2048HeuristicAgent,
     Game2048RandomAgent,
 )
@@ -43,6 +44,7 @@ __all__ = [
     "Game2048Environment",
     "Game2048Agent",
     "Game2048HeuristicAgent",
+    "Game2048ExpectimaxAgent",
     "Game2048RandomAgent",
     # Tic-Tac-Toe
     "TicTacToeEnvironment",
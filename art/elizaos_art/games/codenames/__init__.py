@@ -9,6 +9,7 @@ from elizaos_art.games.codenames.agent import (
     CodenamesGuesserAgent,
     CodenamesSpymasterAgent,
 )
+from elizaos_art.games.codenames.embeddings import CodenamesEmbeddings
 from elizaos_art.games.codenames.environment import CodenamesEnvironment
 from elizaos_art.games.codenames.types import (
     CardColor,
@@ -23,6 +24,7 @@ __all__ = [
     "CodenamesAgent",
     "CodenamesSpymasterAgent",
     "CodenamesGuesserAgent",
+    "CodenamesEmbeddings",
     "CodenamesState",
     "CodenamesAction",
     "CardColor",
@@ -5,13 +5,55 @@ Codenames Agents for ART Training
 import re
 
 from elizaos_art.base import BaseAgent
+from elizaos_art.games.codenames.embeddings import get_default_embeddings
 from elizaos_art.games.codenames.types import (
     CardColor,
+    Clue,
     CodenamesAction,
     CodenamesState,
     Role,
 )
 
+# Below this clue similarity a guesser stops once it has guessed once
+MIN_GUESS_SIMILARITY = 0.1
+
+
+def embedding_guess(
+    state: CodenamesState,
+    available_actions: list[CodenamesAction],
+) -> CodenamesAction | None:
+    """
+    Guess the unrevealed word closest to the clue in the embedding.
+
+    Passes once the clue's number of words has been guessed (the bonus
+    guess is left unused) or when the best remaining word is only weakly
+    related to the clue.
+
+    Returns:
+        The action, or None if there is no clue or it is not in the
+        embedding
+    """
+    clue = state.current_clue
+    if clue is None:
+        return None
+    ranked = get_default_embeddings().rank_words(state, clue.word)
+    if not ranked:
+        return None
+
+    guessed = clue.number + 1 - state.guesses_remaining
+    can_pass = CodenamesAction.PASS in available_actions
+    if guessed >= clue.number and can_pass:
+        return CodenamesAction.PASS
+
+    for idx, similarity in ranked:
+        action = CodenamesAction.from_word_index(idx)
+        if action not in available_actions:
+            continue
+        if similarity < MIN_GUESS_SIMILARITY and guessed > 0 and can_pass:
+            return CodenamesAction.PASS
+        return action
+    return None
+
 
 class CodenamesAgent(BaseAgent[CodenamesState, CodenamesAction]):
     """
@@ -122,7 +164,11 @@ What is your action?"""
     ) -> CodenamesAction:
         """Heuristic decision for standalone use."""
         if state.current_role == Role.GUESSER and state.current_clue:
-            # Simple heuristic: pick first available unrevealed word
+            action = embedding_guess(state, available_actions)
+            if action is not None:
+                return action
+
+            # Unknown clue: pick first available unrevealed word
             for action in available_actions:
                 if action != CodenamesAction.PASS and action != CodenamesAction.GIVE_CLUE:
                     return action
@@ -199,6 +245,10 @@ Give a clue (WORD NUMBER):"""
     ) -> CodenamesAction:
         return CodenamesAction.GIVE_CLUE
 
+    def suggest_clue(self, state: CodenamesState) -> Clue | None:
+        """Embedding-baseline clue for the current team (set it on the environment)."""
+        return get_default_embeddings().choose_clue(state)
+
 
 class CodenamesGuesserAgent(BaseAgent[CodenamesState, CodenamesAction]):
     """
@@ -273,8 +323,11 @@ Which word best matches the clue? (number or PASS):"""
         state: CodenamesState,
         available_actions: list[CodenamesAction],
     ) -> CodenamesAction:
-        """Heuristic fallback."""
-        # Pick first unrevealed word
+        """Heuristic fallback: embedding guess, else first unrevealed word."""
+        action = embedding_guess(state, available_actions)
+        if action is not None:
+            return action
+
         for action in available_actions:
             if action != CodenamesAction.PASS and action != CodenamesAction.GIVE_CLUE:
                 return action
@@ -0,0 +1,328 @@
+"""
+Word embeddings for Codenames baselines.
+
+Keeps a precomputed clue x board-word similarity matrix so a spymaster
+can score every candidate clue against the team, opponent, neutral and
+assassin words of a board at once, and a guesser can rank the board
+against a clue.
+
+Vectors come from one of two local sources:
+
+- `from_associations` (default): a deterministic stand-in built from the
+  bundled `data/associations.json`, which lists the board words each
+  clue hints at. Each word is embedded by the clues it belongs to (plus
+  a small hashed component so no two words coincide), and each clue by
+  the sum of its words, so similarity is graded by shared associations.
+- `from_vectors_file`: pretrained vectors in GloVe text format
+  (`word v1 v2 ...` per line), restricted to the board words and a clue
+  vocabulary.
+
+Only the standard library is used: the matrix is precomputed as one
+column (similarity to every clue) per board word, and per-board scoring
+works on whole columns with `map`/`zip`, so only the few clues tied for
+the most targets are scored one by one.
+"""
+
+import hashlib
+import json
+import math
+import struct
+from operator import itemgetter, mul, sub
+from pathlib import Path
+
+from elizaos_art.games.codenames.types import (
+    DEFAULT_WORD_LIST,
+    CardColor,
+    Clue,
+    CodenamesState,
+)
+
+DEFAULT_ASSOCIATIONS_PATH = Path(__file__).parent / "data" / "associations.json"
+
+_default_embeddings: "CodenamesEmbeddings | None" = None
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
+
+
+def _hash_vector(word: str, dim: int) -> list[float]:
+    """Deterministic pseudo-random vector in [-1, 1]^dim for a word."""
+    values: list[float] = []
+    counter = 0
+    while len(values) < dim:
+        digest = hashlib.sha256(f"{word}:{counter}".encode()).digest()
+        values.extend(x / 2**31 - 1.0 for x in struct.unpack("<8I", digest))
+        counter += 1
+    return values[:dim]
+
+
+class CodenamesEmbeddings:
+    """
+    Clue and word vectors with a cached clue x word similarity matrix.
+
+    Args:
+        word_vectors: Vectors for board words (uppercase keys)
+        clue_vectors: Vectors for the clue vocabulary (uppercase keys)
+        candidates_per_word: Nearest clues per word that a spymaster
+            considers when the word is one of its team's
+    """
+
+    def __init__(
+        self,
+        word_vectors: dict[str, list[float]],
+        clue_vectors: dict[str, list[float]],
+        candidates_per_word: int = 8,
+    ):
+        self.candidates_per_word = candidates_per_word
+        self.clues = list(clue_vectors)
+        self._clue_index = {clue: i for i, clue in enumerate(self.clues)}
+        self._clue_vectors = [_normalize(list(v)) for v in clue_vectors.values()]
+        self._word_vectors = {word: _normalize(list(v)) for word, v in word_vectors.items()}
+        self.dim = len(self._clue_vectors[0]) if self._clue_vectors else 0
+        # Board word -> similarity to every clue (one column of the matrix)
+        self._columns: dict[str, list[float]] = {}
+        self._nearest: dict[str, frozenset[int]] = {}
+        for word in self._word_vectors:
+            self.column(word)
+
+    @classmethod
+    def from_associations(
+        cls,
+        path: str | Path = DEFAULT_ASSOCIATIONS_PATH,
+        words: list[str] | None = None,
+        noise_dims: int = 16,
+        noise_scale: float = 0.25,
+    ) -> "CodenamesEmbeddings":
+        """
+        Build the deterministic stand-in embedding from an association file.
+
+        Args:
+            path: JSON file with {"associations": {clue: [word, ...]}}
+            words: Board words to embed (default: DEFAULT_WORD_LIST)
+            noise_dims: Extra hashed dimensions per word
+            noise_scale: Weight of the hashed dimensions
+        """
+        with open(path) as f:
+            associations = {
+                clue.upper(): [w.upper() for w in clue_words]
+                for clue, clue_words in json.load(f)["associations"].items()
+            }
+
+        clue_dims = {clue: i for i, clue in enumerate(associations)}
+        dim = len(clue_dims) + noise_dims
+        memberships: dict[str, list[str]] = {}
+        for clue, clue_words in associations.items():
+            for word in clue_words:
+                memberships.setdefault(word, []).append(clue)
+
+        word_vectors = {}
+        for word in words or DEFAULT_WORD_LIST:
+            word = word.upper()
+            vector = [0.0] * dim
+            for clue in memberships.get(word, []):
+                vector[clue_dims[clue]] = 1.0
+            noise = _hash_vector(word, noise_dims)
+            vector[len(clue_dims) :] = [noise_scale * x for x in noise]
+            word_vectors[word] = vector
+
+        clue_vectors = {}
+        for clue, clue_words in associations.items():
+            vector = [0.0] * dim
+            for word in clue_words:
+                for i, x in enumerate(word_vectors.get(word) or ()):
+                    vector[i] += x
+            clue_vectors[clue] = vector
+
+        return cls(word_vectors, clue_vectors)
+
+    @classmethod
+    def from_vectors_file(
+        cls,
+        path: str | Path,
+        clues: list[str],
+        words: list[str] | None = None,
+    ) -> "CodenamesEmbeddings":
+        """
+        Load pretrained vectors in GloVe text format.
+
+        Args:
+            path: Text file with one `word v1 v2 ...` entry per line
+            clues: Clue vocabulary to keep
+            words: Board words to keep (default: DEFAULT_WORD_LIST)
+
+        Raises:
+            ValueError: If none of the clues are in the file
+        """
+        wanted_words = {w.upper() for w in (words or DEFAULT_WORD_LIST)}
+        wanted_clues = {c.upper() for c in clues} - wanted_words
+        word_vectors: dict[str, list[float]] = {}
+        clue_vectors: dict[str, list[float]] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                token, _, rest = line.rstrip().partition(" ")
+                token = token.upper()
+                if token in wanted_words:
+                    word_vectors[token] = [float(x) for x in rest.split()]
+                elif token in wanted_clues:
+                    clue_vectors[token] = [float(x) for x in rest.split()]
+
+        if not clue_vectors:
+            raise ValueError(f"None of the clue words were found in {path}")
+        return cls(word_vectors, clue_vectors)
+
+    def _vector(self, word: str) -> list[float]:
+        vector = self._word_vectors.get(word)
+        if vector is None:
+            # Words outside the embedding are unrelated to every clue
+            vector = _normalize(_hash_vector(word, self.dim))
+            self._word_vectors[word] = vector
+        return vector
+
+    def column(self, word: str) -> list[float]:
+        """Cosine similarity of a board word to every clue, in `clues` order."""
+        column = self._columns.get(word)
+        if column is None:
+            vector = self._vector(word)
+            column = [sum(map(mul, c, vector)) for c in self._clue_vectors]
+            self._columns[word] = column
+        return column
+
+    def _top_clues(self, word: str) -> frozenset[int]:
+        nearest = self._nearest.get(word)
+        if nearest is None:
+            column = self.column(word)
+            ranked = sorted(range(len(column)), key=column.__getitem__, reverse=True)
+            nearest = frozenset(ranked[: self.candidates_per_word])
+            self._nearest[word] = nearest
+        return nearest
+
+    def similarity(self, clue: str, word: str) -> float | None:
+        """Similarity of a clue to a board word, or None for unknown clues."""
+        clue = clue.upper()
+        index = self._clue_index.get(clue)
+        if index is not None:
+            return self.column(word.upper())[index]
+        if clue in self._word_vectors:
+            vector = self._word_vectors[clue]
+            return sum(map(mul, vector, self._vector(word.upper())))
+        return None
+
+    def choose_clue(
+        self,
+        state: CodenamesState,
+        team: CardColor | None = None,
+        max_number: int = 3,
+        margin: float = 0.05,
+        assassin_margin: float = 0.1,
+    ) -> Clue | None:
+        """
+        Pick the clue that safely points at the most team words.
+
+        Candidates are the nearest `candidates_per_word` clues of each
+        unrevealed team word, minus board words. For every candidate, the
+        danger threshold is its highest similarity to an unrevealed
+        opponent or neutral word (or to the assassin plus
+        `assassin_margin`). Team words above the threshold by `margin`
+        are its targets; the clue with the most targets wins, ties going
+        to the widest gap between the weakest target and the threshold.
+
+        Args:
+            state: Board to give a clue for
+            team: Team giving the clue (default: the current team)
+            max_number: Most words a single clue may target
+            margin: Required similarity gap over the danger threshold
+            assassin_margin: Extra gap required over the assassin
+
+        Returns:
+            The clue, or None if the team has no words left (or every
+            clue is a board word)
+        """
+        team = state.current_team if team is None else team
+        team_words: list[str] = []
+        bad_words: list[str] = []
+        assassin_words: list[str] = []
+        for i, word in enumerate(state.words):
+            if state.revealed[i]:
+                continue
+            color = state.colors[i]
+            if color == team:
+                team_words.append(word.upper())
+            elif color == CardColor.ASSASSIN:
+                assassin_words.append(word.upper())
+            else:
+                bad_words.append(word.upper())
+
+        # Only clues among some team word's nearest ones can have targets
+        on_board = {self._clue_index.get(word.upper()) for word in state.words}
+        candidates = sorted(
+            set().union(*(self._top_clues(word) for word in team_words)) - on_board
+        )
+        if not candidates:
+            return None
+
+        # Gather the candidate rows of every board word's column at once
+        gather = itemgetter(*candidates) if len(candidates) > 1 else lambda c: (c[candidates[0]],)
+        team_cols = [gather(self.column(word)) for word in team_words]
+        bad_cols = [gather(self.column(word)) for word in bad_words]
+        for word in assassin_words:
+            bad_cols.append([s + assassin_margin for s in gather(self.column(word))])
+
+        if len(bad_cols) > 1:
+            danger = list(map(max, *bad_cols))
+        else:
+            danger = bad_cols[0] if bad_cols else [-1.0] * len(candidates)
+
+        # Gap of every team word over each clue's threshold, and how many
+        # team words clear it, computed a whole column at a time
+        gap_cols = [list(map(sub, column, danger)) for column in team_cols]
+        counts = map(sum, zip(*(map(margin.__lt__, gaps) for gaps in gap_cols)))
+        capped = [min(count, max_number) for count in counts]
+        best_count = max(capped)
+
+        best_gap: float | None = None
+        best_index = 0
+        for row, count in enumerate(capped):
+            if count != best_count:
+                continue
+            gaps = sorted((gaps[row] for gaps in gap_cols), reverse=True)
+            gap = gaps[count - 1] if count else gaps[0]
+            if best_gap is None or gap > best_gap:
+                best_gap = gap
+                best_index = candidates[row]
+
+        return Clue(word=self.clues[best_index], number=max(1, best_count))
+
+    def rank_words(self, state: CodenamesState, clue: str) -> list[tuple[int, float]]:
+        """
+        Rank unrevealed board words by similarity to a clue.
+
+        Returns:
+            (word index, similarity) pairs, most similar first; empty if
+            the clue is not in the embedding
+        """
+        clue = clue.upper()
+        index = self._clue_index.get(clue)
+        if index is None and clue not in self._word_vectors:
+            return []
+
+        ranked = []
+        for i, word in enumerate(state.words):
+            if state.revealed[i]:
+                continue
+            if index is not None:
+                score = self.column(word.upper())[index]
+            else:
+                score = self.similarity(clue, word)
+            ranked.append((i, score))
+        ranked.sort(key=lambda pair: pair[1], reverse=True)
+        return ranked
+
+
+def get_default_embeddings() -> CodenamesEmbeddings:
+    """Shared stand-in embedding built from the bundled association file."""
+    global _default_embeddings
+    if _default_embeddings is None:
+        _default_embeddings = CodenamesEmbeddings.from_associations()
+    return _default_embeddings
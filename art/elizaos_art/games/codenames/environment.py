@@ -8,6 +8,7 @@ import random
 from typing import ClassVar
 
 from elizaos_art.base import BaseEnvironment
+from elizaos_art.games.codenames.embeddings import get_default_embeddings
 from elizaos_art.games.codenames.types import (
     CardColor,
     Clue,
@@ -267,31 +268,19 @@ class CodenamesEnvironment(BaseEnvironment[CodenamesState, CodenamesAction]):
             winner=state.winner,
         )
 
-        # If AI is guesser, generate opponent clue
-        if self.config.ai_role == Role.GUESSER and new_state.current_team == self.config.ai_team:
+        # If AI is guesser, the spymaster of whichever team is up gives a clue
+        if self.config.ai_role == Role.GUESSER:
             new_state = self._generate_opponent_clue(new_state)
 
         return new_state
 
     def _generate_opponent_clue(self, state: CodenamesState) -> CodenamesState:
-        """Generate a simple clue from opponent spymaster."""
-        if self._rng is None:
-            self._rng = random.Random()
-
-        # Find unrevealed words for current team
-        team_words = []
-        for i in range(self.BOARD_SIZE):
-            if not state.revealed[i] and CardColor(state.colors[i]) == state.current_team:
-                team_words.append(i)
-
-        if not team_words:
+        """Generate a clue from the simulated spymaster (embedding baseline)."""
+        clue = get_default_embeddings().choose_clue(state)
+        if clue is None:
             # No words left
             return state
 
-        # Simple clue: pick 1-2 random words
-        num_words = min(2, len(team_words))
-        clue = Clue(word="HINT", number=num_words)
-
         return CodenamesState(
             words=state.words,
             colors=state.colors,
@@ -299,7 +288,7 @@ class CodenamesEnvironment(BaseEnvironment[CodenamesState, CodenamesAction]):
             current_team=state.current_team,
             current_role=Role.GUESSER,
             current_clue=clue,
-            guesses_remaining=num_words + 1,
+            guesses_remaining=clue.number + 1,
             red_remaining=state.red_remaining,
             blue_remaining=state.blue_remaining,
             game_over=state.game_over,
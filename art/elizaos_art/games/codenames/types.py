@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from enum import IntEnum, Enum
 from typing import ClassVar
 
-from elizaos_art.base import Action, State
+from elizaos_art.base import Action, State, memoized_render
 
 
 class CardColor(IntEnum):
@@ -72,7 +72,7 @@ class CodenamesAction(IntEnum):
         raise ValueError(f"Invalid word index: {idx}")
 
 
-@dataclass
+@dataclass(frozen=True)
 class Clue:
     """A clue given by the spymaster."""
 
@@ -127,59 +127,30 @@ class CodenamesState(State):
         """Check if word at index is revealed."""
         return self.revealed[idx]
 
+    @memoized_render
     def to_prompt(self) -> str:
         """Convert state to prompt string."""
-        lines = []
-
         if self.current_role == Role.SPYMASTER:
-            lines.append("# Codenames Board (Spymaster View)")
-            lines.append("You can see the true colors of all words.")
-            lines.append("")
-            lines.append("```")
-            for row in range(self.SIZE):
-                row_parts = []
-                for col in range(self.SIZE):
-                    idx = row * self.SIZE + col
-                    word = self.words[idx]
-                    color = CardColor(self.colors[idx])
-                    if self.revealed[idx]:
-                        row_parts.append(f"[{word}]")  # Revealed
-                    else:
-                        color_marker = {"RED": "R", "BLUE": "B", "NEUTRAL": "N", "ASSASSIN": "X"}
-                        row_parts.append(f"{word}({color_marker[color.name]})")
-                lines.append("  ".join(f"{p:15}" for p in row_parts))
-            lines.append("```")
-            lines.append("")
-            lines.append(f"Your team: {self.current_team.name}")
-            lines.append(f"Red remaining: {self.red_remaining}, Blue remaining: {self.blue_remaining}")
-            lines.append("")
-            lines.append("Give a clue: a single word and a number (how many words it relates to).")
-        else:
-            lines.append("# Codenames Board (Guesser View)")
-            lines.append("")
-            if self.current_clue:
-                lines.append(f"## Clue: {self.current_clue}")
-                lines.append(f"Guesses remaining: {self.guesses_remaining}")
-            lines.append("")
-            lines.append("```")
-            for row in range(self.SIZE):
-                row_parts = []
-                for col in range(self.SIZE):
-                    idx = row * self.SIZE + col
-                    word = self.words[idx]
-                    if self.revealed[idx]:
-                        color = CardColor(self.colors[idx])
-                        row_parts.append(f"[{color.name[0]}:{word}]")
-                    else:
-                        row_parts.append(f"{idx}:{word}")
-                lines.append("  ".join(f"{p:15}" for p in row_parts))
-            lines.append("```")
-            lines.append("")
-            lines.append(f"Your team: {self.current_team.name}")
-            lines.append("")
-            lines.append("Select a word by its number, or PASS to end your turn.")
-
-        return "\n".join(lines)
+            cells = [
+                f"[{word}]" if revealed else f"{word}({_COLOR_MARKERS[color]})"
+                for word, color, revealed in zip(self.words, self.colors, self.revealed)
+            ]
+            return _SPYMASTER_PROMPT.format(
+                *cells, self.current_team.name, self.red_remaining, self.blue_remaining
+            )
+
+        cells = [
+            f"[{_COLOR_NAMES[color][0]}:{word}]" if revealed else f"{idx}:{word}"
+            for idx, (word, color, revealed) in enumerate(
+                zip(self.words, self.colors, self.revealed)
+            )
+        ]
+        clue = (
+            f"## Clue: {self.current_clue}\nGuesses remaining: {self.guesses_remaining}\n"
+            if self.current_clue
+            else ""
+        )
+        return _GUESSER_PROMPT.format(clue, *cells, self.current_team.name)
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -203,34 +174,22 @@ class CodenamesState(State):
         """Check if game is over."""
         return self.game_over
 
+    @memoized_render
     def render(self) -> str:
         """Render board for display."""
-        lines = []
-        lines.append("┌" + "─" * 77 + "┐")
-
-        for row in range(self.SIZE):
-            row_str = "│"
-            for col in range(self.SIZE):
-                idx = row * self.SIZE + col
-                word = self.words[idx][:12]  # Truncate long words
-
-                if self.revealed[idx]:
-                    color = CardColor(self.colors[idx])
-                    markers = {
-                        CardColor.RED: "🔴",
-                        CardColor.BLUE: "🔵",
-                        CardColor.NEUTRAL: "⚪",
-                        CardColor.ASSASSIN: "💀",
-                    }
-                    row_str += f" {markers[color]} {word:12} │"
-                else:
-                    row_str += f" {idx:2}:{word:11} │"
-            lines.append(row_str)
-            if row < self.SIZE - 1:
-                lines.append("├" + "─" * 77 + "┤")
-
-        lines.append("└" + "─" * 77 + "┘")
-        lines.append(f"Turn: {self.current_team.name} | Red: {self.red_remaining} | Blue: {self.blue_remaining}")
+        cells = [
+            f" {_RENDER_MARKERS[color]} {word[:12]:12} "
+            if revealed
+            else f" {idx:2}:{word[:12]:11} "
+            for idx, (word, color, revealed) in enumerate(
+                zip(self.words, self.colors, self.revealed)
+            )
+        ]
+        lines = [_RENDER_BOARD.format(*cells)]
+        lines.append(
+            f"Turn: {self.current_team.name} | Red: {self.red_remaining} | "
+            f"Blue: {self.blue_remaining}"
+        )
 
         if self.current_clue:
             lines.append(f"Clue: {self.current_clue} | Guesses left: {self.guesses_remaining}")
@@ -241,6 +200,66 @@ class CodenamesState(State):
         return "\n".join(lines)
 
 
+# Precompiled templates for CodenamesState.to_prompt / render
+_COLOR_NAMES = {color.value: color.name for color in CardColor}
+_COLOR_MARKERS = {
+    CardColor.RED.value: "R",
+    CardColor.BLUE.value: "B",
+    CardColor.NEUTRAL.value: "N",
+    CardColor.ASSASSIN.value: "X",
+}
+_RENDER_MARKERS = {
+    CardColor.RED.value: "🔴",
+    CardColor.BLUE.value: "🔵",
+    CardColor.NEUTRAL.value: "⚪",
+    CardColor.ASSASSIN.value: "💀",
+}
+
+_PROMPT_GRID = "\n".join(["  ".join(["{:15}"] * CodenamesState.SIZE)] * CodenamesState.SIZE)
+
+_SPYMASTER_PROMPT = "\n".join(
+    [
+        "# Codenames Board (Spymaster View)",
+        "You can see the true colors of all words.",
+        "",
+        "```",
+        _PROMPT_GRID,
+        "```",
+        "",
+        "Your team: {}",
+        "Red remaining: {}, Blue remaining: {}",
+        "",
+        "Give a clue: a single word and a number (how many words it relates to).",
+    ]
+)
+
+_GUESSER_PROMPT = "\n".join(
+    [
+        "# Codenames Board (Guesser View)",
+        "",
+        # Optional clue block (with its trailing newline) is substituted here
+        "{}",
+        "```",
+        _PROMPT_GRID,
+        "```",
+        "",
+        "Your team: {}",
+        "",
+        "Select a word by its number, or PASS to end your turn.",
+    ]
+)
+
+_RENDER_BOARD = "\n".join(
+    [
+        "┌" + "─" * 77 + "┐",
+        ("\n├" + "─" * 77 + "┤\n").join(
+            ["│" + "│".join(["{}"] * CodenamesState.SIZE) + "│"] * CodenamesState.SIZE
+        ),
+        "└" + "─" * 77 + "┘",
+    ]
+)
+
+
 @dataclass
 class CodenamesConfig:
     """Configuration for Codenames game."""
@@ -10,12 +10,14 @@ from elizaos_art.games.game_2048.agent import (
     Game2048RandomAgent,
 )
 from elizaos_art.games.game_2048.environment import Game2048Environment
+from elizaos_art.games.game_2048.expectimax import Game2048ExpectimaxAgent
 from elizaos_art.games.game_2048.types import Game2048Action, Game2048State
 
 __all__ = [
     "Game2048Environment",
     "Game2048Agent",
     "Game2048HeuristicAgent",
+    "Game2048ExpectimaxAgent",
     "Game2048RandomAgent",
     "Game2048State",
     "Game2048Action",
@@ -0,0 +1,412 @@
+"""
+Expectimax agent for 2048.
+
+A strong, model-free reference policy for benchmarks and for generating
+demonstration data.
+
+- Boards are packed into a 64-bit int (4 bits per tile exponent, row-major,
+  column 0 in the low nibble of each row), so a move is four lookups in a
+  precomputed 65536-entry row table.
+- Leaves are scored by a row/column heuristic (empty cells, merges,
+  monotonicity, tile sum) that is invariant under rotation and reflection.
+- Chance nodes are cached in a transposition table keyed by the
+  canonical board (the smallest of its 8 symmetric variants), so the
+  same position reached in a mirrored or rotated form is searched once.
+- Search deepens iteratively until `max_depth` or the per-move time
+  budget, and skips chance branches whose probability falls below
+  `prob_cutoff`.
+
+Tiles are capped at 2^15 (32768) by the 4-bit encoding.
+"""
+
+import time
+
+from elizaos_art.base import BaseAgent
+from elizaos_art.games.game_2048.types import Game2048Action, Game2048State
+
+ROW_MASK = 0xFFFF
+COL_MASK = 0x000F_000F_000F_000F
+
+# Heuristic weights (from the well-known expectimax 2048 AI)
+_LOST_PENALTY = 200000.0
+_MONOTONICITY_POWER = 4.0
+_MONOTONICITY_WEIGHT = 47.0
+_SUM_POWER = 3.5
+_SUM_WEIGHT = 11.0
+_MERGES_WEIGHT = 700.0
+_EMPTY_WEIGHT = 270.0
+
+_tables: tuple[list[int], list[int], list[int], list[int], list[float]] | None = None
+
+
+def _unpack_row(row: int) -> list[int]:
+    return [(row >> (4 * i)) & 0xF for i in range(4)]
+
+
+def _pack_row(line: list[int]) -> int:
+    return line[0] | line[1] << 4 | line[2] << 8 | line[3] << 12
+
+
+def _row_heuristic(line: list[int]) -> float:
+    total = 0.0
+    empty = 0
+    merges = 0
+    prev = 0
+    counter = 0
+    for rank in line:
+        total += rank**_SUM_POWER
+        if rank == 0:
+            empty += 1
+        else:
+            if prev == rank:
+                counter += 1
+            elif counter > 0:
+                merges += 1 + counter
+                counter = 0
+            prev = rank
+    if counter > 0:
+        merges += 1 + counter
+
+    mono_left = 0.0
+    mono_right = 0.0
+    for i in range(1, 4):
+        if line[i - 1] > line[i]:
+            mono_left += line[i - 1] ** _MONOTONICITY_POWER - line[i] ** _MONOTONICITY_POWER
+        else:
+            mono_right += line[i] ** _MONOTONICITY_POWER - line[i - 1] ** _MONOTONICITY_POWER
+
+    return (
+        _LOST_PENALTY
+        + _EMPTY_WEIGHT * empty
+        + _MERGES_WEIGHT * merges
+        - _MONOTONICITY_WEIGHT * min(mono_left, mono_right)
+        - _SUM_WEIGHT * total
+    )
+
+
+def _build_tables() -> tuple[list[int], list[int], list[int], list[int], list[float]]:
+    """Build row tables: move left, move right, merge score, reverse, heuristic."""
+    size = 1 << 16
+    left = [0] * size
+    right = [0] * size
+    score = [0] * size
+    reverse = [0] * size
+    heuristic = [0.0] * size
+
+    for row in range(size):
+        line = _unpack_row(row)
+        reverse[row] = _pack_row(line[::-1])
+        heuristic[row] = _row_heuristic(line)
+
+        tiles = [rank for rank in line if rank]
+        merged: list[int] = []
+        row_score = 0
+        i = 0
+        while i < len(tiles):
+            if i + 1 < len(tiles) and tiles[i] == tiles[i + 1] and tiles[i] < 15:
+                merged.append(tiles[i] + 1)
+                row_score += 1 << (tiles[i] + 1)
+                i += 2
+            else:
+                merged.append(tiles[i])
+                i += 1
+        merged += [0] * (4 - len(merged))
+        left[row] = _pack_row(merged)
+        score[row] = row_score
+
+    for row in range(size):
+        right[row] = reverse[left[reverse[row]]]
+
+    return left, right, score, reverse, heuristic
+
+
+def _get_tables() -> tuple[list[int], list[int], list[int], list[int], list[float]]:
+    global _tables
+    if _tables is None:
+        _tables = _build_tables()
+    return _tables
+
+
+def encode_board(board: tuple[int, ...] | list[int]) -> int:
+    """Pack a 16-cell board of tile values into a 64-bit int of exponents."""
+    packed = 0
+    for i, value in enumerate(board):
+        if value:
+            packed |= min(value.bit_length() - 1, 15) << (4 * i)
+    return packed
+
+
+def decode_board(packed: int) -> tuple[int, ...]:
+    """Unpack a 64-bit board into 16 tile values."""
+    return tuple(
+        (1 << rank) if rank else 0 for rank in ((packed >> (4 * i)) & 0xF for i in range(16))
+    )
+
+
+def transpose(board: int) -> int:
+    """Transpose a packed board (swap rows and columns)."""
+    a1 = board & 0xF0F0_0F0F_F0F0_0F0F
+    a2 = board & 0x0000_F0F0_0000_F0F0
+    a3 = board & 0x0F0F_0000_0F0F_0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00_FF00_00FF_00FF
+    b2 = a & 0x00FF_00FF_0000_0000
+    b3 = a & 0x0000_0000_FF00_FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def _map_rows(board: int, table: list[int]) -> int:
+    return (
+        table[board & ROW_MASK]
+        | table[(board >> 16) & ROW_MASK] << 16
+        | table[(board >> 32) & ROW_MASK] << 32
+        | table[(board >> 48) & ROW_MASK] << 48
+    )
+
+
+def _flip_vertical(board: int) -> int:
+    return (
+        (board & ROW_MASK) << 48
+        | ((board >> 16) & ROW_MASK) << 32
+        | ((board >> 32) & ROW_MASK) << 16
+        | (board >> 48) & ROW_MASK
+    )
+
+
+def canonical_board(board: int) -> int:
+    """Smallest of the 8 rotations/reflections of a packed board."""
+    reverse = _get_tables()[3]
+    best = board
+    for variant in (board, transpose(board)):
+        mirrored = _map_rows(variant, reverse)
+        flipped = _flip_vertical(variant)
+        best = min(best, variant, mirrored, flipped, _flip_vertical(mirrored))
+    return best
+
+
+def move_board(board: int, action: Game2048Action) -> tuple[int, int]:
+    """
+    Apply a move to a packed board.
+
+    Returns:
+        Tuple of (new_board, score_delta); the board is unchanged if the
+        move is not legal
+    """
+    left, right, score, _, _ = _get_tables()
+    if action == Game2048Action.LEFT:
+        rows, table = board, left
+    elif action == Game2048Action.RIGHT:
+        rows, table = board, right
+    else:
+        rows = transpose(board)
+        table = left if action == Game2048Action.UP else right
+
+    moved = _map_rows(rows, table)
+    delta = (
+        score[rows & ROW_MASK]
+        + score[(rows >> 16) & ROW_MASK]
+        + score[(rows >> 32) & ROW_MASK]
+        + score[(rows >> 48) & ROW_MASK]
+    )
+    if action in (Game2048Action.UP, Game2048Action.DOWN):
+        moved = transpose(moved)
+    return moved, delta
+
+
+def evaluate_board(board: int) -> float:
+    """Heuristic value of a packed board (rows plus columns)."""
+    heuristic = _get_tables()[4]
+    columns = transpose(board)
+    return (
+        heuristic[board & ROW_MASK]
+        + heuristic[(board >> 16) & ROW_MASK]
+        + heuristic[(board >> 32) & ROW_MASK]
+        + heuristic[(board >> 48) & ROW_MASK]
+        + heuristic[columns & ROW_MASK]
+        + heuristic[(columns >> 16) & ROW_MASK]
+        + heuristic[(columns >> 32) & ROW_MASK]
+        + heuristic[(columns >> 48) & ROW_MASK]
+    )
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+class Game2048ExpectimaxAgent(BaseAgent[Game2048State, Game2048Action]):
+    """
+    Depth-limited expectimax agent for 2048.
+
+    Args:
+        max_depth: Maximum search depth in player moves
+        time_budget_ms: Per-move time budget; deepening stops when it runs
+            out (None = always search to `max_depth`, fully deterministic)
+        prob_cutoff: Chance branches less likely than this are scored by
+            the heuristic instead of searched
+        spawn_4_probability: Probability that a spawned tile is a 4
+        max_table_entries: Transposition table size before it is cleared
+    """
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        time_budget_ms: float | None = 50.0,
+        prob_cutoff: float = 1e-4,
+        spawn_4_probability: float = 0.1,
+        max_table_entries: int = 500_000,
+    ):
+        self.max_depth = max(1, max_depth)
+        self.time_budget_ms = time_budget_ms
+        self.prob_cutoff = prob_cutoff
+        self.spawn_4_probability = spawn_4_probability
+        self.max_table_entries = max_table_entries
+
+        _get_tables()
+        self._table: dict[int, tuple[int, float]] = {}
+        self._deadline: float | None = None
+        self._stats = {
+            "moves": 0,
+            "nodes": 0,
+            "search_s": 0.0,
+            "table_hits": 0,
+            "table_lookups": 0,
+            "depth_total": 0,
+        }
+
+    @property
+    def name(self) -> str:
+        return f"Game2048Expectimax(depth={self.max_depth})"
+
+    def get_system_prompt(self) -> str:
+        return ""
+
+    def format_action_prompt(
+        self,
+        state: Game2048State,
+        available_actions: list[Game2048Action],
+    ) -> str:
+        return ""
+
+    def parse_action(
+        self,
+        response: str,
+        available_actions: list[Game2048Action],
+    ) -> Game2048Action:
+        return available_actions[0]
+
+    async def decide(
+        self,
+        state: Game2048State,
+        available_actions: list[Game2048Action],
+    ) -> Game2048Action:
+        """Choose the move with the best expected value."""
+        return self.best_action(state, available_actions)
+
+    def best_action(
+        self,
+        state: Game2048State,
+        available_actions: list[Game2048Action],
+    ) -> Game2048Action:
+        """Synchronous search for the best move."""
+        board = encode_board(state.board)
+        start = time.perf_counter()
+        self._deadline = (
+            start + self.time_budget_ms / 1000 if self.time_budget_ms is not None else None
+        )
+        if len(self._table) > self.max_table_entries:
+            self._table.clear()
+
+        best = available_actions[0]
+        depth_reached = 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best = self._search_root(board, available_actions, depth, best)
+            except _SearchTimeout:
+                break
+            depth_reached = depth
+            # Depth 1 always completes so there is a considered move
+            if self._deadline is not None and time.perf_counter() > self._deadline:
+                break
+
+        self._stats["moves"] += 1
+        self._stats["depth_total"] += depth_reached
+        self._stats["search_s"] += time.perf_counter() - start
+        return best
+
+    def _search_root(
+        self,
+        board: int,
+        available_actions: list[Game2048Action],
+        depth: int,
+        previous_best: Game2048Action,
+    ) -> Game2048Action:
+        # Search the previous best move first, so a timeout mid-depth
+        # still leaves it as the fallback
+        ordered = sorted(available_actions, key=lambda a: a != previous_best)
+        best_action = previous_best
+        best_value = float("-inf")
+        for action in ordered:
+            moved, _ = move_board(board, action)
+            if moved == board:
+                continue
+            value = self._chance_node(moved, depth - 1, 1.0, depth > 1)
+            if value > best_value:
+                best_value = value
+                best_action = action
+        return best_action
+
+    def _chance_node(self, board: int, depth: int, prob: float, timed: bool) -> float:
+        stats = self._stats
+        stats["nodes"] += 1
+        if depth <= 0 or prob < self.prob_cutoff:
+            return evaluate_board(board)
+        if timed and self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        key = canonical_board(board)
+        stats["table_lookups"] += 1
+        cached = self._table.get(key)
+        if cached is not None and cached[0] >= depth:
+            stats["table_hits"] += 1
+            return cached[1]
+
+        empty = [i for i in range(16) if not (board >> (4 * i)) & 0xF]
+        if not empty:
+            # A full board after a move still has merges or is lost
+            return self._max_node(board, depth, prob, timed)
+
+        p4 = self.spawn_4_probability
+        p2 = 1.0 - p4
+        prob /= len(empty)
+        total = 0.0
+        for i in empty:
+            shift = 4 * i
+            total += p2 * self._max_node(board | (1 << shift), depth, prob * p2, timed)
+            total += p4 * self._max_node(board | (2 << shift), depth, prob * p4, timed)
+        value = total / len(empty)
+
+        self._table[key] = (depth, value)
+        return value
+
+    def _max_node(self, board: int, depth: int, prob: float, timed: bool) -> float:
+        self._stats["nodes"] += 1
+        best = 0.0  # No legal move: the game is lost
+        for action in Game2048Action:
+            moved, _ = move_board(board, action)
+            if moved != board:
+                best = max(best, self._chance_node(moved, depth - 1, prob, timed))
+        return best
+
+    def get_stats(self) -> dict:
+        """Search statistics, including nodes per second."""
+        stats = self._stats
+        lookups = stats["table_lookups"]
+        return {
+            "moves": stats["moves"],
+            "nodes": stats["nodes"],
+            "search_s": stats["search_s"],
+            "nodes_per_sec": stats["nodes"] / stats["search_s"] if stats["search_s"] else 0.0,
+            "mean_depth": stats["depth_total"] / stats["moves"] if stats["moves"] else 0.0,
+            "table_entries": len(self._table),
+            "table_hit_rate": stats["table_hits"] / lookups if lookups else 0.0,
+        }
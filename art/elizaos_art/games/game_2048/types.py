@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import ClassVar
 
-from elizaos_art.base import Action, State
+from elizaos_art.base import Action, State, memoized_render
 
 
 class Game2048Action(IntEnum):
@@ -77,21 +77,11 @@ class Game2048State(State):
         """Get value at (row, col)."""
         return self.board[row * self.SIZE + col]
 
+    @memoized_render
     def to_prompt(self) -> str:
         """Convert state to prompt string."""
-        lines = ["Current 2048 board:"]
-        lines.append("```")
-        for row in range(self.SIZE):
-            row_values = []
-            for col in range(self.SIZE):
-                val = self.get_cell(row, col)
-                row_values.append(str(val) if val > 0 else ".")
-            lines.append(" ".join(f"{v:>4}" for v in row_values))
-        lines.append("```")
-        lines.append(f"Score: {self.score}")
-        lines.append(f"Max tile: {self.max_tile}")
-        lines.append(f"Moves: {self.move_count}")
-        return "\n".join(lines)
+        cells = [str(val) if val > 0 else "." for val in self.board]
+        return _PROMPT_TEMPLATE.format(*cells, self.score, self.max_tile, self.move_count)
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -107,24 +97,37 @@ class Game2048State(State):
         """Check if game is over."""
         return self.game_over
 
+    @memoized_render
     def render(self) -> str:
         """Render board for display."""
-        lines = []
-        lines.append("┌" + "─────┬" * 3 + "─────┐")
-        for row in range(self.SIZE):
-            row_str = "│"
-            for col in range(self.SIZE):
-                val = self.get_cell(row, col)
-                if val == 0:
-                    row_str += "     │"
-                else:
-                    row_str += f"{val:^5}│"
-            lines.append(row_str)
-            if row < self.SIZE - 1:
-                lines.append("├" + "─────┼" * 3 + "─────┤")
-        lines.append("└" + "─────┴" * 3 + "─────┘")
-        lines.append(f"Score: {self.score}  Max: {self.max_tile}  Moves: {self.move_count}")
-        return "\n".join(lines)
+        cells = [val if val > 0 else "" for val in self.board]
+        return _RENDER_TEMPLATE.format(*cells, self.score, self.max_tile, self.move_count)
+
+
+# Precompiled templates for Game2048State.to_prompt / render
+_PROMPT_ROW = " ".join(["{:>4}"] * Game2048State.SIZE)
+_PROMPT_TEMPLATE = "\n".join(
+    [
+        "Current 2048 board:",
+        "```",
+        *[_PROMPT_ROW] * Game2048State.SIZE,
+        "```",
+        "Score: {}",
+        "Max tile: {}",
+        "Moves: {}",
+    ]
+)
+
+_RENDER_ROW = "│" + "│".join(["{:^5}"] * Game2048State.SIZE) + "│"
+_RENDER_SEPARATOR = "├" + "─────┼" * 3 + "─────┤"
+_RENDER_TEMPLATE = "\n".join(
+    [
+        "┌" + "─────┬" * 3 + "─────┐",
+        f"\n{_RENDER_SEPARATOR}\n".join([_RENDER_ROW] * Game2048State.SIZE),
+        "└" + "─────┴" * 3 + "─────┘",
+        "Score: {}  Max: {}  Moves: {}",
+    ]
+)
 
 
 @dataclass
@@ -9,6 +9,7 @@ from elizaos_art.games.temporal_clue.agent import (
     TemporalClueHeuristicAgent,
 )
 from elizaos_art.games.temporal_clue.environment import TemporalClueEnvironment
+from elizaos_art.games.temporal_clue.puzzle_bank import PuzzleBank
 from elizaos_art.games.temporal_clue.types import (
     TemporalClueAction,
     TemporalClueState,
@@ -20,6 +21,7 @@ __all__ = [
     "TemporalClueEnvironment",
     "TemporalClueAgent",
     "TemporalClueHeuristicAgent",
+    "PuzzleBank",
     "TemporalClueState",
     "TemporalClueAction",
     "TemporalClueConfig",
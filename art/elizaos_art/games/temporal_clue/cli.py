@@ -248,5 +248,31 @@ def pipeline(
     asyncio.run(run())
 
 
+@app.command("generate-bank")
+def generate_bank_command(
+    per_difficulty: int = typer.Option(256, help="Puzzles per difficulty"),
+    workers: int = typer.Option(1, help="Worker processes"),
+    seed: int = typer.Option(0, help="Base seed"),
+    output: str = typer.Option(None, help="Output file (default: the bundled bank)"),
+) -> None:
+    """Generate the solver-verified puzzle bank used by reset()."""
+    import time
+
+    from elizaos_art.games.temporal_clue.puzzle_bank import DEFAULT_BANK_PATH, generate_bank
+
+    start = time.perf_counter()
+    bank = generate_bank(per_difficulty=per_difficulty, workers=workers, seed=seed)
+    path = bank.save(output or DEFAULT_BANK_PATH)
+    elapsed = time.perf_counter() - start
+
+    table = Table(title="Puzzle Bank")
+    table.add_column("Difficulty", style="cyan")
+    table.add_column("Puzzles", justify="right")
+    for diff in Difficulty:
+        table.add_row(diff.value, str(bank.size(diff)))
+    console.print(table)
+    console.print(f"Wrote {path} in {elapsed:.1f}s")
+
+
 if __name__ == "__main__":
     app()
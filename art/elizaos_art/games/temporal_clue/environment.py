@@ -8,9 +8,14 @@ import random
 from typing import ClassVar
 
 from elizaos_art.base import BaseEnvironment
+from elizaos_art.games.temporal_clue.puzzle_bank import (
+    DEFAULT_BANK_PATH,
+    Puzzle,
+    generate_puzzle_for_seed,
+    get_puzzle_bank,
+    nearest_difficulties,
+)
 from elizaos_art.games.temporal_clue.types import (
-    Difficulty,
-    PUZZLE_SCENARIOS,
     TemporalClue,
     TemporalClueAction,
     TemporalClueConfig,
@@ -46,26 +51,27 @@ class TemporalClueEnvironment(BaseEnvironment[TemporalClueState, TemporalClueAct
         self._initialized = True
 
     async def reset(self, seed: int | None = None) -> TemporalClueState:
-        """Reset with a new puzzle."""
+        """
+        Reset with a new puzzle.
+
+        Puzzles come from the pre-generated bank, so a seed selects a
+        puzzle in O(1): `seed % bank size` among puzzles of the configured
+        difficulty. Custom scenarios are generated (and solver-verified)
+        on the fly instead.
+        """
         self._rng = random.Random(seed)
-
-        # Select or generate a puzzle
-        puzzle = self._generate_puzzle()
-
-        events = puzzle["events"]
-        correct_ordering = puzzle["correct_ordering"]
-        clues = self._generate_clues(events, correct_ordering)
+        puzzle = self._select_puzzle(seed)
 
         # Start with empty ordering
-        num_slots = len(events)
+        num_slots = len(puzzle.events)
         current_ordering: tuple[str | None, ...] = tuple([None] * num_slots)
 
         self._current_state = TemporalClueState(
-            events=tuple(events),
-            clues=tuple(clues),
+            events=puzzle.events,
+            clues=puzzle.clues,
             current_ordering=current_ordering,
-            unplaced_events=tuple(events),
-            correct_ordering=tuple(correct_ordering),
+            unplaced_events=puzzle.events,
+            correct_ordering=puzzle.correct_ordering,
             submitted=False,
             is_correct=False,
         )
@@ -157,92 +163,33 @@ class TemporalClueEnvironment(BaseEnvironment[TemporalClueState, TemporalClueAct
         """Render the state."""
         return state.render()
 
-    def _generate_puzzle(self) -> dict:
-        """Generate or select a puzzle."""
+    def _select_puzzle(self, seed: int | None) -> Puzzle:
+        """Look up a bank puzzle, or generate one from custom scenarios."""
         if self._rng is None:
-            self._rng = random.Random()
+            self._rng = random.Random(seed)
 
+        difficulty = self.config.difficulty
         if self.config.custom_scenarios:
-            scenario = self._rng.choice(self.config.custom_scenarios)
-        else:
-            scenario_name = self._rng.choice(list(PUZZLE_SCENARIOS.keys()))
-            scenario = PUZZLE_SCENARIOS[scenario_name]
-
-        events = list(scenario["events"])
-        correct_order = scenario.get("correct_order", list(range(len(events))))
-
-        # Map indices to actual event names in correct order
-        correct_ordering = [events[i] for i in correct_order]
-
-        # Limit based on difficulty
-        if self.config.difficulty == Difficulty.EASY:
-            max_events = min(4, len(events))
-        elif self.config.difficulty == Difficulty.MEDIUM:
-            max_events = min(6, len(events))
-        else:
-            max_events = min(8, len(events))
-
-        events = events[:max_events]
-        correct_ordering = correct_ordering[:max_events]
-
-        # Shuffle events for presentation
-        shuffled_events = events.copy()
-        self._rng.shuffle(shuffled_events)
-
-        return {
-            "events": shuffled_events,
-            "correct_ordering": correct_ordering,
-        }
-
-    def _generate_clues(
-        self, events: list[str], correct_ordering: list[str]
-    ) -> list[TemporalClue]:
-        """Generate clues based on correct ordering."""
-        if self._rng is None:
-            self._rng = random.Random()
-
-        clues = []
-        n = len(correct_ordering)
-
-        # Determine number of clues based on difficulty
-        if self.config.difficulty == Difficulty.EASY:
-            num_clues = n - 1  # Direct chain
-        elif self.config.difficulty == Difficulty.MEDIUM:
-            num_clues = n  # Some redundancy
+            # Small scenarios cannot reach every difficulty; fall back to
+            # the nearest one they can produce
+            puzzle_seed = f"custom:{self._rng.random()}"
+            for candidate in nearest_difficulties(difficulty):
+                try:
+                    return generate_puzzle_for_seed(
+                        candidate,
+                        seed=puzzle_seed,
+                        scenarios=self.config.custom_scenarios,
+                    )
+                except ValueError:
+                    continue
+            raise ValueError("Custom scenarios do not yield a puzzle of any difficulty")
+
+        bank = get_puzzle_bank(self.config.puzzle_bank_path or DEFAULT_BANK_PATH)
+        if seed is None:
+            index = self._rng.randrange(bank.size(difficulty))
         else:
-            num_clues = n + 2  # More clues, requiring inference
-
-        # Generate clues from ordering
-        for _ in range(num_clues):
-            i = self._rng.randint(0, n - 2)
-            j = self._rng.randint(i + 1, n - 1)
-
-            event_a = correct_ordering[i]
-            event_b = correct_ordering[j]
-
-            # Choose relation type
-            if j == i + 1 and self._rng.random() < 0.3:
-                relation = "immediately_before"
-            else:
-                relation = self._rng.choice(["before", "before"])
-
-            # Randomly swap to use "after" phrasing
-            if self._rng.random() < 0.3:
-                event_a, event_b = event_b, event_a
-                relation = "after" if relation == "before" else "immediately_after"
-
-            clue = TemporalClue(event_a=event_a, event_b=event_b, relation=relation)
-
-            # Avoid duplicate clues
-            if not any(
-                c.event_a == clue.event_a
-                and c.event_b == clue.event_b
-                and c.relation == clue.relation
-                for c in clues
-            ):
-                clues.append(clue)
-
-        return clues
+            index = seed
+        return bank.get(difficulty, index)
 
     def _check_ordering(self, state: TemporalClueState) -> bool:
         """Check if current ordering is correct."""
@@ -0,0 +1,490 @@
+"""
+Pre-generated, solver-verified Temporal Clue puzzles.
+
+Puzzles are generated offline and stored in a compact, indexed bank, so
+`TemporalClueEnvironment.reset(seed)` is a lookup instead of a fresh
+generation:
+
+- `solve` is a constraint-propagation solver over event positions
+  (before / immediately-before constraints plus all-different), with
+  backtracking when propagation alone does not decide the order.
+- `generate_puzzle` picks events from a scenario and adds clues until
+  the solver finds exactly one ordering, then drops every clue that is
+  not needed for uniqueness.
+- `grade_difficulty` grades a puzzle by its size and by how much the
+  solver had to infer: adjacent pairs never stated by a clue, and
+  guesses needed when propagation stalls.
+- `generate_bank` fills a bank per difficulty, optionally across worker
+  processes; every puzzle is derived from its own seed, so the result
+  does not depend on the number of workers.
+
+Usage:
+    elizaos-art-temporal generate-bank --per-difficulty 256 --workers 4
+"""
+
+import json
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from elizaos_art.games.temporal_clue.types import PUZZLE_SCENARIOS, Difficulty, TemporalClue
+
+BANK_SCHEMA_VERSION = 1
+
+DEFAULT_BANK_PATH = Path(__file__).parent / "data" / "puzzle_bank.json"
+
+RELATIONS = ("before", "after", "immediately_before", "immediately_after")
+
+# Events per puzzle for each difficulty
+EVENT_COUNTS: dict[Difficulty, tuple[int, ...]] = {
+    Difficulty.EASY: (3, 4),
+    Difficulty.MEDIUM: (5, 6),
+    Difficulty.HARD: (7, 8),
+}
+
+_banks: dict[Path, "PuzzleBank"] = {}
+
+
+@dataclass(frozen=True)
+class Puzzle:
+    """A puzzle with a unique solution."""
+
+    events: tuple[str, ...]  # Presentation order
+    correct_ordering: tuple[str, ...]
+    clues: tuple[TemporalClue, ...]
+    difficulty: Difficulty
+    guesses: int  # Solver branch points needed to prove uniqueness
+    inferred_pairs: int  # Adjacent pairs not stated by any clue
+
+
+@dataclass
+class SolveResult:
+    """Solutions found (up to the limit) and the search effort."""
+
+    solutions: list[tuple[int, ...]]
+    guesses: int
+
+
+def _normalize_clue(clue: TemporalClue, index: dict[str, int]) -> tuple[int, int, bool]:
+    """Reduce a clue to (earlier, later, immediate) event indices."""
+    a, b = index[clue.event_a], index[clue.event_b]
+    if clue.relation in ("after", "immediately_after"):
+        a, b = b, a
+    return a, b, clue.relation.startswith("immediately")
+
+
+def _propagate(domains: list[int], constraints: list[tuple[int, int, bool]], n: int) -> bool:
+    """Shrink position bitmasks to a fixpoint; False if a domain empties."""
+    full = (1 << n) - 1
+    changed = True
+    while changed:
+        changed = False
+        for a, b, immediate in constraints:
+            da, db = domains[a], domains[b]
+            if immediate:
+                new_b = db & (da << 1) & full
+                new_a = da & (new_b >> 1)
+            else:
+                # a before b: b after a's earliest slot, a before b's latest
+                low_a = (da & -da).bit_length() - 1
+                high_b = db.bit_length() - 1
+                new_b = db & ~((1 << (low_a + 1)) - 1)
+                new_a = da & ((1 << high_b) - 1)
+            if new_a != da or new_b != db:
+                if not new_a or not new_b:
+                    return False
+                domains[a], domains[b] = new_a, new_b
+                changed = True
+
+        # All-different: fixed events claim their slot, and a slot that
+        # only one event can take is that event's
+        for i, d in enumerate(domains):
+            if d & (d - 1) == 0:
+                for j in range(n):
+                    if j != i and domains[j] & d:
+                        domains[j] &= ~d
+                        if not domains[j]:
+                            return False
+                        changed = True
+        for slot in range(n):
+            bit = 1 << slot
+            holders = [i for i, d in enumerate(domains) if d & bit]
+            if not holders:
+                return False
+            if len(holders) == 1 and domains[holders[0]] != bit:
+                domains[holders[0]] = bit
+                changed = True
+    return True
+
+
+def solve(events: list[str], clues: list[TemporalClue], limit: int = 2) -> SolveResult:
+    """
+    Find orderings of `events` consistent with `clues`.
+
+    Args:
+        events: Events to order
+        clues: Clues over those events
+        limit: Stop after this many solutions (2 is enough to test
+            uniqueness)
+
+    Returns:
+        Solutions as tuples of event indices (earliest first) and the
+        number of branch points the search needed
+    """
+    n = len(events)
+    index = {event: i for i, event in enumerate(events)}
+    constraints = [_normalize_clue(clue, index) for clue in clues]
+    result = SolveResult(solutions=[], guesses=0)
+
+    def search(domains: list[int]) -> None:
+        if not _propagate(domains, constraints, n):
+            return
+        open_events = [i for i, d in enumerate(domains) if d & (d - 1)]
+        if not open_events:
+            order = [0] * n
+            for i, d in enumerate(domains):
+                order[d.bit_length() - 1] = i
+            result.solutions.append(tuple(order))
+            return
+
+        result.guesses += 1
+        event = min(open_events, key=lambda i: bin(domains[i]).count("1"))
+        options = domains[event]
+        while options and len(result.solutions) < limit:
+            bit = options & -options
+            options &= options - 1
+            branch = list(domains)
+            branch[event] = bit
+            search(branch)
+
+    search([(1 << n) - 1] * n)
+    return result
+
+
+def count_inferred_pairs(ordering: list[str], clues: list[TemporalClue]) -> int:
+    """Adjacent pairs of the solution that no clue states directly."""
+    stated = {frozenset((clue.event_a, clue.event_b)) for clue in clues}
+    return sum(
+        frozenset((ordering[i], ordering[i + 1])) not in stated for i in range(len(ordering) - 1)
+    )
+
+
+def grade_difficulty(num_events: int, guesses: int, inferred_pairs: int) -> Difficulty:
+    """
+    Grade a puzzle.
+
+    Effort is the number of inferred pairs plus two per guess. Small
+    puzzles spelled out pair by pair are easy; large puzzles that need
+    any inference, or any puzzle needing a lot of it, are hard.
+    """
+    effort = inferred_pairs + 2 * guesses
+    if num_events <= 4 and effort == 0:
+        return Difficulty.EASY
+    if (num_events >= 7 and effort >= 1) or effort >= 4:
+        return Difficulty.HARD
+    return Difficulty.MEDIUM
+
+
+def _phrase(rng: random.Random, earlier: str, later: str, immediate: bool) -> TemporalClue:
+    relation = "immediately_before" if immediate else "before"
+    if rng.random() < 0.3:
+        earlier, later = later, earlier
+        relation = relation.replace("before", "after")
+    return TemporalClue(event_a=earlier, event_b=later, relation=relation)
+
+
+def generate_puzzle(
+    rng: random.Random,
+    scenario: dict,
+    num_events: int,
+    difficulty: Difficulty,
+) -> Puzzle | None:
+    """
+    Generate a puzzle with a unique solution from a scenario.
+
+    Clue candidates are drawn at random (direct neighbors for easy
+    puzzles; a mix of "immediately" neighbors and longer-range "before"
+    clues otherwise) and added until the solution is unique. Clues that
+    are not needed for uniqueness are then removed.
+
+    Returns:
+        The puzzle, or None if it does not grade as `difficulty`
+    """
+    scenario_events = list(scenario["events"])
+    order = scenario.get("correct_order", list(range(len(scenario_events))))
+    full_ordering = [scenario_events[i] for i in order]
+    num_events = min(num_events, len(full_ordering))
+    picked = sorted(rng.sample(range(len(full_ordering)), num_events))
+    ordering = [full_ordering[i] for i in picked]
+    n = len(ordering)
+
+    neighbors = [(i, i + 1) for i in range(n - 1)]
+    if difficulty == Difficulty.EASY:
+        candidates = [(i, j, rng.random() < 0.3) for i, j in neighbors]
+        rng.shuffle(candidates)
+    else:
+        candidates = [(i, j, False) for i in range(n) for j in range(i + 2, n)]
+        candidates += [(i, j, True) for i, j in neighbors if rng.random() < 0.5]
+        rng.shuffle(candidates)
+        # Plain neighbor clues last, so uniqueness is always reachable
+        tail = [(i, j, False) for i, j in neighbors]
+        rng.shuffle(tail)
+        candidates += tail
+
+    clues: list[TemporalClue] = []
+    for i, j, immediate in candidates:
+        clues.append(_phrase(rng, ordering[i], ordering[j], immediate))
+        if len(solve(ordering, clues).solutions) == 1:
+            break
+
+    for clue in list(clues):
+        trial = [c for c in clues if c is not clue]
+        if len(solve(ordering, trial).solutions) == 1:
+            clues = trial
+    rng.shuffle(clues)
+
+    result = solve(ordering, clues)
+    inferred = count_inferred_pairs(ordering, clues)
+    if grade_difficulty(n, result.guesses, inferred) != difficulty:
+        return None
+
+    events = list(ordering)
+    rng.shuffle(events)
+    return Puzzle(
+        events=tuple(events),
+        correct_ordering=tuple(ordering),
+        clues=tuple(clues),
+        difficulty=difficulty,
+        guesses=result.guesses,
+        inferred_pairs=inferred,
+    )
+
+
+def generate_puzzle_for_seed(
+    difficulty: Difficulty,
+    seed: str,
+    scenarios: list[dict] | None = None,
+    max_attempts: int = 50,
+) -> Puzzle:
+    """
+    Generate a puzzle of the given difficulty, deterministically from a seed.
+
+    Raises:
+        ValueError: If no scenario yields a puzzle of that difficulty
+    """
+    rng = random.Random(seed)
+    scenarios = scenarios or list(PUZZLE_SCENARIOS.values())
+    for _ in range(max_attempts):
+        num_events = rng.choice(EVENT_COUNTS[difficulty])
+        large_enough = [s for s in scenarios if len(s["events"]) >= num_events]
+        scenario = rng.choice(large_enough or scenarios)
+        puzzle = generate_puzzle(rng, scenario, num_events, difficulty)
+        if puzzle is not None:
+            return puzzle
+    raise ValueError(f"Could not generate a {difficulty.value} puzzle from seed {seed}")
+
+
+def nearest_difficulties(difficulty: Difficulty) -> list[Difficulty]:
+    """All difficulties, closest to `difficulty` first (easier on ties)."""
+    levels = list(Difficulty)
+    target = levels.index(difficulty)
+    return sorted(levels, key=lambda d: (abs(levels.index(d) - target), levels.index(d)))
+
+
+def _generate_chunk(difficulty_value: str, seeds: list[str]) -> list[Puzzle]:
+    """Worker-process entry point: generate puzzles for a chunk of seeds."""
+    difficulty = Difficulty(difficulty_value)
+    return [generate_puzzle_for_seed(difficulty, seed) for seed in seeds]
+
+
+class PuzzleBank:
+    """
+    Puzzles per difficulty, addressed by index.
+
+    Stored compactly: event names are interned into one string table, and
+    each puzzle is a flat list of integers:
+    [n, *ordering, *presentation, guesses, inferred_pairs, *(a, b, relation)...]
+    Puzzles are decoded on first access.
+    """
+
+    def __init__(self, strings: list[str], rows: dict[Difficulty, list[list[int]]]):
+        self._strings = strings
+        self._rows = rows
+        self._decoded: dict[tuple[Difficulty, int], Puzzle] = {}
+
+    @classmethod
+    def from_puzzles(cls, puzzles: dict[Difficulty, list[Puzzle]]) -> "PuzzleBank":
+        strings: list[str] = []
+        string_index: dict[str, int] = {}
+
+        def intern(s: str) -> int:
+            if s not in string_index:
+                string_index[s] = len(strings)
+                strings.append(s)
+            return string_index[s]
+
+        rows: dict[Difficulty, list[list[int]]] = {}
+        for difficulty, bucket in puzzles.items():
+            rows[difficulty] = []
+            for puzzle in bucket:
+                row = [len(puzzle.correct_ordering)]
+                row += [intern(e) for e in puzzle.correct_ordering]
+                row += [intern(e) for e in puzzle.events]
+                row += [puzzle.guesses, puzzle.inferred_pairs]
+                for clue in puzzle.clues:
+                    row += [
+                        intern(clue.event_a),
+                        intern(clue.event_b),
+                        RELATIONS.index(clue.relation),
+                    ]
+                rows[difficulty].append(row)
+        return cls(strings, rows)
+
+    def size(self, difficulty: Difficulty) -> int:
+        """Number of puzzles of a difficulty."""
+        return len(self._rows.get(difficulty, ()))
+
+    def get(self, difficulty: Difficulty, index: int) -> Puzzle:
+        """Puzzle `index` of a difficulty (wraps around the bank)."""
+        rows = self._rows.get(difficulty)
+        if not rows:
+            raise KeyError(f"No {difficulty.value} puzzles in the bank")
+        index %= len(rows)
+        key = (difficulty, index)
+        puzzle = self._decoded.get(key)
+        if puzzle is None:
+            puzzle = self._decode(difficulty, rows[index])
+            self._decoded[key] = puzzle
+        return puzzle
+
+    def _decode(self, difficulty: Difficulty, row: list[int]) -> Puzzle:
+        strings = self._strings
+        n = row[0]
+        ordering = tuple(strings[i] for i in row[1 : 1 + n])
+        events = tuple(strings[i] for i in row[1 + n : 1 + 2 * n])
+        guesses, inferred = row[1 + 2 * n], row[2 + 2 * n]
+        clue_data = row[3 + 2 * n :]
+        clues = tuple(
+            TemporalClue(
+                event_a=strings[clue_data[k]],
+                event_b=strings[clue_data[k + 1]],
+                relation=RELATIONS[clue_data[k + 2]],
+            )
+            for k in range(0, len(clue_data), 3)
+        )
+        return Puzzle(
+            events=events,
+            correct_ordering=ordering,
+            clues=clues,
+            difficulty=difficulty,
+            guesses=guesses,
+            inferred_pairs=inferred,
+        )
+
+    def save(self, path: str | Path = DEFAULT_BANK_PATH) -> Path:
+        """Write the bank as JSON, one puzzle per line."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [
+            "{",
+            f'  "schema_version": {BANK_SCHEMA_VERSION},',
+            f'  "strings": {json.dumps(self._strings)},',
+            '  "puzzles": {',
+        ]
+        buckets = []
+        for difficulty, rows in self._rows.items():
+            body = ",\n".join(f"      {json.dumps(row, separators=(',', ':'))}" for row in rows)
+            buckets.append(f'    "{difficulty.value}": [\n{body}\n    ]')
+        lines.append(",\n".join(buckets))
+        lines += ["  }", "}"]
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path = DEFAULT_BANK_PATH) -> "PuzzleBank":
+        """Load a bank, rejecting other schema versions."""
+        with open(path) as f:
+            data = json.load(f)
+        version = data.get("schema_version")
+        if version != BANK_SCHEMA_VERSION:
+            raise ValueError(
+                f"Puzzle bank schema version {version} is not supported "
+                f"(expected {BANK_SCHEMA_VERSION}); regenerate the bank"
+            )
+        rows = {Difficulty(name): bucket for name, bucket in data["puzzles"].items()}
+        return cls(data["strings"], rows)
+
+
+def get_puzzle_bank(path: str | Path = DEFAULT_BANK_PATH) -> PuzzleBank:
+    """Load a bank once per process and reuse it."""
+    path = Path(path)
+    bank = _banks.get(path)
+    if bank is None:
+        bank = PuzzleBank.load(path)
+        _banks[path] = bank
+    return bank
+
+
+def generate_bank(
+    per_difficulty: int = 256,
+    workers: int = 1,
+    seed: int = 0,
+    chunk_size: int = 32,
+) -> PuzzleBank:
+    """
+    Generate a bank of distinct puzzles for every difficulty.
+
+    Args:
+        per_difficulty: Puzzles per difficulty
+        workers: Worker processes (1 = generate in-process)
+        seed: Base seed; puzzle k of a difficulty uses "<seed>:<difficulty>:<k>"
+        chunk_size: Seeds per worker task
+
+    Returns:
+        The bank; identical for any number of workers
+    """
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    puzzles: dict[Difficulty, list[Puzzle]] = {}
+    try:
+        for difficulty in Difficulty:
+            bucket: list[Puzzle] = []
+            seen: set[tuple] = set()
+            next_seed = 0
+            while len(bucket) < per_difficulty:
+                # Small scenario sets repeat puzzles, so top up past duplicates
+                needed = per_difficulty - len(bucket)
+                seeds = [
+                    f"{seed}:{difficulty.value}:{k}" for k in range(next_seed, next_seed + needed)
+                ]
+                next_seed += needed
+                chunks = [seeds[i : i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+                if executor is None:
+                    results = [_generate_chunk(difficulty.value, chunk) for chunk in chunks]
+                else:
+                    values = [difficulty.value] * len(chunks)
+                    results = executor.map(_generate_chunk, values, chunks)
+
+                for chunk in results:
+                    for puzzle in chunk:
+                        key = (puzzle.correct_ordering, frozenset(puzzle.clues))
+                        if key not in seen and len(bucket) < per_difficulty:
+                            seen.add(key)
+                            bucket.append(puzzle)
+                if next_seed > per_difficulty * 20:
+                    raise ValueError(
+                        f"Only {len(bucket)} distinct {difficulty.value} puzzles could be "
+                        "generated; add scenarios or lower per_difficulty"
+                    )
+            puzzles[difficulty] = bucket
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return PuzzleBank.from_puzzles(puzzles)
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from enum import IntEnum, Enum
 from typing import ClassVar
 
-from elizaos_art.base import Action, State
+from elizaos_art.base import Action, State, memoized_render
 
 
 class Difficulty(Enum):
@@ -46,7 +46,7 @@ class TemporalClueAction(IntEnum):
         raise ValueError(f"Invalid position: {pos}")
 
 
-@dataclass
+@dataclass(frozen=True)
 class TemporalClue:
     """A clue about temporal relationships."""
 
@@ -85,30 +85,20 @@ class TemporalClueState(State):
 
     MAX_EVENTS: ClassVar[int] = 8
 
+    @memoized_render
     def to_prompt(self) -> str:
         """Convert state to prompt string."""
-        lines = ["# Temporal Clue Puzzle"]
-        lines.append("")
-        lines.append("Order these events chronologically based on the clues:")
-        lines.append("")
-
-        lines.append("## Events")
-        for i, event in enumerate(self.events):
-            lines.append(f"  {i + 1}. {event}")
+        lines = [_PROMPT_HEADER]
+        for i, event in enumerate(self.events, 1):
+            lines.append(f"  {i}. {event}")
 
-        lines.append("")
-        lines.append("## Clues")
+        lines.append(_PROMPT_CLUES)
         for clue in self.clues:
             lines.append(f"  - {clue.to_text()}")
 
-        lines.append("")
-        lines.append("## Current Ordering (earliest to latest)")
-        lines.append("```")
-        for i, event in enumerate(self.current_ordering):
-            if event:
-                lines.append(f"  {i + 1}. {event}")
-            else:
-                lines.append(f"  {i + 1}. [empty]")
+        lines.append(_PROMPT_ORDERING)
+        for i, event in enumerate(self.current_ordering, 1):
+            lines.append(f"  {i}. {event}" if event else f"  {i}. [empty]")
         lines.append("```")
 
         if self.unplaced_events:
@@ -141,6 +131,7 @@ class TemporalClueState(State):
         """Check if puzzle is complete."""
         return self.submitted
 
+    @memoized_render
     def render(self) -> str:
         """Render puzzle for display."""
         lines = []
@@ -181,6 +172,20 @@ class TemporalClueState(State):
         return "\n".join(lines)
 
 
+# Precompiled static sections of TemporalClueState.to_prompt
+_PROMPT_HEADER = "\n".join(
+    [
+        "# Temporal Clue Puzzle",
+        "",
+        "Order these events chronologically based on the clues:",
+        "",
+        "## Events",
+    ]
+)
+_PROMPT_CLUES = "\n## Clues"
+_PROMPT_ORDERING = "\n## Current Ordering (earliest to latest)\n```"
+
+
 @dataclass
 class TemporalClueConfig:
     """Configuration for Temporal Clue puzzles."""
@@ -188,6 +193,7 @@ class TemporalClueConfig:
     difficulty: Difficulty = Difficulty.MEDIUM
     num_events: int = 5  # Number of events to order
     custom_scenarios: list[dict] | None = None  # Custom puzzle scenarios
+    puzzle_bank_path: str | None = None  # Default: the bundled puzzle bank
 
 
 # Pre-defined puzzle scenarios
@@ -235,4 +241,43 @@ PUZZLE_SCENARIOS = {
         ],
         "correct_order": [0, 1, 2, 3, 4, 5],
     },
+    "space_mission": {
+        "events": [
+            "Design the rocket",
+            "Build the rocket",
+            "Test the engines",
+            "Fuel the rocket",
+            "Launch",
+            "Reach orbit",
+            "Dock with the station",
+            "Return to Earth",
+        ],
+        "correct_order": [0, 1, 2, 3, 4, 5, 6, 7],
+    },
+    "garden_season": {
+        "events": [
+            "Buy seeds",
+            "Prepare the soil",
+            "Plant the seeds",
+            "Water the seedlings",
+            "Pull weeds",
+            "Flowers bloom",
+            "Harvest vegetables",
+            "Compost old plants",
+        ],
+        "correct_order": [0, 1, 2, 3, 4, 5, 6, 7],
+    },
+    "building_a_house": {
+        "events": [
+            "Buy the land",
+            "Draw up plans",
+            "Pour the foundation",
+            "Frame the walls",
+            "Put on the roof",
+            "Install plumbing",
+            "Paint the interior",
+            "Move in",
+        ],
+        "correct_order": [0, 1, 2, 3, 4, 5, 6, 7],
+    },
 }
@@ -7,6 +7,7 @@ LLM-based agent that learns to play Tic-Tac-Toe.
 import re
 
 from elizaos_art.base import BaseAgent
+from elizaos_art.games.tic_tac_toe.solver import best_move, winner
 from elizaos_art.games.tic_tac_toe.types import TicTacToeAction, TicTacToeState, Player
 
 
@@ -117,14 +118,20 @@ class TicTacToeHeuristicAgent(BaseAgent[TicTacToeState, TicTacToeAction]):
     Heuristic-based agent for Tic-Tac-Toe.
 
     Good for baseline comparisons.
+
+    Args:
+        player: Player the agent plays as
+        optimal: Play perfectly from the solved-game table instead of the
+            win/block/center/corner priorities
     """
 
-    def __init__(self, player: Player = Player.X):
+    def __init__(self, player: Player = Player.X, optimal: bool = False):
         self.player = player
+        self.optimal = optimal
 
     @property
     def name(self) -> str:
-        return "TicTacToeHeuristic"
+        return "TicTacToeOptimal" if self.optimal else "TicTacToeHeuristic"
 
     def get_system_prompt(self) -> str:
         return ""
@@ -149,6 +156,11 @@ class TicTacToeHeuristicAgent(BaseAgent[TicTacToeState, TicTacToeAction]):
         available_actions: list[TicTacToeAction],
     ) -> TicTacToeAction:
         """Use heuristic strategy."""
+        if self.optimal:
+            action = TicTacToeAction(best_move(state.board, state.current_player))
+            if action in available_actions:
+                return action
+
         board = list(state.board)
         opponent = Player.O if self.player == Player.X else Player.X
 
@@ -186,15 +198,7 @@ class TicTacToeHeuristicAgent(BaseAgent[TicTacToeState, TicTacToeAction]):
 
     def _is_winner(self, board: list[int], player: Player) -> bool:
         """Check if player has won."""
-        win_lines = [
-            (0, 1, 2), (3, 4, 5), (6, 7, 8),
-            (0, 3, 6), (1, 4, 7), (2, 5, 8),
-            (0, 4, 8), (2, 4, 6),
-        ]
-        for line in win_lines:
-            if all(board[i] == player.value for i in line):
-                return True
-        return False
+        return winner(board) == player
 
 
 class TicTacToeRandomAgent(BaseAgent[TicTacToeState, TicTacToeAction]):
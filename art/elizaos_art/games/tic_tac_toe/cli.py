@@ -172,6 +172,7 @@ def benchmark(
             ("Heuristic vs Random", TicTacToeHeuristicAgent(), "random"),
             ("Heuristic vs Heuristic", TicTacToeHeuristicAgent(), "heuristic"),
             ("Heuristic vs Minimax", TicTacToeHeuristicAgent(), "minimax"),
+            ("Optimal vs Minimax", TicTacToeHeuristicAgent(optimal=True), "minimax"),
             ("Random vs Random", TicTacToeRandomAgent(), "random"),
         ]
 
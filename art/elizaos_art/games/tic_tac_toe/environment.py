@@ -8,6 +8,7 @@ import random
 from typing import ClassVar
 
 from elizaos_art.base import BaseEnvironment
+from elizaos_art.games.tic_tac_toe.solver import WIN_LINES, best_move
 from elizaos_art.games.tic_tac_toe.types import (
     Player,
     TicTacToeAction,
@@ -25,16 +26,7 @@ class TicTacToeEnvironment(BaseEnvironment[TicTacToeState, TicTacToeAction]):
     """
 
     SIZE: ClassVar[int] = 3
-    WIN_LINES: ClassVar[list[tuple[int, ...]]] = [
-        (0, 1, 2),  # Rows
-        (3, 4, 5),
-        (6, 7, 8),
-        (0, 3, 6),  # Columns
-        (1, 4, 7),
-        (2, 5, 8),
-        (0, 4, 8),  # Diagonals
-        (2, 4, 6),
-    ]
+    WIN_LINES: ClassVar[list[tuple[int, ...]]] = WIN_LINES
 
     def __init__(self, config: TicTacToeConfig | None = None):
         self.config = config or TicTacToeConfig()
@@ -184,7 +176,7 @@ class TicTacToeEnvironment(BaseEnvironment[TicTacToeState, TicTacToeAction]):
 
         opponent = self._other_player(self.config.ai_player)
 
-        if self.config.opponent == "minimax":
+        if self.config.opponent in ("minimax", "optimal"):
             pos = self._minimax_move(state, opponent)
         elif self.config.opponent == "heuristic":
             pos = self._heuristic_move(state, opponent)
@@ -241,59 +233,8 @@ class TicTacToeEnvironment(BaseEnvironment[TicTacToeState, TicTacToeAction]):
         return empty[0] if empty else 0
 
     def _minimax_move(self, state: TicTacToeState, player: Player) -> int:
-        """Minimax opponent - plays optimally."""
-        best_score = float("-inf")
-        best_move = -1
-        board = list(state.board)
-
-        for pos in range(9):
-            if board[pos] == Player.EMPTY.value:
-                board[pos] = player.value
-                score = self._minimax(board, 0, False, player)
-                board[pos] = Player.EMPTY.value
-
-                if score > best_score:
-                    best_score = score
-                    best_move = pos
-
-        return best_move
-
-    def _minimax(
-        self,
-        board: list[int],
-        depth: int,
-        is_maximizing: bool,
-        player: Player,
-    ) -> float:
-        """Minimax algorithm."""
-        opponent = self._other_player(player)
-
-        # Check terminal states
-        if self._is_winner(board, player):
-            return 10 - depth
-        if self._is_winner(board, opponent):
-            return depth - 10
-        if all(cell != Player.EMPTY.value for cell in board):
-            return 0
-
-        if is_maximizing:
-            best_score = float("-inf")
-            for pos in range(9):
-                if board[pos] == Player.EMPTY.value:
-                    board[pos] = player.value
-                    score = self._minimax(board, depth + 1, False, player)
-                    board[pos] = Player.EMPTY.value
-                    best_score = max(score, best_score)
-            return best_score
-        else:
-            best_score = float("inf")
-            for pos in range(9):
-                if board[pos] == Player.EMPTY.value:
-                    board[pos] = opponent.value
-                    score = self._minimax(board, depth + 1, True, player)
-                    board[pos] = Player.EMPTY.value
-                    best_score = min(score, best_score)
-            return best_score
+        """Minimax opponent - plays optimally, via the solved-game table."""
+        return best_move(state.board, player)
 
     def _is_winner(self, board: list[int], player: Player) -> bool:
         """Check if player has won."""
@@ -0,0 +1,174 @@
+"""
+Solved-game table for Tic-Tac-Toe.
+
+The game is solved once, by negamax over positions reduced modulo the 8
+board symmetries (rotations and reflections), into a table mapping each
+canonical position to its game-theoretic value and optimal moves. After
+that, best moves and values are O(1) lookups; the minimax opponent and
+the heuristic agent share the same table.
+
+Values follow the environment's original minimax scoring, from the
+perspective of the player to move: a win in n further plies scores
+10 - n + 1, a loss -(10 - n + 1), a draw 0. Faster wins and slower
+losses therefore rank higher, and ties between equally good moves are
+broken by the lowest board position, so table play is move-for-move
+identical to the old recursive search.
+"""
+
+from elizaos_art.games.tic_tac_toe.types import Player
+
+WIN_LINES: list[tuple[int, int, int]] = [
+    (0, 1, 2),  # Rows
+    (3, 4, 5),
+    (6, 7, 8),
+    (0, 3, 6),  # Columns
+    (1, 4, 7),
+    (2, 5, 8),
+    (0, 4, 8),  # Diagonals
+    (2, 4, 6),
+]
+
+# The 8 symmetries as index permutations: transformed[i] = board[perm[i]]
+SYMMETRIES: list[tuple[int, ...]] = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror left-right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror top-bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # anti-diagonal
+]
+
+_WIN_SCORE = 10
+
+# (canonical board, player to move) -> (value, optimal moves in canonical coordinates)
+_table: dict[tuple[tuple[int, ...], int], tuple[int, tuple[int, ...]]] | None = None
+
+# (board, player to move) -> (value, optimal moves), so repeat lookups skip
+# canonicalization; at most the ~5.5k reachable positions
+_answers: dict[tuple[tuple[int, ...], int], tuple[int, tuple[int, ...]]] = {}
+
+
+def winner(board: tuple[int, ...] | list[int]) -> Player | None:
+    """Return the player with three in a row, if any."""
+    for a, b, c in WIN_LINES:
+        if board[a] != Player.EMPTY.value and board[a] == board[b] == board[c]:
+            return Player(board[a])
+    return None
+
+
+def canonical(board: tuple[int, ...] | list[int]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Reduce a board modulo the 8 symmetries.
+
+    Returns:
+        Tuple of (canonical board, permutation mapping it back to the
+        board: canonical position i is board position perm[i])
+    """
+    best = None
+    best_perm = SYMMETRIES[0]
+    for perm in SYMMETRIES:
+        transformed = tuple(board[i] for i in perm)
+        if best is None or transformed < best:
+            best = transformed
+            best_perm = perm
+    return best, best_perm
+
+
+def _shrink(value: int) -> int:
+    """Push a value one ply toward zero (a win/loss one move further away)."""
+    if value > 0:
+        return value - 1
+    if value < 0:
+        return value + 1
+    return 0
+
+
+def _solve(
+    board: tuple[int, ...],
+    player: int,
+    table: dict[tuple[tuple[int, ...], int], tuple[int, tuple[int, ...]]],
+) -> int:
+    """Negamax over canonical positions; fills `table` and returns the value."""
+    key = (board, player)
+    entry = table.get(key)
+    if entry is not None:
+        return entry[0]
+
+    opponent = Player(player).opponent().value
+    best_value = None
+    best_moves: list[int] = []
+    for pos in range(9):
+        if board[pos] != Player.EMPTY.value:
+            continue
+        child = list(board)
+        child[pos] = player
+        if winner(child) is not None:
+            value = _WIN_SCORE
+        elif Player.EMPTY.value not in child:
+            value = 0
+        else:
+            child_board, _ = canonical(child)
+            value = -_shrink(_solve(child_board, opponent, table))
+
+        if best_value is None or value > best_value:
+            best_value = value
+            best_moves = [pos]
+        elif value == best_value:
+            best_moves.append(pos)
+
+    table[key] = (best_value if best_value is not None else 0, tuple(best_moves))
+    return table[key][0]
+
+
+def _get_table() -> dict[tuple[tuple[int, ...], int], tuple[int, tuple[int, ...]]]:
+    global _table
+    if _table is None:
+        table: dict[tuple[tuple[int, ...], int], tuple[int, tuple[int, ...]]] = {}
+        _solve(tuple([Player.EMPTY.value] * 9), Player.X.value, table)
+        _table = table
+    return _table
+
+
+def _lookup(board: tuple[int, ...] | list[int], player: Player) -> tuple[int, tuple[int, ...]]:
+    key = (tuple(board), player.value)
+    answer = _answers.get(key)
+    if answer is not None:
+        return answer
+
+    board_key, perm = canonical(board)
+    table = _get_table()
+    entry = table.get((board_key, player.value))
+    if entry is None:
+        # Positions unreachable from the empty board with X first
+        _solve(board_key, player.value, table)
+        entry = table[(board_key, player.value)]
+    value, moves = entry
+    answer = (value, tuple(sorted(perm[pos] for pos in moves)))
+    _answers[key] = answer
+    return answer
+
+
+def game_value(board: tuple[int, ...] | list[int], player: Player) -> int:
+    """
+    Game-theoretic value of a non-terminal position for the player to move.
+
+    Positive means a forced win, negative a forced loss, 0 a draw.
+    """
+    return _lookup(board, player)[0]
+
+
+def best_moves(board: tuple[int, ...] | list[int], player: Player) -> list[int]:
+    """All optimal moves for the player to move, sorted by position."""
+    return list(_lookup(board, player)[1])
+
+
+def best_move(board: tuple[int, ...] | list[int], player: Player) -> int:
+    """The lowest-numbered optimal move for the player to move."""
+    return _lookup(board, player)[1][0]
+
+
+def table_size() -> int:
+    """Number of canonical positions in the solved table."""
+    return len(_get_table())
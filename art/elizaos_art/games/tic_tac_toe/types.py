@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from enum import IntEnum
 from typing import ClassVar
 
-from elizaos_art.base import Action, State
+from elizaos_art.base import Action, State, memoized_render
 
 
 class Player(IntEnum):
@@ -129,36 +129,12 @@ class TicTacToeState(State):
         """Get player at (row, col)."""
         return Player(self.board[row * self.SIZE + col])
 
+    @memoized_render
     def to_prompt(self) -> str:
         """Convert state to prompt string."""
-        lines = ["Current Tic-Tac-Toe board:"]
-        lines.append("```")
-
-        for row in range(self.SIZE):
-            row_str = ""
-            for col in range(self.SIZE):
-                cell = self.get_cell(row, col)
-                row_str += f" {cell} "
-                if col < self.SIZE - 1:
-                    row_str += "|"
-            lines.append(row_str)
-            if row < self.SIZE - 1:
-                lines.append("-----------")
-
-        lines.append("```")
-        lines.append("")
-        lines.append("Board positions (0-8):")
-        lines.append("```")
-        lines.append(" 0 | 1 | 2")
-        lines.append("-----------")
-        lines.append(" 3 | 4 | 5")
-        lines.append("-----------")
-        lines.append(" 6 | 7 | 8")
-        lines.append("```")
+        cells = [_SYMBOLS[cell] for cell in self.board]
         # Convert int to Player enum for display (shows "X" or "O" instead of "1" or "2")
-        lines.append(f"You are playing as: {Player(self.current_player)}")
-
-        return "\n".join(lines)
+        return _PROMPT_TEMPLATE.format(*cells, _SYMBOLS[self.current_player])
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -176,35 +152,62 @@ class TicTacToeState(State):
         """Check if game is over."""
         return self.winner is not None or self.is_draw
 
+    @memoized_render
     def render(self) -> str:
         """Render board for display."""
-        lines = []
-        lines.append("┌───┬───┬───┐")
-
-        for row in range(self.SIZE):
-            row_str = "│"
-            for col in range(self.SIZE):
-                cell = self.get_cell(row, col)
-                if cell == Player.EMPTY:
-                    row_str += f" {row * 3 + col} │"  # Show position number
-                else:
-                    row_str += f" {cell} │"
-            lines.append(row_str)
-            if row < self.SIZE - 1:
-                lines.append("├───┼───┼───┤")
-
-        lines.append("└───┴───┴───┘")
+        # Empty cells show their position number
+        cells = [_SYMBOLS[cell] if cell else str(i) for i, cell in enumerate(self.board)]
 
         # Display game result or current player
         # Note: winner is 1 (X) or 2 (O), never 0; draws use is_draw flag
         if self.winner:
-            lines.append(f"Winner: {Player(self.winner)}!")
+            status = f"Winner: {_SYMBOLS[self.winner]}!"
         elif self.is_draw:
-            lines.append("It's a draw!")
+            status = "It's a draw!"
         else:
-            lines.append(f"Current player: {Player(self.current_player)}")
-
-        return "\n".join(lines)
+            status = f"Current player: {_SYMBOLS[self.current_player]}"
+
+        return _RENDER_TEMPLATE.format(*cells, status)
+
+
+# Precompiled templates for TicTacToeState.to_prompt / render
+_SYMBOLS = {player.value: str(player) for player in Player}
+
+_PROMPT_TEMPLATE = "\n".join(
+    [
+        "Current Tic-Tac-Toe board:",
+        "```",
+        " {} | {} | {} ",
+        "-----------",
+        " {} | {} | {} ",
+        "-----------",
+        " {} | {} | {} ",
+        "```",
+        "",
+        "Board positions (0-8):",
+        "```",
+        " 0 | 1 | 2",
+        "-----------",
+        " 3 | 4 | 5",
+        "-----------",
+        " 6 | 7 | 8",
+        "```",
+        "You are playing as: {}",
+    ]
+)
+
+_RENDER_TEMPLATE = "\n".join(
+    [
+        "┌───┬───┬───┐",
+        "│ {} │ {} │ {} │",
+        "├───┼───┼───┤",
+        "│ {} │ {} │ {} │",
+        "├───┼───┼───┤",
+        "│ {} │ {} │ {} │",
+        "└───┴───┴───┘",
+        "{}",
+    ]
+)
 
 
 @dataclass
@@ -218,5 +221,5 @@ class TicTacToeConfig:
     # - "none": No automatic opponent (for interactive/human play)
     # - "random": Random valid moves
     # - "heuristic": Simple priority-based strategy (center > corners > edges)
-    # - "optimal" / "minimax": Perfect play using minimax algorithm
+    # - "optimal" / "minimax": Perfect play from the solved-game table
     opponent: str = "random"
@@ -0,0 +1,514 @@
+"""
+Microbenchmarks for ART infrastructure.
+
+Small, model-free measurements of the hot paths around training:
+storage I/O, trajectory logging, prompt building, and so on.
+Each benchmark returns a plain dict so results can be printed,
+compared, or saved as JSON.
+"""
+
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable
+
+
+async def measure_event_loop_lag(
+    workload: Awaitable,
+    interval_s: float = 0.001,
+) -> dict:
+    """
+    Run a workload while sampling event-loop responsiveness.
+
+    A ticker task sleeps for `interval_s` repeatedly; the amount by which
+    each wake-up overshoots is the loop lag caused by blocking work.
+
+    Returns:
+        Dict with max/mean/p99 lag in milliseconds and the workload duration
+    """
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def ticker() -> None:
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            start = loop.time()
+            await asyncio.sleep(interval_s)
+            lags.append(max(0.0, loop.time() - start - interval_s))
+
+    ticker_task = asyncio.create_task(ticker())
+    start_time = time.perf_counter()
+    try:
+        await workload
+    finally:
+        duration = time.perf_counter() - start_time
+        stop.set()
+        await ticker_task
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    return {
+        "duration_s": duration,
+        "samples": len(lags),
+        "max_lag_ms": lags_ms[-1],
+        "mean_lag_ms": sum(lags_ms) / len(lags_ms),
+        "p99_lag_ms": lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))],
+    }
+
+
+def _make_benchmark_trajectory(index: int, num_steps: int) -> dict:
+    """Build a synthetic ElizaOS-format trajectory of realistic size."""
+    return {
+        "trajectoryId": f"bench-{index}",
+        "agentId": "bench-agent",
+        "scenarioId": f"scenario-{index % 8}",
+        "totalReward": float(index % 5),
+        "steps": [
+            {
+                "stepId": f"bench-{index}-{s}",
+                "stepNumber": s,
+                "llmCalls": [
+                    {
+                        "systemPrompt": "You are a game-playing agent. " * 20,
+                        "userPrompt": f"Game {index}, board state {s}: " + "2 4 8 16 " * 40,
+                        "response": "DOWN",
+                    }
+                ],
+            }
+            for s in range(num_steps)
+        ],
+        "metrics": {"episodeLength": num_steps},
+    }
+
+
+async def benchmark_storage_saves(
+    num_trajectories: int = 200,
+    num_steps: int = 50,
+    concurrency: int = 32,
+    data_dir: str | Path | None = None,
+) -> dict:
+    """
+    Measure event-loop lag while many rollouts save trajectories at once.
+
+    Returns:
+        Loop-lag stats plus saves/sec and I/O executor counters
+    """
+    from elizaos_art.eliza_integration.storage_adapter import ElizaStorageAdapter
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = ElizaStorageAdapter(data_dir=data_dir or tmpdir)
+        trajectories = [
+            _make_benchmark_trajectory(i, num_steps) for i in range(num_trajectories)
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def save(trajectory: dict, index: int) -> None:
+            async with semaphore:
+                embedding = [float((index + d) % 7) for d in range(384)]
+                await storage.save_trajectory(trajectory, embedding=embedding)
+
+        async def workload() -> None:
+            await asyncio.gather(*(save(t, i) for i, t in enumerate(trajectories)))
+            await storage.flush()
+
+        result = await measure_event_loop_lag(workload())
+        result["saves_per_sec"] = num_trajectories / result["duration_s"]
+        result["io"] = storage.trajectories.io.get_stats()
+        await storage.close()
+
+    return result
+
+
+async def benchmark_parallel_conversion(
+    num_trajectories: int = 2000,
+    num_steps: int = 50,
+    worker_counts: tuple[int, ...] = (1, 2, 4),
+    chunk_size: int = 64,
+) -> dict:
+    """
+    Time ART-format conversion at several process-pool sizes.
+
+    Returns:
+        Dict mapping worker count to seconds, records/sec and speedup vs 1 worker
+    """
+    from elizaos_art.eliza_integration.export import convert_trajectories
+
+    trajectories = [
+        _make_benchmark_trajectory(i, num_steps) for i in range(num_trajectories)
+    ]
+    results: dict = {}
+
+    for workers in worker_counts:
+        start = time.perf_counter()
+        count = 0
+        async for _ in convert_trajectories(
+            trajectories, workers=workers, chunk_size=chunk_size
+        ):
+            count += 1
+        elapsed = time.perf_counter() - start
+        results[workers] = {
+            "seconds": elapsed,
+            "records_per_sec": count / elapsed,
+        }
+
+    base = results[worker_counts[0]]["seconds"]
+    for stats in results.values():
+        stats["speedup"] = base / stats["seconds"]
+
+    return results
+
+
+def benchmark_step_lookup(
+    trajectory_counts: tuple[int, ...] = (10, 100, 1000, 5000),
+    steps_per_trajectory: int = 20,
+    calls: int = 20_000,
+) -> dict:
+    """
+    Time `ElizaTrajectoryLogger.log_llm_call` as concurrent rollouts grow.
+
+    Per-call cost should stay flat regardless of how many trajectories
+    (and steps) are active.
+
+    Returns:
+        Dict mapping active trajectory count to microseconds per call
+    """
+    from elizaos_art.eliza_integration.trajectory_adapter import ElizaTrajectoryLogger
+
+    results: dict = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for count in trajectory_counts:
+            logger = ElizaTrajectoryLogger(
+                agent_id="bench-agent", data_dir=tmpdir, auto_persist=False
+            )
+            step_ids = []
+            for _ in range(count):
+                trajectory_id = logger.start_trajectory()
+                for _ in range(steps_per_trajectory):
+                    step_ids.append(logger.start_step(trajectory_id, {}))
+
+            call = {"model": "bench", "userPrompt": "state", "response": "DOWN"}
+            start = time.perf_counter()
+            for i in range(calls):
+                logger.log_llm_call(step_ids[(i * 7919) % len(step_ids)], dict(call))
+            elapsed = time.perf_counter() - start
+
+            results[count] = {"us_per_call": elapsed / calls * 1e6}
+
+    return results
+
+
+def benchmark_trajectory_persistence(
+    num_trajectories: int = 50,
+    steps_per_trajectory: int = 50,
+) -> dict:
+    """
+    Compare inline vs write-behind trajectory persistence.
+
+    Measures the latency the logging path adds to each agent turn
+    (`complete_step`) and to the end of each episode (`end_trajectory`).
+
+    Returns:
+        Dict mapping mode to per-call latencies in microseconds
+    """
+    from elizaos_art.eliza_integration.trajectory_adapter import ElizaTrajectoryLogger
+
+    llm_call = _make_benchmark_trajectory(0, 1)["steps"][0]["llmCalls"][0]
+    results: dict = {}
+
+    for mode in ("inline", "write_behind"):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = ElizaTrajectoryLogger(
+                agent_id="bench-agent",
+                data_dir=tmpdir,
+                write_behind=mode == "write_behind",
+            )
+            step_time = 0.0
+            end_time = 0.0
+            for _ in range(num_trajectories):
+                trajectory_id = logger.start_trajectory()
+                for _ in range(steps_per_trajectory):
+                    step_id = logger.start_step(trajectory_id, {})
+                    logger.log_llm_call(step_id, dict(llm_call))
+                    start = time.perf_counter()
+                    logger.complete_step(trajectory_id, step_id, {"actionName": "DOWN"})
+                    step_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                logger.end_trajectory(trajectory_id)
+                end_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            logger.close()
+            drain_time = time.perf_counter() - start
+
+        results[mode] = {
+            "complete_step_us": step_time / (num_trajectories * steps_per_trajectory) * 1e6,
+            "end_trajectory_us": end_time / num_trajectories * 1e6,
+            "drain_ms": drain_time * 1000,
+        }
+
+    return results
+
+
+def benchmark_capture_tiers(
+    num_trajectories: int = 50,
+    steps_per_trajectory: int = 50,
+) -> dict:
+    """
+    Measure trajectory logging overhead for each capture tier.
+
+    Times the full logging path of a step (start, LLM call, provider
+    access, completion) plus persistence, and reports bytes written.
+
+    Returns:
+        Dict mapping tier to microseconds per step and bytes per trajectory
+    """
+    from elizaos_art.eliza_integration.trajectory_adapter import (
+        CaptureTier,
+        ElizaTrajectoryLogger,
+    )
+
+    template = _make_benchmark_trajectory(0, 1)["steps"][0]["llmCalls"][0]
+    env_state = {"board": [[2, 4, 8, 16]] * 4, "score": 1024}
+    results: dict = {}
+
+    for tier in CaptureTier:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = ElizaTrajectoryLogger(
+                agent_id="bench-agent", data_dir=tmpdir, capture_tier=tier
+            )
+            start = time.perf_counter()
+            for _ in range(num_trajectories):
+                trajectory_id = logger.start_trajectory()
+                for _ in range(steps_per_trajectory):
+                    step_id = logger.start_step(trajectory_id, env_state)
+                    logger.log_llm_call(step_id, {
+                        **template, "promptTokens": 300, "completionTokens": 2,
+                    })
+                    logger.log_provider_access(
+                        step_id, {"providerName": "GAME_STATE", "data": env_state}
+                    )
+                    logger.complete_step(trajectory_id, step_id, {"actionName": "DOWN"})
+                logger.end_trajectory(trajectory_id)
+            elapsed = time.perf_counter() - start
+
+            written = sum(p.stat().st_size for p in Path(tmpdir).glob("*.json"))
+
+        results[tier.value] = {
+            "us_per_step": elapsed / (num_trajectories * steps_per_trajectory) * 1e6,
+            "bytes_per_trajectory": written / num_trajectories,
+        }
+
+    return results
+
+
+class _BenchmarkTokenizer:
+    """Dependency-free stand-in tokenizer (hashes words to ids)."""
+
+    fingerprint = "benchmark-words"
+    template_hash = "plain"
+
+    def encode_chat(self, messages: list[dict]) -> tuple[list[int], list[int]]:
+        ids: list[int] = []
+        mask: list[int] = []
+        for message in messages:
+            words = [f"<|{message['role']}|>", *message["content"].split()]
+            ids.extend(hash(w) % 128_000 for w in words)
+            mask.extend([int(message["role"] == "assistant")] * len(words))
+        return ids, mask
+
+
+async def benchmark_tokenized_export(
+    num_trajectories: int = 500,
+    num_steps: int = 20,
+    tokenizer_name: str | None = None,
+) -> dict:
+    """
+    Compare cold vs cached preparation of a pre-tokenized dataset.
+
+    Runs the same export twice against one token cache directory; the
+    second run should skip tokenization entirely.
+
+    Args:
+        num_trajectories: Trajectories to export
+        num_steps: Steps (LLM calls) per trajectory
+        tokenizer_name: HuggingFace tokenizer to use; defaults to a
+            dependency-free word tokenizer
+
+    Returns:
+        Seconds for each run, speedup, cache stats and the length histogram
+    """
+    from elizaos_art.eliza_integration.export import export_for_huggingface
+    from elizaos_art.eliza_integration.tokenization import HFChatTokenizer
+
+    if tokenizer_name:
+        tokenizer = HFChatTokenizer.from_pretrained(tokenizer_name)
+    else:
+        tokenizer = _BenchmarkTokenizer()
+
+    trajectories = [
+        _make_benchmark_trajectory(i, num_steps) for i in range(num_trajectories)
+    ]
+    results: dict = {}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_dir = Path(tmpdir) / "token-cache"
+        for run in ("cold", "cached"):
+            start = time.perf_counter()
+            files = await export_for_huggingface(
+                trajectories,
+                Path(tmpdir) / run,
+                tokenizer=tokenizer,
+                token_cache_dir=cache_dir,
+            )
+            results[f"{run}_seconds"] = time.perf_counter() - start
+
+            with open(files["token_lengths"]) as f:
+                stats = json.load(f)
+            results[f"{run}_cache"] = stats["cache"]
+
+    results["speedup"] = results["cold_seconds"] / results["cached_seconds"]
+    results["histogram"] = stats["histogram"]
+    return results
+
+
+def benchmark_prefix_cache(
+    model_path: str | Path,
+    num_games: int = 4,
+    turns: int = 6,
+    n_ctx: int = 4096,
+) -> dict:
+    """
+    Measure time-to-first-token with and without the prompt-prefix KV cache.
+
+    Several games are played in interleaved turns on one model, the way
+    concurrent rollouts share a local provider. Every prompt starts with
+    its game's long system prompt, so with the cache only the new turn
+    needs evaluating. Use a small GGUF model; this runs on CPU.
+
+    Returns:
+        Dict mapping mode to mean/p50 TTFT in milliseconds, plus cache stats
+    """
+    try:
+        from llama_cpp import Llama
+    except ImportError:
+        raise ImportError(
+            "llama-cpp-python not installed. "
+            "Install with: pip install llama-cpp-python"
+        )
+
+    from elizaos_art.eliza_integration.local_ai_adapter import PrefixKVCache
+
+    system_prompts = [
+        f"You are agent {g} playing a board game. Rules: " + "Merge equal tiles. " * 60
+        for g in range(num_games)
+    ]
+    llm = Llama(model_path=str(model_path), n_ctx=n_ctx, verbose=False)
+    results: dict = {}
+
+    for mode in ("no_cache", "prefix_cache"):
+        cache = PrefixKVCache() if mode == "prefix_cache" else None
+        llm.set_cache(cache)
+        llm.reset()
+
+        ttfts = []
+        for turn in range(turns):
+            for game, system_prompt in enumerate(system_prompts):
+                messages = [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": f"Turn {turn} of game {game}. Your move?"},
+                ]
+                start = time.perf_counter()
+                stream = llm.create_chat_completion(
+                    messages=messages, max_tokens=4, temperature=0.0, stream=True
+                )
+                next(iter(stream))
+                ttfts.append(time.perf_counter() - start)
+                for _ in stream:
+                    pass
+
+        # The first turn of each game is always cold
+        warm = sorted(ttfts[num_games:]) or sorted(ttfts)
+        results[mode] = {
+            "mean_ttft_ms": sum(warm) / len(warm) * 1000,
+            "p50_ttft_ms": warm[len(warm) // 2] * 1000,
+        }
+        if cache is not None:
+            results[mode]["cache"] = cache.get_stats()
+
+    results["speedup"] = results["no_cache"]["mean_ttft_ms"] / results["prefix_cache"]["mean_ttft_ms"]
+    return results
+
+
+async def benchmark_prompt_rendering(
+    episodes: int = 20,
+    group_size: int = 4,
+    renders_per_step: int = 3,
+    repeats: int = 5,
+) -> dict:
+    """
+    Measure prompt-building cost per step with and without the render cache.
+
+    Like a GRPO group, each seed is rolled out `group_size` times with
+    different (seeded) random policies, so rollouts share their opening
+    states. Each step's state is rendered `renders_per_step` times with
+    `to_prompt` (rollout, trajectory logging, export) and once with
+    `render`. The best of `repeats` runs is kept.
+
+    Returns:
+        Dict mapping game to microseconds per step uncached vs cached
+    """
+    import random
+
+    from elizaos_art.base import render_cache
+    from elizaos_art.benchmark_runner import ALL_GAMES, create_trainable
+
+    async def play(env) -> list:
+        states = []
+        for seed in range(episodes):
+            for member in range(group_size):
+                policy = random.Random(seed * group_size + member)
+                state = await env.reset(seed=seed)
+                states.append(state)
+                while not state.is_terminal():
+                    actions = env.get_available_actions(state)
+                    if not actions:
+                        break
+                    state, _, _ = await env.step(policy.choice(actions))
+                    states.append(state)
+        return states
+
+    results: dict = {}
+    for game in ALL_GAMES:
+        env, _ = create_trainable(game)
+        await env.initialize()
+
+        timings = {"uncached": float("inf"), "cached": float("inf")}
+        for _ in range(repeats):
+            for mode in timings:
+                # Fresh state objects each run, so nothing is memoized yet
+                states = await play(env)
+                render_cache.clear()
+                render_cache.enabled = mode == "cached"
+                start = time.perf_counter()
+                for state in states:
+                    for _ in range(renders_per_step):
+                        state.to_prompt()
+                    state.render()
+                elapsed = (time.perf_counter() - start) / len(states) * 1e6
+                timings[mode] = min(timings[mode], elapsed)
+
+        render_cache.enabled = True
+        results[game] = {
+            "steps": len(states),
+            "uncached_us_per_step": timings["uncached"],
+            "cached_us_per_step": timings["cached"],
+            "speedup": timings["uncached"] / timings["cached"],
+            "cache": render_cache.get_stats(),
+        }
+
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(asyncio.run(benchmark_storage_saves()), indent=2))
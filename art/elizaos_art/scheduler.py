@@ -0,0 +1,273 @@
+"""
+Concurrent job scheduler for multi-game runs.
+
+Per-game benchmark and training jobs are independent, so the CLI runs
+them side by side instead of one after another:
+
+- Each job declares how many CPU and inference slots it needs; a job
+  starts only when both budgets have room for it.
+- Every job gets its own progress row.
+- Job state (status, result, error) is saved to a JSON file as jobs
+  finish, so an interrupted sweep can resume and skip finished jobs.
+- A summary table is printed at the end.
+"""
+
+import asyncio
+import json
+import os
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
+from rich.table import Table
+
+
+@dataclass
+class JobState:
+    """Persisted state of one job."""
+
+    name: str
+    status: str = "pending"  # pending | running | done | failed
+    result: dict | None = None
+    error: str | None = None
+    completed: int = 0
+    total: int | None = None
+    duration_seconds: float = 0.0
+
+
+class JobContext:
+    """Handle passed to a running job for progress reporting."""
+
+    def __init__(self, state: JobState, on_update: Callable[[JobState], None]):
+        self.state = state
+        self._on_update = on_update
+
+    def set_total(self, total: int) -> None:
+        self.state.total = total
+        self._on_update(self.state)
+
+    def advance(self, amount: int = 1) -> None:
+        self.state.completed += amount
+        self._on_update(self.state)
+
+
+@dataclass
+class Job:
+    """
+    A unit of work for the scheduler.
+
+    Args:
+        name: Unique job name (used as the key in the state file)
+        run: Coroutine function returning a JSON-serializable result dict
+        cpu_slots: CPU slots held while running
+        inference_slots: Inference slots held while running
+        total: Progress units, if known up front
+    """
+
+    name: str
+    run: Callable[[JobContext], Awaitable[dict]]
+    cpu_slots: int = 1
+    inference_slots: int = 0
+    total: int | None = None
+
+
+class _Budget:
+    """Slot budgets that a job acquires all at once (no hold-and-wait)."""
+
+    def __init__(self, capacity: dict[str, int]):
+        self.capacity = capacity
+        self.available = dict(capacity)
+        self._condition = asyncio.Condition()
+
+    def _clamp(self, request: dict[str, int]) -> dict[str, int]:
+        # A job larger than a whole budget runs alone rather than never
+        return {k: min(n, self.capacity[k]) for k, n in request.items()}
+
+    async def acquire(self, request: dict[str, int]) -> dict[str, int]:
+        request = self._clamp(request)
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: all(self.available[k] >= n for k, n in request.items())
+            )
+            for k, n in request.items():
+                self.available[k] -= n
+        return request
+
+    async def release(self, request: dict[str, int]) -> None:
+        async with self._condition:
+            for k, n in request.items():
+                self.available[k] += n
+            self._condition.notify_all()
+
+
+class JobScheduler:
+    """
+    Run jobs concurrently within CPU and inference-slot budgets.
+
+    Args:
+        cpu_budget: CPU slots shared by all jobs (default: CPU count)
+        inference_budget: Inference slots shared by all jobs
+        state_path: JSON file for resumable job state (None = no state)
+        fingerprint: Parameters of the sweep; saved state from a sweep
+            with a different fingerprint is ignored
+        console: Console for progress and the summary table
+    """
+
+    def __init__(
+        self,
+        cpu_budget: int | None = None,
+        inference_budget: int = 1,
+        state_path: str | Path | None = None,
+        fingerprint: str = "",
+        console: Console | None = None,
+    ):
+        self.cpu_budget = max(1, cpu_budget or os.cpu_count() or 1)
+        self.inference_budget = max(1, inference_budget)
+        self.state_path = Path(state_path) if state_path else None
+        self.fingerprint = fingerprint
+        self.console = console or Console()
+
+    def _load_states(self, resume: bool) -> dict[str, JobState]:
+        if not (resume and self.state_path and self.state_path.exists()):
+            return {}
+        with open(self.state_path) as f:
+            data = json.load(f)
+        if data.get("fingerprint") != self.fingerprint:
+            return {}
+        return {name: JobState(**state) for name, state in data.get("jobs", {}).items()}
+
+    def _save_states(self, states: dict[str, JobState]) -> None:
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "fingerprint": self.fingerprint,
+                    "jobs": {name: asdict(state) for name, state in states.items()},
+                },
+                f,
+                indent=2,
+            )
+        os.replace(tmp_path, self.state_path)
+
+    async def run(self, jobs: list[Job], resume: bool = False) -> dict[str, JobState]:
+        """
+        Run all jobs and return their final states (in job order).
+
+        Args:
+            jobs: Jobs to run
+            resume: Skip jobs that finished in a previous run with the same
+                fingerprint, reusing their saved results
+        """
+        saved = self._load_states(resume)
+        states: dict[str, JobState] = {}
+        for job in jobs:
+            previous = saved.get(job.name)
+            if previous is not None and previous.status == "done":
+                states[job.name] = previous
+            else:
+                states[job.name] = JobState(name=job.name, total=job.total)
+        self._save_states(states)
+
+        budget = _Budget({"cpu": self.cpu_budget, "inference": self.inference_budget})
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=self.console,
+        ) as progress:
+            tasks = {}
+            for job in jobs:
+                state = states[job.name]
+                done = state.status == "done"
+                tasks[job.name] = progress.add_task(
+                    f"{job.name} [dim]({'resumed' if done else 'queued'})[/dim]",
+                    total=state.total,
+                    completed=state.completed if done else 0,
+                )
+
+            def on_update(state: JobState) -> None:
+                progress.update(tasks[state.name], completed=state.completed, total=state.total)
+
+            async def run_job(job: Job) -> None:
+                state = states[job.name]
+                if state.status == "done":
+                    return
+
+                slots = await budget.acquire(
+                    {"cpu": job.cpu_slots, "inference": job.inference_slots}
+                )
+                state.status = "running"
+                progress.update(tasks[job.name], description=f"{job.name}")
+                start = time.perf_counter()
+                try:
+                    state.result = await job.run(JobContext(state, on_update))
+                    state.status = "done"
+                except Exception as e:
+                    state.status = "failed"
+                    state.error = f"{type(e).__name__}: {e}"
+                    self.console.print(f"[red]✗ {job.name}[/red]: {state.error}")
+                    self.console.print(f"[dim]{traceback.format_exc()}[/dim]")
+                finally:
+                    state.duration_seconds = time.perf_counter() - start
+                    await budget.release(slots)
+
+                label = "[green]done[/green]" if state.status == "done" else "[red]failed[/red]"
+                progress.update(tasks[job.name], description=f"{job.name} {label}")
+                self._save_states(states)
+
+            await asyncio.gather(*(run_job(job) for job in jobs))
+
+        return states
+
+    def print_summary(
+        self,
+        states: dict[str, JobState],
+        title: str = "Job Summary",
+        columns: list[tuple[str, Callable[[dict], str]]] | None = None,
+    ) -> None:
+        """
+        Print a summary table of job states.
+
+        Args:
+            states: Job states returned by `run`
+            title: Table title
+            columns: Extra (header, formatter) columns computed from each
+                finished job's result dict
+        """
+        columns = columns or []
+        table = Table(title=title)
+        table.add_column("Job", style="cyan")
+        table.add_column("Status")
+        for header, _ in columns:
+            table.add_column(header, justify="right")
+        table.add_column("Duration", justify="right")
+
+        styles = {"done": "green", "failed": "red", "running": "yellow", "pending": "dim"}
+        for state in states.values():
+            extra = [fmt(state.result) if state.result else "-" for _, fmt in columns]
+            style = styles.get(state.status, "")
+            table.add_row(
+                state.name,
+                f"[{style}]{state.status}[/{style}]",
+                *extra,
+                f"{state.duration_seconds:.1f}s",
+            )
+
+        self.console.print(table)
@@ -139,6 +139,280 @@ class TestARTPlugin:
         assert plugin.actions[0].name == "PLAY_MOVE"
 
 
+class TestConcurrentRollouts:
+    """Tests for concurrent rollouts on one ARTRuntime."""
+
+    @pytest.mark.asyncio
+    async def test_interleaved_rollouts_are_isolated(self, temp_data_dir):
+        """Concurrent games must play out exactly as they do sequentially."""
+        import asyncio
+        import random
+
+        from elizaos import Content, Memory, string_to_uuid
+
+        from elizaos_art.eliza_integration.runtime_integration import (
+            ARTRuntime,
+            ARTRuntimeConfig,
+            create_art_plugin,
+        )
+        from elizaos_art.eliza_integration.runtime_pool import AgentRuntimePool
+        from elizaos_art.games.game_2048 import Game2048Agent, Game2048Environment
+
+        class InterleavingMessageService:
+            """Runs the game provider and action with random yields in between."""
+
+            def __init__(self, plugin, seed):
+                self.provider = plugin.providers[0]
+                self.action = plugin.actions[0]
+                self.logger = MagicMock()
+                self.message_service = self
+                self.rng = random.Random(seed)
+
+            async def yield_randomly(self):
+                for _ in range(self.rng.randint(0, 3)):
+                    await asyncio.sleep(0)
+
+            async def handle_message(self, runtime, message, callback=None):
+                await self.yield_randomly()
+                result = await self.provider.get(self, message, None)
+                await self.yield_randomly()
+
+                # Deterministic "model": the move depends only on the board
+                actions = result.text.split("## Available Actions\n")[1].split("\n")[0].split(", ")
+                move = actions[len(result.text) % len(actions)]
+                response = Memory(
+                    entity_id=string_to_uuid("agent"),
+                    room_id=message.room_id,
+                    content=Content(text=move),
+                )
+                await self.yield_randomly()
+                await self.action.handler(self, message, None, None, callback, [response])
+
+            def get_action_results(self, message_id):
+                return []
+
+            async def stop(self):
+                pass
+
+        async def play(concurrency, seed, pool_size=0):
+            runtime = ARTRuntime(
+                Game2048Environment(),
+                Game2048Agent(),
+                ARTRuntimeConfig(
+                    trajectory_dir=str(temp_data_dir / f"c{concurrency}-{pool_size}"),
+                    max_collected_in_memory=5,
+                ),
+                env_factory=Game2048Environment,
+            )
+            await runtime.env.initialize()
+            plugin = create_art_plugin(
+                runtime.env,
+                runtime.agent,
+                trajectory_backend=runtime.trajectory_backend,
+                contexts=runtime._contexts,
+            )
+            if pool_size:
+                async def factory():
+                    return InterleavingMessageService(plugin, seed)
+
+                runtime._pool = AgentRuntimePool(factory, size=pool_size)
+            else:
+                runtime._runtime = InterleavingMessageService(plugin, seed)
+            runtime._initialized = True
+
+            trajectories = []
+            for _ in range(2):
+                trajectories += await runtime.rollout_batch(
+                    "interleave", num_rollouts=12, seeds=list(range(12)),
+                    concurrency=concurrency,
+                )
+            assert runtime._contexts == {}
+
+            # Collection stays bounded in memory; exports stream both tiers
+            stats = runtime.get_collection_stats()
+            assert stats["in_memory"] == 5
+            assert stats["total"] == 24
+            export_path = temp_data_dir / f"export-{concurrency}-{pool_size}.jsonl"
+            await runtime.export_collected_trajectories(export_path)
+            assert len(export_path.read_text().splitlines()) == 24
+            assert len(await runtime.get_collected_trajectories()) == 24
+
+            await runtime.close()
+            return trajectories
+
+        # Without an env_factory the environment cannot be shared, so
+        # concurrency is refused rather than silently cloning it
+        unshared = ARTRuntime(Game2048Environment(), Game2048Agent(), ARTRuntimeConfig(
+            trajectory_dir=str(temp_data_dir / "unshared"),
+            max_concurrent_rollouts=4,
+        ))
+        unshared._initialized = True
+        with pytest.raises(ValueError, match="env_factory"):
+            await unshared.rollout_batch("interleave", num_rollouts=4)
+        await unshared.close()
+
+        sequential = await play(concurrency=1, seed=0)
+        concurrent = await play(concurrency=12, seed=1)
+        pooled = await play(concurrency=12, seed=2, pool_size=3)
+
+        assert len(concurrent) == len(pooled) == 24
+        for seq, conc in [*zip(sequential, concurrent), *zip(sequential, pooled)]:
+            assert conc.metadata["seed"] == seq.metadata["seed"]
+            assert conc.reward == seq.reward
+            assert conc.metrics["steps"] == seq.metrics["steps"]
+            assert conc.messages == seq.messages
+            steps = conc.metadata["trajectory_data"]["steps"]
+            assert len(steps) == conc.metrics["steps"]
+
+
+class TestAgentRuntimePool:
+    """Tests for the pre-warmed AgentRuntime pool."""
+
+    @staticmethod
+    def make_factory():
+        import asyncio
+
+        class FakeRuntime:
+            def __init__(self, index):
+                self.index = index
+                self.stopped = False
+
+            async def stop(self):
+                self.stopped = True
+
+        created = []
+        initializing = {"now": 0, "peak": 0}
+
+        async def factory():
+            initializing["now"] += 1
+            initializing["peak"] = max(initializing["peak"], initializing["now"])
+            await asyncio.sleep(0.01)
+            initializing["now"] -= 1
+            runtime = FakeRuntime(len(created))
+            created.append(runtime)
+            return runtime
+
+        return factory, created, initializing
+
+    @pytest.mark.asyncio
+    async def test_checkout_waits_for_checkin(self):
+        """Checkouts beyond the pool size wait for a runtime to come back."""
+        import asyncio
+
+        from elizaos_art.eliza_integration.runtime_pool import AgentRuntimePool
+
+        factory, created, initializing = self.make_factory()
+        pool = AgentRuntimePool(factory, size=2)
+        await pool.start(parallel=True)
+
+        assert len(created) == 2
+        assert initializing["peak"] == 2
+
+        first = await pool.checkout()
+        second = await pool.checkout()
+        assert first is not second
+
+        waiter = asyncio.create_task(pool.checkout())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await pool.checkin(first)
+        assert await waiter is first
+        assert pool.get_stats()["in_use"] == 2
+
+        await pool.checkin(second)
+        await pool.checkin(first)
+        await pool.close()
+        assert all(runtime.stopped for runtime in created)
+        assert pool.get_stats()["created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_and_worn_out_runtimes_are_recycled(self):
+        """Failed or over-used runtimes are stopped and replaced."""
+        from elizaos_art.eliza_integration.runtime_pool import AgentRuntimePool
+
+        factory, created, _ = self.make_factory()
+        pool = AgentRuntimePool(factory, size=1, max_uses=3)
+        await pool.start(parallel=False)
+
+        with pytest.raises(RuntimeError):
+            async with pool.lease():
+                raise RuntimeError("runtime wedged")
+
+        assert created[0].stopped
+        assert pool.get_stats()["recycled"] == 1
+
+        for _ in range(3):
+            async with pool.lease() as runtime:
+                assert runtime is created[1]
+        assert created[1].stopped
+
+        async with pool.lease() as runtime:
+            assert runtime is created[2]
+
+        stats = pool.get_stats()
+        assert stats["created"] == 3
+        assert stats["recycled"] == 2
+        assert stats["idle"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_factory_failures_do_not_lose_slots(self):
+        """A failed replacement keeps its slot, and close() wakes waiters."""
+        import asyncio
+
+        from elizaos_art.eliza_integration.runtime_pool import AgentRuntimePool
+
+        factory, created, _ = self.make_factory()
+        failing = {"on": False}
+
+        async def flaky_factory():
+            if failing["on"]:
+                raise OSError("model download failed")
+            return await factory()
+
+        pool = AgentRuntimePool(flaky_factory, size=1)
+        await pool.start()
+
+        # The caller's error survives a failed recycle
+        failing["on"] = True
+        with pytest.raises(ValueError):
+            async with pool.lease():
+                raise ValueError("rollout failed")
+        assert pool.get_stats()["create_failures"] == 1
+
+        # The lost slot is recreated by a later checkout
+        with pytest.raises(OSError):
+            await pool.checkout()
+        failing["on"] = False
+        async with pool.lease() as runtime:
+            assert runtime is created[1]
+
+        runtime = await pool.checkout()
+        waiter = asyncio.create_task(pool.checkout())
+        await asyncio.sleep(0.01)
+        await pool.close()
+        with pytest.raises(RuntimeError):
+            await waiter
+        await pool.checkin(runtime)
+        assert runtime.stopped
+
+        # A failed start stops the runtimes it already created
+        calls = {"n": 0}
+
+        async def third_fails():
+            calls["n"] += 1
+            if calls["n"] == 3:
+                raise OSError("out of memory")
+            return await factory()
+
+        broken = AgentRuntimePool(third_fails, size=3)
+        with pytest.raises(OSError):
+            await broken.start(parallel=True)
+        assert all(r.stopped for r in created[2:])
+        assert broken.get_stats()["idle"] == 0
+
+
 class TestTrajectoryConversion:
     """Tests for trajectory format conversion."""
 
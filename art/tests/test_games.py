@@ -92,6 +92,52 @@ class TestGame2048:
         assert len(actions) > 0
         assert all(isinstance(a, Game2048Action) for a in actions)
 
+    @pytest.mark.asyncio
+    async def test_expectimax_agent(self):
+        """Test packed-board moves and the expectimax agent."""
+        import random
+
+        from elizaos_art.games.game_2048 import Game2048Environment, Game2048ExpectimaxAgent
+        from elizaos_art.games.game_2048.expectimax import (
+            canonical_board,
+            decode_board,
+            encode_board,
+            move_board,
+            transpose,
+        )
+        from elizaos_art.games.game_2048.types import Game2048Action
+
+        env = Game2048Environment()
+        rng = random.Random(0)
+        for _ in range(200):
+            board = [rng.choice([0, 0, 2, 4, 8, 16]) for _ in range(16)]
+            packed = encode_board(board)
+            assert decode_board(packed) == tuple(board)
+            assert transpose(transpose(packed)) == packed
+            for action in Game2048Action:
+                expected, score, _ = env._apply_move(list(board), action)
+                new, delta = move_board(packed, action)
+                assert decode_board(new) == tuple(expected)
+                assert delta == score
+
+            # Mirrored boards share a canonical form
+            mirrored = [board[r * 4 + 3 - c] for r in range(4) for c in range(4)]
+            assert canonical_board(encode_board(mirrored)) == canonical_board(packed)
+
+        agent = Game2048ExpectimaxAgent(max_depth=2, time_budget_ms=None)
+        await env.initialize()
+        state = await env.reset(seed=42)
+        for _ in range(20):
+            actions = env.get_available_actions(state)
+            action = await agent.decide(state, actions)
+            assert action in actions
+            state, _, _ = await env.step(action)
+
+        stats = agent.get_stats()
+        assert stats["moves"] == 20
+        assert stats["mean_depth"] == 2
+        assert stats["nodes_per_sec"] > 0
+
 
 class TestTicTacToe:
     """Tests for Tic-Tac-Toe game."""
@@ -149,6 +195,51 @@ class TestTicTacToe:
         assert state.is_terminal()
         assert moves <= 9  # Max 9 moves in Tic-Tac-Toe
 
+    @pytest.mark.asyncio
+    async def test_solved_table(self):
+        """Test the solved-game table and the optimal opponent."""
+        from elizaos_art.games.tic_tac_toe import TicTacToeEnvironment, TicTacToeHeuristicAgent
+        from elizaos_art.games.tic_tac_toe.solver import (
+            best_move,
+            best_moves,
+            canonical,
+            game_value,
+            table_size,
+        )
+        from elizaos_art.games.tic_tac_toe.types import Player, TicTacToeConfig
+
+        empty = tuple([0] * 9)
+        assert game_value(empty, Player.X) == 0
+        assert best_moves(empty, Player.X) == list(range(9))
+        # 765 positions up to symmetry, minus the terminal ones
+        assert table_size() == 627
+
+        # Rotated boards share a canonical form
+        board = (1, 2, 0, 0, 1, 0, 0, 0, 0)
+        rotated = tuple(board[i] for i in (6, 3, 0, 7, 4, 1, 8, 5, 2))
+        assert canonical(board)[0] == canonical(rotated)[0]
+
+        # Immediate wins are taken (X), even over blocking a threat (O)
+        assert best_move(board, Player.X) == 8
+        assert game_value(board, Player.X) == 10
+        assert best_move((1, 0, 2, 1, 1, 0, 0, 0, 2), Player.O) == 5
+
+        # The optimal opponent never loses, and optimal play always draws
+        for agent, opponent in [
+            (TicTacToeHeuristicAgent(), "minimax"),
+            (TicTacToeHeuristicAgent(optimal=True), "optimal"),
+        ]:
+            env = TicTacToeEnvironment(TicTacToeConfig(opponent=opponent))
+            await env.initialize()
+            for seed in range(10):
+                state = await env.reset(seed=seed)
+                while not state.is_terminal():
+                    action = await agent.decide(state, env.get_available_actions(state))
+                    state, _, _ = await env.step(action)
+                assert state.winner != Player.X
+                if agent.optimal:
+                    assert state.is_draw
+
 
 class TestCodenames:
     """Tests for Codenames game."""
@@ -195,6 +286,56 @@ class TestCodenames:
             # Word should now be revealed
             assert new_state.revealed[word_action.value]
 
+    @pytest.mark.asyncio
+    async def test_embedding_baselines(self, tmp_path):
+        """Test embedding spymaster clues and guesses."""
+        from elizaos_art.games.codenames import (
+            CodenamesEmbeddings,
+            CodenamesEnvironment,
+            CodenamesGuesserAgent,
+        )
+        from elizaos_art.games.codenames.embeddings import get_default_embeddings
+        from elizaos_art.games.codenames.types import (
+            CardColor,
+            CodenamesAction,
+            CodenamesConfig,
+            Role,
+        )
+
+        embeddings = get_default_embeddings()
+        env = CodenamesEnvironment(CodenamesConfig(ai_role=Role.GUESSER, ai_team=CardColor.RED))
+        agent = CodenamesGuesserAgent()
+        await env.initialize()
+
+        for seed in range(5):
+            state = await env.reset(seed=seed)
+            clue = state.current_clue
+            assert clue.word in embeddings.clues
+            assert clue.word not in state.words
+            assert clue == embeddings.choose_clue(state)
+
+            # The clue's closest words are the team's
+            ranked = embeddings.rank_words(state, clue.word)
+            for idx, _ in ranked[: clue.number]:
+                assert state.colors[idx] == CardColor.RED
+
+            # The guesser takes the clue's words, then passes on the bonus guess
+            for _ in range(clue.number):
+                action = await agent.decide(state, env.get_available_actions(state))
+                assert action != CodenamesAction.PASS
+                state, reward, _ = await env.step(action)
+                assert reward == 1.0
+            if not state.game_over and state.current_team == CardColor.RED:
+                action = await agent.decide(state, env.get_available_actions(state))
+                assert action == CodenamesAction.PASS
+
+        # Pretrained vectors in GloVe text format
+        vectors = tmp_path / "vectors.txt"
+        vectors.write_text("fruit 1 0 0\napple 0.9 0.1 0\nberry 0.8 0 0.2\nbomb 0 1 0\n")
+        glove = CodenamesEmbeddings.from_vectors_file(vectors, clues=["fruit"])
+        assert glove.clues == ["FRUIT"]
+        assert glove.similarity("fruit", "APPLE") > glove.similarity("fruit", "BOMB")
+
 
 class TestTemporalClue:
     """Tests for Temporal Clue game."""
@@ -262,6 +403,65 @@ class TestTemporalClue:
         # Should be submitted
         assert state.submitted
 
+    @pytest.mark.asyncio
+    async def test_puzzle_bank(self, tmp_path):
+        """Test that bank puzzles are unique, graded, and looked up by seed."""
+        from elizaos_art.games.temporal_clue import (
+            Difficulty,
+            PuzzleBank,
+            TemporalClueConfig,
+            TemporalClueEnvironment,
+        )
+        from elizaos_art.games.temporal_clue.puzzle_bank import (
+            count_inferred_pairs,
+            generate_bank,
+            grade_difficulty,
+            solve,
+        )
+        from elizaos_art.games.temporal_clue.types import TemporalClue
+
+        # Two "before" clues leave two orderings; a third pins one down
+        events = ["A", "B", "C"]
+        clues = [
+            TemporalClue(event_a="A", event_b="B", relation="before"),
+            TemporalClue(event_a="A", event_b="C", relation="before"),
+        ]
+        assert len(solve(events, clues).solutions) == 2
+        clues.append(TemporalClue(event_a="C", event_b="B", relation="after"))
+        assert solve(events, clues).solutions == [(0, 1, 2)]
+
+        bank = generate_bank(per_difficulty=4, seed=7)
+        path = bank.save(tmp_path / "bank.json")
+        assert path.read_text() == generate_bank(per_difficulty=4, seed=7).save(
+            tmp_path / "again.json"
+        ).read_text()
+
+        loaded = PuzzleBank.load(path)
+        for difficulty in Difficulty:
+            assert loaded.size(difficulty) == 4
+            for i in range(4):
+                puzzle = loaded.get(difficulty, i)
+                result = solve(list(puzzle.events), list(puzzle.clues))
+                assert len(result.solutions) == 1
+                solution = tuple(puzzle.events[k] for k in result.solutions[0])
+                assert solution == puzzle.correct_ordering
+                inferred = count_inferred_pairs(list(solution), list(puzzle.clues))
+                assert grade_difficulty(len(solution), result.guesses, inferred) == difficulty
+
+        config = TemporalClueConfig(difficulty=Difficulty.HARD, puzzle_bank_path=str(path))
+        env = TemporalClueEnvironment(config)
+        state = await env.reset(seed=5)
+        assert state.clues == loaded.get(Difficulty.HARD, 1).clues
+        assert 7 <= len(state.events) <= 8
+
+        # Too small for a hard puzzle: falls back to the nearest difficulty
+        config = TemporalClueConfig(
+            difficulty=Difficulty.HARD, custom_scenarios=[{"events": ["X", "Y", "Z"]}]
+        )
+        state = await TemporalClueEnvironment(config).reset(seed=1)
+        assert state.correct_ordering == ("X", "Y", "Z")
+        assert len(solve(list(state.events), list(state.clues)).solutions) == 1
+
 
 class TestAgentPrompts:
     """Tests for agent prompt generation."""
@@ -300,5 +500,126 @@ class TestAgentPrompts:
         assert "spymaster" in prompt.lower() or "guesser" in prompt.lower()
 
 
+class TestMemoizedRendering:
+    """Tests for memoized to_prompt/render on frozen states."""
+
+    @pytest.mark.asyncio
+    async def test_memoized_prompts(self):
+        """Test memoized output matches uncached rendering and is shared."""
+        import dataclasses
+
+        from elizaos_art.base import render_cache
+        from elizaos_art.games.codenames import CodenamesEnvironment
+        from elizaos_art.games.game_2048 import Game2048Environment
+        from elizaos_art.games.temporal_clue import TemporalClueEnvironment
+        from elizaos_art.games.tic_tac_toe import TicTacToeEnvironment
+
+        render_cache.clear()
+        for env in (
+            Game2048Environment(),
+            TicTacToeEnvironment(),
+            CodenamesEnvironment(),
+            TemporalClueEnvironment(),
+        ):
+            await env.initialize()
+            state = await env.reset(seed=7)
+            cls = type(state)
+
+            prompt = state.to_prompt()
+            assert prompt == cls.to_prompt.__wrapped__(state)
+            assert state.render() == cls.render.__wrapped__(state)
+            assert state.to_prompt() is prompt
+
+            # An equal state built separately reuses the shared entry
+            hits = render_cache.hits
+            assert dataclasses.replace(state).to_prompt() is prompt
+            assert render_cache.hits == hits + 1
+
+        render_cache.enabled = False
+        try:
+            state = await TicTacToeEnvironment().reset(seed=7)
+            assert state.to_prompt() is not state.to_prompt()
+        finally:
+            render_cache.enabled = True
+
+    def test_unhashable_state_and_bounded_cache(self):
+        """Test unhashable states still render and the cache stays bounded."""
+        from dataclasses import dataclass
+
+        from elizaos_art.base import RenderCache, State, memoized_render
+
+        @dataclass(frozen=True)
+        class ListState(State):
+            items: list
+
+            @memoized_render
+            def to_prompt(self) -> str:
+                return ",".join(self.items)
+
+            def to_dict(self) -> dict:
+                return {"items": self.items}
+
+            def is_terminal(self) -> bool:
+                return False
+
+        state = ListState(items=["a", "b"])
+        assert state.to_prompt() == "a,b"
+        assert state.to_prompt() == "a,b"
+
+        cache = RenderCache(maxsize=2)
+        for i in range(3):
+            cache.put(("k", i), str(i))
+        assert len(cache) == 2
+        assert cache.get(("k", 0)) is None
+        assert cache.get(("k", 2)) == "2"
+
+
+class TestEnvBenchmark:
+    """Tests for the environment microbenchmark suite."""
+
+    @pytest.mark.asyncio
+    async def test_benchmark_and_regression_check(self, tmp_path):
+        """Test that runs are reproducible and slowdowns are flagged."""
+        import copy
+
+        from elizaos_art.env_benchmark import (
+            EnvBenchmarkConfig,
+            compare_to_baseline,
+            load_baseline,
+            run_env_benchmarks,
+            save_baseline,
+        )
+
+        config = EnvBenchmarkConfig(seeds=3, rounds=1)
+        report = await run_env_benchmarks(["tic_tac_toe", "temporal_clue"], config)
+        result = report["results"]["tic_tac_toe"]
+        assert result["steps"] > 0
+        assert result["step_us"] > 0 and result["steps_per_sec"] > 0
+
+        path = save_baseline(report, tmp_path / "baseline.json")
+        baseline = load_baseline(path)
+
+        # Same seeds replay the same episodes
+        rerun = await run_env_benchmarks(["tic_tac_toe", "temporal_clue"], config)
+        assert rerun["results"]["tic_tac_toe"]["steps"] == result["steps"]
+
+        assert compare_to_baseline(report, baseline, threshold=0.25) == []
+
+        slower = copy.deepcopy(report)
+        slower["results"]["tic_tac_toe"]["step_us"] *= 2
+        regressions = compare_to_baseline(slower, baseline, threshold=0.25)
+        assert [(r["game"], r["metric"]) for r in regressions] == [("tic_tac_toe", "step_us")]
+        assert regressions[0]["change"] == pytest.approx(1.0)
+
+        other = await run_env_benchmarks(["tic_tac_toe"], EnvBenchmarkConfig(seeds=4, rounds=1))
+        with pytest.raises(ValueError):
+            compare_to_baseline(other, baseline)
+
+        baseline["schema_version"] = 0
+        save_baseline(baseline, path)
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -10,11 +10,31 @@ Tests the integration between:
 """
 
 import asyncio
+import json
 import pytest
 import tempfile
 from pathlib import Path
 
 
+class WordTokenizer:
+    """Dependency-free ChatTokenizer: one token per role tag and word."""
+
+    fingerprint = "word-tokenizer"
+    template_hash = "plain"
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode_chat(self, messages: list[dict]) -> tuple[list[int], list[int]]:
+        self.calls += 1
+        ids, mask = [], []
+        for message in messages:
+            words = [message["role"], *message["content"].split()]
+            ids.extend(sum(w.encode()) for w in words)
+            mask.extend([int(message["role"] == "assistant")] * len(words))
+        return ids, mask
+
+
 @pytest.fixture
 def temp_data_dir():
     """Create a temporary data directory."""
@@ -98,6 +118,142 @@ class TestTrajectoryAdapter:
         traj_file = temp_data_dir / "trajectories" / f"{traj_id}.json"
         assert traj_file.exists()
 
+    @pytest.mark.asyncio
+    async def test_step_index_lookup(self, temp_data_dir):
+        """Test steps are found by ID across trajectories and dropped on end."""
+        from elizaos_art.eliza_integration.trajectory_adapter import ElizaTrajectoryLogger
+
+        logger = ElizaTrajectoryLogger(
+            agent_id="test-agent", data_dir=temp_data_dir, auto_persist=False
+        )
+        first = logger.start_trajectory()
+        second = logger.start_trajectory()
+        first_step = logger.start_step(first, {})
+        second_step = logger.start_step(second, {})
+
+        logger.log_llm_call(second_step, {"response": "B"})
+        logger.log_provider_access(first_step, {"providerName": "GAME_STATE"})
+        logger.log_llm_call("unknown-step", {"response": "ignored"})
+
+        # A step from another trajectory is not completed
+        logger.complete_step(first, second_step, {"actionName": "WRONG"}, reward=5.0)
+        assert logger.get_active_trajectory(first)["totalReward"] == 0.0
+
+        logger.complete_step(second, second_step, {"actionName": "MOVE"}, reward=1.0)
+        ended = logger.end_trajectory(second)
+        assert ended["steps"][0]["llmCalls"][0]["response"] == "B"
+        assert ended["totalReward"] == 1.0
+
+        # Logging to an ended trajectory's step is a no-op
+        logger.log_llm_call(second_step, {"response": "late"})
+        assert len(ended["steps"][0]["llmCalls"]) == 1
+        assert len(logger.get_active_trajectory(first)["steps"][0]["providerAccesses"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_behind_persistence(self, temp_data_dir):
+        """Test write-behind logging drains to the usual trajectory files."""
+        from elizaos_art.eliza_integration.trajectory_adapter import ElizaTrajectoryLogger
+
+        logger = ElizaTrajectoryLogger(
+            agent_id="test-agent",
+            data_dir=temp_data_dir,
+            write_behind=True,
+            max_pending_steps=4,
+        )
+        trajectory_ids = []
+        for t in range(5):
+            trajectory_id = logger.start_trajectory(scenario_id="wb")
+            for s in range(10):
+                step_id = logger.start_step(trajectory_id, {"step": s})
+                logger.log_llm_call(step_id, {"response": f"{t}-{s}"})
+                logger.complete_step(trajectory_id, step_id, {"actionName": "MOVE"}, reward=1.0)
+                # Completed steps are no longer held in memory
+                assert logger.get_active_trajectory(trajectory_id)["steps"] == []
+            logger.end_trajectory(trajectory_id)
+            trajectory_ids.append(trajectory_id)
+
+        loaded = logger.load_trajectory(trajectory_ids[0])
+        assert [s["stepNumber"] for s in loaded["steps"]] == list(range(10))
+        assert loaded["steps"][3]["llmCalls"][0]["response"] == "0-3"
+        assert loaded["totalReward"] == 10.0
+        assert loaded["metrics"]["episodeLength"] == 10
+
+        logger.close()
+        assert sorted(logger.list_trajectories()) == sorted(trajectory_ids)
+        assert not list(temp_data_dir.glob("*.steps.jsonl"))
+        assert logger._write_behind.get_stats()["steps_written"] == 50
+
+    @pytest.mark.asyncio
+    async def test_write_behind_failure(self, temp_data_dir):
+        """Test a failed write is raised instead of stalling the queue."""
+        from elizaos_art.eliza_integration.trajectory_adapter import TrajectoryWriteBehind
+
+        writer = TrajectoryWriteBehind(temp_data_dir, max_pending=2, batch_size=1)
+        writer.submit_step("bad", {"stepNumber": 0, "value": object()})
+        writer.submit_end("bad", {"trajectoryId": "bad"})
+        # The worker keeps draining past the failure
+        for i in range(10):
+            writer.submit_step("good", {"stepNumber": i})
+        writer.submit_end("good", {"trajectoryId": "good"})
+
+        with pytest.raises(TypeError):
+            writer.wait_for("bad", timeout=5)
+        assert writer.wait_for("good", timeout=5)
+        assert len(json.loads((temp_data_dir / "good.json").read_text())["steps"]) == 10
+        with pytest.raises(TypeError):
+            writer.flush()
+        with pytest.raises(TypeError):
+            writer.close()
+        assert writer.get_stats()["failed_trajectories"] == 1
+
+    @pytest.mark.asyncio
+    async def test_capture_tiers_and_sampling(self, temp_data_dir):
+        """Test reduced capture tiers and per-trajectory sampling."""
+        from elizaos_art.eliza_integration.trajectory_adapter import (
+            CaptureTier,
+            ElizaTrajectoryLogger,
+        )
+
+        def run_episode(logger: ElizaTrajectoryLogger) -> dict:
+            trajectory_id = logger.start_trajectory()
+            step_id = logger.start_step(trajectory_id, {"board": [2, 4]})
+            logger.log_llm_call(step_id, {
+                "userPrompt": "secret board",
+                "response": "LEFT",
+                "promptTokens": 10,
+                "completionTokens": 2,
+                "latencyMs": 5,
+            })
+            logger.log_provider_access(step_id, {"providerName": "GAME", "data": {"x": 1}})
+            logger.complete_step(trajectory_id, step_id, {"actionName": "LEFT"}, reward=1.0)
+            return logger.end_trajectory(trajectory_id)
+
+        hashed = run_episode(ElizaTrajectoryLogger(
+            "agent", temp_data_dir / "hashes", capture_tier=CaptureTier.HASHES
+        ))
+        call = hashed["steps"][0]["llmCalls"][0]
+        assert hashed["captureTier"] == "hashes"
+        assert "userPrompt" not in call and call["userPromptLength"] == 12
+        assert "secret" not in json.dumps(hashed)
+
+        metrics = run_episode(ElizaTrajectoryLogger(
+            "agent", temp_data_dir / "metrics", capture_tier="metrics"
+        ))
+        assert "llmCalls" not in metrics["steps"][0]
+        assert metrics["metrics"]["llm"] == {
+            "calls": 1, "promptTokens": 10, "completionTokens": 2, "latencyMs": 5,
+        }
+        assert metrics["metrics"]["providerAccesses"] == 1
+        assert metrics["totalReward"] == 1.0
+
+        sampled = ElizaTrajectoryLogger(
+            "agent", temp_data_dir / "sampled", auto_persist=False,
+            sample_rate=0.25, sample_seed=7,
+        )
+        tiers = [run_episode(sampled)["captureTier"] for _ in range(200)]
+        assert set(tiers) == {"full", "metrics"}
+        assert 20 < tiers.count("full") < 80
+
 
 class TestStorageAdapter:
     """Tests for ElizaStorageAdapter."""
@@ -149,6 +305,95 @@ class TestStorageAdapter:
         scenario_1 = await storage.get_trajectories_by_scenario("scenario-1")
         assert len(scenario_1) == 2  # 1, 3
 
+    @pytest.mark.asyncio
+    async def test_prompt_dedup_round_trip(self, temp_data_dir):
+        """Test deduplicated prompts are stored once and rehydrated on read and export."""
+        from elizaos_art.eliza_integration.export import ExportOptions, export_for_art
+        from elizaos_art.eliza_integration.storage_adapter import ElizaStorageAdapter
+        from elizaos_art.eliza_integration.trajectory_adapter import ElizaTrajectoryLogger
+
+        system_prompt = "You are an expert 2048 player. Merge tiles carefully.\n\n" * 20
+        # The usual layout: the logger writes into the store's trajectories dir
+        logger = ElizaTrajectoryLogger(
+            agent_id="test-agent",
+            data_dir=temp_data_dir / "trajectories",
+            dedupe_prompts=True,
+        )
+        trajectory_id = logger.start_trajectory(scenario_id="dedup")
+        for s in range(30):
+            step_id = logger.start_step(trajectory_id, {})
+            logger.log_llm_call(step_id, {
+                "systemPrompt": system_prompt,
+                "userPrompt": f"Move {s}",
+                "response": "LEFT",
+            })
+            logger.complete_step(trajectory_id, step_id, {"actionName": "LEFT"})
+
+        ended = logger.end_trajectory(trajectory_id)
+        loaded = logger.load_trajectory(trajectory_id)
+        assert ended["steps"][7]["llmCalls"][0]["systemPrompt"] == system_prompt
+        assert loaded["steps"][29]["llmCalls"][0]["systemPrompt"] == system_prompt
+
+        raw = (temp_data_dir / "trajectories" / f"{trajectory_id}.json").read_text()
+        assert system_prompt not in raw
+        # 30 inline copies of the system prompt alone would be larger
+        assert len(raw) < len(system_prompt) * 30
+
+        # Stores with and without dedupe (and a plain logger) read the text back
+        for dedupe_prompts in (False, True):
+            storage = ElizaStorageAdapter(data_dir=temp_data_dir, dedupe_prompts=dedupe_prompts)
+            assert await storage.get_trajectory(trajectory_id) == loaded
+            result = await export_for_art(
+                storage,
+                ExportOptions(output_dir=str(temp_data_dir / "exports"), train_ratio=1.0),
+            )
+            with open(result.output_files[0]) as f:
+                record = json.loads(f.readline())
+            assert record["messages"][0] == {"role": "system", "content": system_prompt}
+            await storage.close()
+        plain = ElizaTrajectoryLogger(agent_id="reader", data_dir=temp_data_dir / "trajectories")
+        assert plain.load_trajectory(trajectory_id) == loaded
+
+        # A deduplicating store writes blobs a fresh adapter can resolve
+        storage = ElizaStorageAdapter(data_dir=temp_data_dir / "db", dedupe_prompts=True)
+        await storage.save_trajectory(loaded)
+        assert system_prompt not in (
+            temp_data_dir / "db" / "trajectories" / f"{trajectory_id}.json"
+        ).read_text()
+        reopened = ElizaStorageAdapter(data_dir=temp_data_dir / "db")
+        assert await reopened.get_trajectory(trajectory_id) == loaded
+
+    def test_prompt_store_bounded_cache(self, temp_data_dir, monkeypatch):
+        """Test saved chunks are evicted and unsaved ones survive a failed write."""
+        from pathlib import Path
+
+        from elizaos_art.eliza_integration.prompt_store import PromptBlobStore
+
+        store = PromptBlobStore(temp_data_dir / "blobs", min_chunk=16, max_cached_chars=100)
+        refs = {f"prompt {i} " * 8: None for i in range(20)}
+        for text in refs:
+            refs[text] = store.put_text(text)
+        assert store.save() == 20
+
+        stats = store.get_stats()
+        assert stats["unsaved_blobs"] == 0
+        assert stats["cached_chars"] <= 100
+        # Evicted chunks are read back from disk
+        for text, ref in refs.items():
+            assert store.get_text(ref) == text
+
+        def fail(self, data):
+            raise OSError("disk full")
+
+        ref = store.put_text("not yet saved " * 4)
+        monkeypatch.setattr(Path, "write_text", fail)
+        with pytest.raises(OSError):
+            store.save()
+        assert store.get_stats()["unsaved_blobs"] == 1
+        monkeypatch.undo()
+        assert store.save() == 1
+        assert PromptBlobStore(temp_data_dir / "blobs").get_text(ref) == "not yet saved " * 4
+
     @pytest.mark.asyncio
     async def test_cache_operations(self, temp_data_dir):
         """Test cache operations."""
@@ -190,6 +435,198 @@ class TestStorageAdapter:
         checkpoints = await storage.list_checkpoints()
         assert "checkpoint-100" in checkpoints
 
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_flush_and_close(self, temp_data_dir):
+        """Test concurrent saves land on disk after flush/close."""
+        from elizaos_art.eliza_integration.storage_adapter import ElizaStorageAdapter
+
+        storage = ElizaStorageAdapter(data_dir=temp_data_dir)
+
+        await asyncio.gather(*(
+            storage.save_trajectory(
+                {"trajectoryId": f"traj-{i}", "steps": []},
+                embedding=[float(i)] * 384,
+            )
+            for i in range(20)
+        ))
+        await storage.log("test", {"n": 1})
+        await storage.close()
+
+        assert (temp_data_dir / "vectors" / "hnsw_index.json").exists()
+        reopened = ElizaStorageAdapter(data_dir=temp_data_dir)
+        assert await reopened.trajectories.count() == 20
+        assert len(reopened.trajectories.vector_index.vectors) == 20
+        assert len(await reopened.get_logs(log_type="test")) == 1
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_io_executor_ordering_and_coalescing(self):
+        """Test per-key ordering, coalescing of rewrites, and no coalescing of appends."""
+        import threading
+
+        from elizaos_art.eliza_integration.storage_adapter import StorageIOExecutor
+
+        io = StorageIOExecutor(max_workers=2)
+        gate = threading.Event()
+        applied: list[str] = []
+
+        io.submit_write("key", lambda: gate.wait(5), coalesce=False)
+        io.submit_write("key", lambda: applied.append("rewrite-1"))
+        io.submit_write("key", lambda: applied.append("rewrite-2"))
+        io.submit_write("key", lambda: applied.append("append-1"), coalesce=False)
+        io.submit_write("key", lambda: applied.append("append-2"), coalesce=False)
+        gate.set()
+        await io.flush()
+
+        assert applied == ["rewrite-2", "append-1", "append-2"]
+        assert io.get_stats()["writes_coalesced"] == 1
+        await io.close()
+
+    @pytest.mark.asyncio
+    async def test_io_executor_reports_failed_writes(self):
+        """Test that a failed fire-and-forget write is raised by flush/close, once."""
+        from elizaos_art.eliza_integration.storage_adapter import StorageIOExecutor
+
+        def fail():
+            raise OSError("disk full")
+
+        io = StorageIOExecutor(max_workers=2)
+        io.submit_write("index", fail)
+        io.submit_write("other", lambda: None)
+        with pytest.raises(OSError, match="disk full"):
+            await io.flush()
+        await io.flush()  # reported once
+
+        # An awaited write reports its own failure; flush doesn't repeat it
+        with pytest.raises(OSError):
+            await io.write("index", fail)
+        await io.flush()
+
+        # Per-key flushes only report their key's failures
+        io.submit_write("index", fail)
+        await io.flush("other")
+        with pytest.raises(OSError):
+            await io.close()
+        with pytest.raises(RuntimeError):
+            io.submit_write("index", lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_bulk_index_trajectories(self, temp_data_dir):
+        """Test embedding stored trajectories into the vector index in batches."""
+        from elizaos_art.eliza_integration.local_ai_adapter import MockLocalAIProvider
+        from elizaos_art.eliza_integration.storage_adapter import (
+            TrajectoryStore,
+            trajectory_embedding_text,
+        )
+
+        store = TrajectoryStore(data_dir=temp_data_dir, embedding_dimensions=48)
+        for i in range(10):
+            await store.save_trajectory({
+                "trajectoryId": f"traj-{i}",
+                "scenarioId": f"scenario-{i}",
+                "steps": [{"llmCalls": [{"userPrompt": f"board {i}"}], "action": {"actionName": "UP"}}],
+            })
+
+        provider = MockLocalAIProvider()
+        calls = []
+
+        async def embed(texts):
+            calls.append(len(texts))
+            return await provider.generate_embeddings(texts)
+
+        stats = await store.index_trajectories(embed, batch_size=4)
+        assert stats["indexed"] == 10
+        assert stats["batches"] == 3
+        assert calls == [4, 4, 2]
+        assert stats["backends"] == {"mock-sha384": 10}
+
+        # Already-indexed trajectories are skipped
+        stats = await store.index_trajectories(embed, batch_size=4)
+        assert stats == {"indexed": 0, "skipped": 10, "batches": 0, "backends": {}}
+
+        saved = await store.get_trajectory("traj-3")
+        query = await provider.generate_embedding(trajectory_embedding_text(saved))
+        results = await store.search_similar(query, k=1, threshold=0.99)
+        assert results[0][0]["trajectoryId"] == "traj-3"
+
+        await store.close()
+        reopened = TrajectoryStore(data_dir=temp_data_dir, embedding_dimensions=48)
+        assert len(reopened.vector_index.vectors) == 10
+        await reopened.close()
+        provider.close()
+
+    @pytest.mark.asyncio
+    async def test_spilling_trajectory_buffer(self, temp_data_dir):
+        """Test bounded in-memory window with ordered spill-to-disk."""
+        import gc
+
+        from elizaos_art.eliza_integration.storage_adapter import SpillingTrajectoryBuffer
+
+        spill_path = temp_data_dir / "collected.jsonl"
+        buffer = SpillingTrajectoryBuffer(spill_path, max_in_memory=10)
+        for i in range(95):
+            buffer.append({"trajectoryId": f"traj-{i}", "steps": [{"stepNumber": 0}]})
+            assert buffer.get_stats()["in_memory"] <= 10
+
+        await buffer.flush()
+        stats = buffer.get_stats()
+        assert stats["total"] == len(buffer) == 95
+        assert stats["spilled"] == 85
+        assert stats["spill_bytes"] > 0
+
+        # Appends during iteration are neither duplicated nor half-seen
+        seen = []
+        for traj in buffer:
+            seen.append(traj["trajectoryId"])
+            if len(seen) == 50:
+                buffer.append({"trajectoryId": "late", "steps": []})
+        assert seen == [f"traj-{i}" for i in range(95)]
+        assert [t["trajectoryId"] for t in buffer][-1] == "late"
+
+        # async for reads the spill file in batches on the executor
+        buffer.READ_BATCH = 7
+        seen = []
+        async for traj in buffer:
+            seen.append(traj["trajectoryId"])
+            if len(seen) == 50:
+                buffer.append({"trajectoryId": "later", "steps": []})
+        assert seen == [*(f"traj-{i}" for i in range(95)), "late"]
+        assert [t["trajectoryId"] async for t in buffer][-2:] == ["late", "later"]
+
+        buffer.clear()
+        assert len(buffer) == 0
+        assert list(buffer) == []
+        await buffer.flush()
+        assert not spill_path.exists()
+
+        # A failed spill write surfaces on flush and iteration
+        buffer.append({"trajectoryId": "ok", "steps": []})
+        for i in range(10):
+            buffer.append({"trajectoryId": f"more-{i}", "steps": []})
+        buffer.append({"trajectoryId": "bad", "value": object()})
+        for i in range(10):
+            buffer.append({"trajectoryId": f"pad-{i}", "steps": []})
+        with pytest.raises(TypeError):
+            await buffer.flush()
+        with pytest.raises(TypeError):
+            list(buffer)
+        with pytest.raises(TypeError):
+            [t async for t in buffer]
+
+        # close() and garbage collection both remove the spill file
+        await buffer.close()
+        assert not spill_path.exists()
+
+        abandoned = SpillingTrajectoryBuffer(temp_data_dir / "abandoned.jsonl", max_in_memory=1)
+        for i in range(3):
+            abandoned.append({"trajectoryId": f"traj-{i}"})
+        await abandoned.flush()
+        assert (temp_data_dir / "abandoned.jsonl").exists()
+        del abandoned
+        gc.collect()
+        assert not (temp_data_dir / "abandoned.jsonl").exists()
+        assert not (temp_data_dir / "collected.jsonl").exists()
+
 
 class TestLocalAIAdapter:
     """Tests for ElizaLocalAIProvider."""
@@ -214,14 +651,199 @@ class TestLocalAIAdapter:
         assert len(embedding) == 48  # SHA-384 / 8 bytes
 
     @pytest.mark.asyncio
-    async def test_config_defaults(self):
+    async def test_inference_worker_batches_off_loop(self):
+        """Concurrent requests are batched on the worker; the loop stays free."""
+        from elizaos_art.eliza_integration.local_ai_adapter import MockLocalAIProvider
+        from elizaos_art.microbench import measure_event_loop_lag
+
+        provider = MockLocalAIProvider(latency_s=0.1, max_batch_size=8)
+        expected = MockLocalAIProvider()
+        prompts = [f"Board state {i}" for i in range(32)]
+
+        results: list[str] = []
+
+        async def workload():
+            results.extend(
+                await asyncio.gather(*(provider.generate_text(p) for p in prompts))
+            )
+
+        lag = await measure_event_loop_lag(workload())
+
+        # Results map back to the right callers
+        assert results == [await expected.generate_text(p) for p in prompts]
+        # Well under one batch latency, which an on-loop model call would add
+        assert lag["max_lag_ms"] < 50
+
+        stats = provider.get_stats()
+        assert stats["requests"] == 32
+        assert stats["batches"] < 32
+        assert stats["mean_batch_size"] > 1
+        assert stats["queue_depth"] == 0
+        assert stats["tokens_per_sec"] > 0
+
+        embeddings = await asyncio.gather(
+            provider.generate_embedding("a"), provider.generate_embedding("b")
+        )
+        assert embeddings[0] == await expected.generate_embedding("a")
+        assert embeddings[0] != embeddings[1]
+
+        provider.close()
+        expected.close()
+
+    @pytest.mark.asyncio
+    async def test_inference_worker_propagates_errors(self):
+        """A failing batch handler fails only the requests in that batch."""
+        from elizaos_art.eliza_integration.local_ai_adapter import InferenceWorker
+
+        def handler(payloads):
+            if "bad" in payloads:
+                raise ValueError("model crashed")
+            return [(p.upper(), 1) for p in payloads]
+
+        worker = InferenceWorker({"chat": handler}, max_batch_size=1)
+        with pytest.raises(ValueError):
+            await worker.submit("chat", "bad")
+        assert await worker.submit("chat", "ok") == "OK"
+        with pytest.raises(ValueError):
+            await worker.submit("unknown", "ok")
+        worker.close()
+
+        # Per-request errors fail only their own request; missing results
+        # fail the requests left over instead of leaving them pending
+        def per_request(payloads):
+            results = [ValueError(p) if p == "bad" else (p.upper(), 1) for p in payloads]
+            return results[:2]
+
+        worker = InferenceWorker({"chat": per_request}, max_batch_size=8, batch_wait_s=0.05)
+        results = await asyncio.gather(
+            *(worker.submit("chat", p) for p in ("ok", "bad", "late")),
+            return_exceptions=True,
+        )
+        assert results[0] == "OK"
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], RuntimeError)
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_tokenize_runs_on_inference_worker(self):
+        """Tokenization uses the model on the worker thread, not the event loop."""
+        import threading
+
+        from elizaos_art.eliza_integration.local_ai_adapter import ElizaLocalAIProvider
+
+        callers = []
+
+        class FakeLlama:
+            def tokenize(self, data):
+                callers.append(threading.current_thread())
+                return list(data)
+
+            def detokenize(self, tokens):
+                callers.append(threading.current_thread())
+                return bytes(tokens)
+
+        provider = ElizaLocalAIProvider()
+        provider._llm = FakeLlama()
+        provider._initialized = True
+
+        tokens = await provider.tokenize("hi")
+        assert await provider.detokenize(tokens) == "hi"
+        assert callers and threading.main_thread() not in callers
+        provider.close()
+
+    def test_prefix_kv_cache(self):
+        """Test the minimum-prefix guard and stats over the library's RAM cache."""
+        from types import SimpleNamespace
+
+        pytest.importorskip("llama_cpp")
+        from elizaos_art.eliza_integration.local_ai_adapter import PrefixKVCache
+
+        def store(tokens, name, size):
+            # Like llama.cpp's LlamaState, a state records the tokens it evaluated
+            cache[tokens] = SimpleNamespace(
+                name=name, llama_state_size=size, input_ids=tokens, n_tokens=len(tokens)
+            )
+
+        system = list(range(100))
+        cache = PrefixKVCache(capacity_bytes=3000, min_prefix_tokens=32)
+        assert cache  # llama-cpp-python tests truthiness before use
+
+        store(system + [500, 501, 502], "game-a", 1000)
+        store(list(range(1000, 1100)), "game-b", 1000)
+
+        # A new turn of game A restores game A's state
+        assert cache[system + [600, 601]].name == "game-a"
+        assert (system + [600]) in cache
+
+        # Short shared prefixes are not worth restoring
+        with pytest.raises(KeyError):
+            cache[list(range(10)) + [9999] * 50]
+        assert [7] * 40 not in cache
+
+        # Re-storing a key replaces it without double-counting
+        store(system + [500, 501, 502], "game-a2", 1000)
+        assert cache.get_stats()["bytes"] == 2000
+
+        # Over budget: the least recently used state (game B) goes first
+        store(list(range(2000, 2100)), "game-c", 1500)
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 2500
+        with pytest.raises(KeyError):
+            cache[list(range(1000, 1100))]
+        assert cache[system].name == "game-a2"
+
+        # States larger than the whole budget are never stored
+        store(list(range(3000, 3100)), "huge", 10_000)
+        assert cache.get_stats()["entries"] == 2
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["reused_tokens"] == 100 + 100
+
+    @pytest.mark.asyncio
+    async def test_batched_embeddings_with_cache(self, temp_data_dir):
+        """Test batch embeddings, backend reporting and the disk LRU cache."""
+        from elizaos_art.eliza_integration.embedding_cache import EmbeddingCache
+        from elizaos_art.eliza_integration.local_ai_adapter import MockLocalAIProvider
+
+        cache = EmbeddingCache(temp_data_dir / "embeddings", max_entries=3)
+        provider = MockLocalAIProvider(embedding_cache=cache)
+
+        first = await provider.generate_embeddings(["board a", "board b", "board a"])
+        assert [r.backend for r in first] == ["mock-sha384"] * 3
+        assert not any(r.cached for r in first)
+        assert provider.embedded_texts == 2  # duplicates embedded once
+
+        second = await provider.generate_embeddings(["board a", "board b"])
+        assert all(r.cached and r.backend == "mock-sha384" for r in second)
+        assert provider.embedded_texts == 2
+        assert second[0].vector == pytest.approx(first[0].vector, abs=1e-6)
+
+        # Entries persist across cache instances; LRU keeps the newest three
+        await provider.generate_embeddings(["board c", "board d"])
+        reopened = EmbeddingCache(temp_data_dir / "embeddings", max_entries=3)
+        assert reopened.get("mock-sha384", "board a") is None
+        assert reopened.get("mock-sha384", "board d")[1] == "mock-sha384"
+        # Reads do not need the LRU index; it is loaded on first use
+        assert reopened.get_stats()["entries"] is None
+        assert len(reopened) == 3
+        assert len(list((temp_data_dir / "embeddings").glob("*/*.emb"))) == 3
+
+        provider.close()
+
+    @pytest.mark.asyncio
+    async def test_config_defaults(self, monkeypatch):
         """Test configuration defaults."""
         from elizaos_art.eliza_integration.local_ai_adapter import LocalModelConfig
 
+        monkeypatch.delenv("EMBEDDING_CACHE_DIR", raising=False)
         config = LocalModelConfig()
         assert "Llama" in config.small_model or "gguf" in config.small_model.lower()
         assert config.context_length == 8192
         assert config.gpu_layers == 43
+        assert config.embedding_cache_dir is None
 
 
 class TestGameEnvironments:
@@ -444,6 +1066,374 @@ class TestExport:
         assert result.train_count == 8
         assert len(result.output_files) > 0
 
+    @pytest.mark.asyncio
+    async def test_export_for_art_streaming(self, temp_data_dir):
+        """Test streaming export splits deterministically by trajectory ID."""
+        from elizaos_art.eliza_integration.export import (
+            ExportOptions,
+            export_for_art_streaming,
+        )
+        from elizaos_art.eliza_integration.storage_adapter import ElizaStorageAdapter
+
+        storage = ElizaStorageAdapter(data_dir=temp_data_dir)
+        for i in range(50):
+            await storage.save_trajectory({
+                "trajectoryId": f"traj-{i}",
+                "totalReward": float(i),
+                "steps": [{"llmCalls": [{"userPrompt": f"Q{i}", "response": f"A{i}"}]}],
+            })
+
+        options = ExportOptions(output_dir=str(temp_data_dir / "exports"), min_reward=5.0)
+        first = await export_for_art_streaming(storage, options, batch_size=8)
+        second = await export_for_art_streaming(storage, options, batch_size=3)
+
+        assert first.total_trajectories == 45
+        assert first.train_count + first.validation_count + first.test_count == 45
+        assert (first.train_count, first.validation_count, first.test_count) == (
+            second.train_count,
+            second.validation_count,
+            second.test_count,
+        )
+        assert first.records_per_sec and first.records_per_sec > 0
+
+        train_file = temp_data_dir / "exports" / "openpipe-art" / "train.jsonl"
+        with open(train_file) as f:
+            assert len(f.readlines()) == first.train_count
+
+    @pytest.mark.asyncio
+    async def test_export_for_art_incremental(self, temp_data_dir):
+        """Test incremental export appends only new trajectories."""
+        import os
+
+        from elizaos_art.eliza_integration.export import (
+            ExportOptions,
+            export_for_art_incremental,
+        )
+        from elizaos_art.eliza_integration.storage_adapter import ElizaStorageAdapter
+
+        storage = ElizaStorageAdapter(data_dir=temp_data_dir)
+        options = ExportOptions(output_dir=str(temp_data_dir / "exports"))
+        export_dir = temp_data_dir / "exports" / "openpipe-art"
+
+        async def save(start: int, stop: int) -> None:
+            for i in range(start, stop):
+                await storage.save_trajectory({
+                    "trajectoryId": f"traj-{i}",
+                    "steps": [{"llmCalls": [{"userPrompt": f"Q{i}", "response": f"A{i}"}]}],
+                })
+
+        def exported_ids() -> list[str]:
+            ids = []
+            for shard in export_dir.glob("*.jsonl"):
+                with open(shard) as f:
+                    ids.extend(json.loads(line)["metadata"]["trajectoryId"] for line in f)
+            return sorted(ids)
+
+        await save(0, 20)
+        first = await export_for_art_incremental(storage, options)
+        assert first.total_trajectories == 20
+
+        assert (await export_for_art_incremental(storage, options)).total_trajectories == 0
+
+        await save(20, 25)
+        second = await export_for_art_incremental(storage, options)
+        assert second.total_trajectories == 5
+        assert exported_ids() == sorted(f"traj-{i}" for i in range(25))
+
+        # A run that died after appending is rolled back on the next run
+        with open(export_dir / "train.jsonl", "a") as f:
+            f.write('{"partial": ')
+        await save(25, 27)
+        third = await export_for_art_incremental(storage, options)
+        assert third.total_trajectories == 2
+        assert exported_ids() == sorted(f"traj-{i}" for i in range(27))
+
+        # Re-saved trajectories are not exported twice; a half-written
+        # file is skipped and picked up once complete
+        await save(3, 5)
+        partial = storage.trajectories.trajectories_dir / "traj-27.json"
+        partial.write_text('{"trajectoryId": "traj-27", "steps": [')
+        assert (await export_for_art_incremental(storage, options)).total_trajectories == 0
+        await save(27, 28)
+        assert (await export_for_art_incremental(storage, options)).total_trajectories == 1
+        assert exported_ids() == sorted(f"traj-{i}" for i in range(28))
+
+        # A file that shares the cursor's (coarse) mtime but was written
+        # after it is exported, even though its ID sorts first
+        watermark = json.loads((export_dir / "_watermark.json").read_text())
+        (cursor,) = watermark["sources"].values()
+        await storage.save_trajectory({"trajectoryId": "traj-00", "steps": []})
+        late = storage.trajectories.trajectories_dir / "traj-00.json"
+        os.utime(late, ns=(cursor["timestamp"], cursor["timestamp"]))
+        assert (await export_for_art_incremental(storage, options)).total_trajectories == 1
+        all_ids = sorted(["traj-00", *(f"traj-{i}" for i in range(28))])
+        assert exported_ids() == all_ids
+
+        # Only a bounded window of recent IDs is kept
+        rebuilt = await export_for_art_incremental(
+            storage, options, rebuild=True, dedupe_window=5
+        )
+        assert rebuilt.total_trajectories == 29
+        assert exported_ids() == all_ids
+        watermark = json.loads((export_dir / "_watermark.json").read_text())
+        assert len(watermark["recentIds"]) == 5
+
+        # Shards from another exporter are not truncated
+        other_options = ExportOptions(output_dir=str(temp_data_dir / "other"))
+        other_dir = temp_data_dir / "other" / "openpipe-art"
+        other_dir.mkdir(parents=True)
+        (other_dir / "train.jsonl").write_text('{"messages": []}\n')
+        with pytest.raises(ValueError):
+            await export_for_art_incremental(storage, other_options)
+        assert (other_dir / "train.jsonl").read_text() == '{"messages": []}\n'
+
+    @pytest.mark.asyncio
+    async def test_parallel_conversion_matches_serial(self):
+        """Test process-pool conversion is deterministic across worker counts."""
+        from elizaos_art.eliza_integration.export import convert_trajectories
+
+        trajectories = [
+            {
+                "trajectoryId": f"traj-{i}",
+                "totalReward": float(i),
+                "steps": [{"llmCalls": [{"userPrompt": f"Q{i}", "response": f"A{i}"}]}],
+            }
+            for i in range(25)
+        ]
+
+        serial = [t async for t in convert_trajectories(trajectories, workers=1)]
+        parallel = [
+            t async for t in convert_trajectories(trajectories, workers=2, chunk_size=4)
+        ]
+        unordered = [
+            t
+            async for t in convert_trajectories(
+                trajectories, workers=2, chunk_size=4, ordered=False
+            )
+        ]
+
+        assert parallel == serial
+        assert sorted(t["metadata"]["trajectoryId"] for t in unordered) == sorted(
+            t["metadata"]["trajectoryId"] for t in serial
+        )
+
+    @pytest.mark.asyncio
+    async def test_export_columnar(self, temp_data_dir):
+        """Test Parquet/Arrow export round-trips through the mmap reader."""
+        pytest.importorskip("pyarrow")
+        from elizaos_art.eliza_integration.export import ColumnarDataset, export_columnar
+
+        trajectories = [
+            {
+                "trajectoryId": f"traj-{i}",
+                "scenarioId": f"scenario-{i % 3}",
+                "totalReward": float(i),
+                "steps": [{"llmCalls": [{"userPrompt": f"Q{i}", "response": f"A{i}"}]}],
+            }
+            for i in range(40)
+        ]
+
+        for fmt in ("parquet", "arrow"):
+            files = await export_columnar(
+                trajectories,
+                temp_data_dir / fmt,
+                format=fmt,
+                row_group_size=4,
+                tokenizer=WordTokenizer(),
+            )
+            assert "schema" in Path(files["readme"]).read_text().lower()
+
+            samples = {}
+            for split in ("train", "validation", "test"):
+                if split not in files:
+                    continue
+                dataset = ColumnarDataset(files[split])
+                for index in range(len(dataset)):
+                    sample = dataset[index]
+                    samples[sample["trajectoryId"]] = sample
+                dataset.close()
+
+            assert len(samples) == 40
+            sample = samples["traj-7"]
+            assert sample["reward"] == 7.0
+            assert sample["groupId"] == "scenario-1"
+            assert sample["messages"] == [
+                {"role": "user", "content": "Q7"},
+                {"role": "assistant", "content": "A7"},
+            ]
+            assert sample["inputIds"] == WordTokenizer().encode_chat(sample["messages"])[0]
+            assert sample["assistantMask"] == [0, 0, 1, 1]
+            assert sample["metadata"]["trajectoryId"] == "traj-7"
+
+    @pytest.mark.asyncio
+    async def test_grpo_prefix_dedupe_round_trip(self, temp_data_dir):
+        """Test GRPO groups store shared prefixes once and expand losslessly."""
+        from elizaos_art.eliza_integration.export import (
+            ExportOptions,
+            dedupe_group_prefixes,
+            expand_group_prefixes,
+            export_grouped_for_grpo,
+            read_grpo_groups,
+        )
+        from elizaos_art.eliza_integration.storage_adapter import ElizaStorageAdapter
+
+        storage = ElizaStorageAdapter(data_dir=temp_data_dir)
+        system_prompt = "You are a game-playing agent. " * 50
+        for i in range(8):
+            await storage.save_trajectory({
+                "trajectoryId": f"traj-{i}",
+                "scenarioId": "scenario-0",
+                "totalReward": float(i),
+                "steps": [{
+                    "llmCalls": [
+                        {"systemPrompt": system_prompt, "userPrompt": "Board A", "response": "UP"},
+                        # Two sub-branches share a second turn
+                        {"userPrompt": f"Board B{i % 2}", "response": "LEFT"},
+                        {"userPrompt": f"Board C{i}", "response": "DOWN"},
+                    ],
+                }],
+            })
+
+        compact_dir = temp_data_dir / "compact"
+        full_dir = temp_data_dir / "full"
+        await export_grouped_for_grpo(
+            storage, ExportOptions(output_dir=str(compact_dir), dedupe_prefixes=True)
+        )
+        await export_grouped_for_grpo(storage, ExportOptions(output_dir=str(full_dir)))
+
+        compact_file = compact_dir / "grpo-groups" / "groups.jsonl"
+        full_file = full_dir / "grpo-groups" / "groups.jsonl"
+        assert compact_file.stat().st_size * 2 < full_file.stat().st_size
+
+        (full,) = read_grpo_groups(full_file)
+        (expanded,) = read_grpo_groups(compact_file)
+        (compact,) = read_grpo_groups(compact_file, expand=False)
+
+        expanded.pop("createdAt")
+        assert expanded == {k: v for k, v in full.items() if k != "createdAt"}
+        assert len(full["sharedPrefix"]) == 3
+        assert compact["prefixes"][compact["sharedPrefixRef"]]["parent"] == -1
+        # Shared system prompt + first turn + per-branch second turn
+        assert len(compact["prefixes"]) == 3
+        assert all(len(t["messages"]) == 2 for t in compact["trajectories"])
+        assert expand_group_prefixes(dedupe_group_prefixes(full)) == full
+
+        # Groups follow saves and deletes, including ones made by another
+        # store instance (or process) after the first export
+        other = ElizaStorageAdapter(data_dir=temp_data_dir)
+        moved = await storage.get_trajectory("traj-0")
+        await storage.save_trajectory({**moved, "scenarioId": "scenario-1"})
+        await other.save_trajectory(
+            {**moved, "trajectoryId": "traj-8", "scenarioId": "scenario-1"}
+        )
+        await other.trajectories.delete_trajectory("traj-1")
+        await other.close()
+        await export_grouped_for_grpo(storage, ExportOptions(output_dir=str(full_dir)))
+        groups = {
+            g["scenarioId"]: sorted(t["metadata"]["trajectoryId"] for t in g["trajectories"])
+            for g in read_grpo_groups(full_file)
+        }
+        assert groups == {
+            "scenario-0": [f"traj-{i}" for i in range(2, 8)],
+            "scenario-1": ["traj-0", "traj-8"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_export_skips_reduced_capture_tiers(self, temp_data_dir):
+        """Test trajectories captured without text are skipped and counted."""
+        from elizaos_art.eliza_integration.export import (
+            ExportOptions,
+            export_for_art,
+            export_for_art_incremental,
+            export_for_art_streaming,
+            export_for_huggingface,
+            export_grouped_for_grpo,
+            read_grpo_groups,
+        )
+        from elizaos_art.eliza_integration.storage_adapter import ElizaStorageAdapter
+        from elizaos_art.eliza_integration.trajectory_adapter import ElizaTrajectoryLogger
+
+        full_ids = []
+        for tier in ("full", "hashes", "metrics"):
+            logger = ElizaTrajectoryLogger(
+                "agent", temp_data_dir / "trajectories", capture_tier=tier
+            )
+            for i in range(2):
+                trajectory_id = logger.start_trajectory(scenario_id="mixed")
+                step_id = logger.start_step(trajectory_id, {})
+                logger.log_llm_call(step_id, {"userPrompt": f"Board {i}", "response": "UP"})
+                logger.complete_step(trajectory_id, step_id, {"actionName": "UP"}, reward=1.0)
+                logger.end_trajectory(trajectory_id)
+                if tier == "full":
+                    full_ids.append(trajectory_id)
+
+        storage = ElizaStorageAdapter(data_dir=temp_data_dir)
+        for export in (export_for_art, export_for_art_streaming, export_for_art_incremental):
+            output_dir = temp_data_dir / "exports" / export.__name__
+            result = await export(
+                storage, ExportOptions(output_dir=str(output_dir), train_ratio=1.0)
+            )
+            assert result.total_trajectories == 2
+            assert result.skipped_trajectories == 4
+
+        options = ExportOptions(output_dir=str(temp_data_dir / "exports" / "grpo"))
+        result = await export_grouped_for_grpo(storage, options)
+        assert result.skipped_trajectories == 4
+        (group,) = read_grpo_groups(result.output_files[0])
+        assert sorted(t["metadata"]["trajectoryId"] for t in group["trajectories"]) == sorted(
+            full_ids
+        )
+
+        everything = await storage.trajectories.get_trajectories_where(lambda t: True)
+        hf_dir = temp_data_dir / "hf"
+        await export_for_huggingface(everything, hf_dir, train_ratio=1.0)
+        with open(hf_dir / "elizaos-trajectories" / "train.jsonl") as f:
+            assert len(f.readlines()) == 2
+
+    @pytest.mark.asyncio
+    async def test_pretokenized_export_cache(self, temp_data_dir):
+        """Test token fields are emitted and reused from the on-disk cache."""
+        from elizaos_art.eliza_integration.export import export_for_huggingface
+
+        trajectories = [
+            {
+                "trajectoryId": f"traj-{i}",
+                "steps": [{"llmCalls": [{
+                    "systemPrompt": "Play well.",
+                    "userPrompt": "word " * i,
+                    "response": "DOWN",
+                }]}],
+            }
+            for i in range(20)
+        ]
+        cache_dir = temp_data_dir / "token-cache"
+
+        cold_tokenizer = WordTokenizer()
+        files = await export_for_huggingface(
+            trajectories, temp_data_dir / "cold", tokenizer=cold_tokenizer,
+            token_cache_dir=cache_dir,
+        )
+        warm_tokenizer = WordTokenizer()
+        await export_for_huggingface(
+            trajectories, temp_data_dir / "warm", tokenizer=warm_tokenizer,
+            token_cache_dir=cache_dir,
+        )
+
+        assert cold_tokenizer.calls == 20
+        assert warm_tokenizer.calls == 0
+
+        with open(files["train"]) as f:
+            record = json.loads(f.readline())
+        ids, mask = WordTokenizer().encode_chat(record["messages"])
+        assert record["inputIds"] == ids
+        assert record["assistantMask"] == mask
+        assert record["numTokens"] == len(ids)
+
+        with open(files["token_lengths"]) as f:
+            stats = json.load(f)
+        assert stats["histogram"]["count"] == 20
+        assert sum(stats["histogram"]["buckets"].values()) == 20
+
     @pytest.mark.asyncio
     async def test_export_jsonl(self, temp_data_dir):
         """Test JSONL export."""
@@ -536,6 +1526,131 @@ class TestBenchmarkRunner:
 
         assert result.win_rate == 0.6
         assert result.to_dict()["win_rate"] == 0.6
+        assert BenchmarkResult.from_dict(result.to_dict()) == result
+
+    @pytest.mark.asyncio
+    async def test_job_scheduler_budgets_and_resume(self, tmp_path):
+        """Test that jobs respect slot budgets and finished jobs are resumed."""
+        import asyncio
+        import io
+
+        from rich.console import Console
+
+        from elizaos_art.scheduler import Job, JobScheduler
+
+        running = {"cpu": 0, "inference": 0}
+        peak = {"cpu": 0, "inference": 0}
+        calls: list[str] = []
+
+        def make_job(name: str, inference: int, fail: bool = False) -> Job:
+            async def run(ctx):
+                calls.append(name)
+                running["cpu"] += 1
+                running["inference"] += inference
+                peak["cpu"] = max(peak["cpu"], running["cpu"])
+                peak["inference"] = max(peak["inference"], running["inference"])
+                for _ in range(3):
+                    await asyncio.sleep(0.01)
+                    ctx.advance()
+                running["cpu"] -= 1
+                running["inference"] -= inference
+                if fail:
+                    raise RuntimeError("boom")
+                return {"name": name}
+
+            return Job(name=name, run=run, inference_slots=inference, total=3)
+
+        def make_scheduler():
+            return JobScheduler(
+                cpu_budget=3,
+                inference_budget=1,
+                state_path=tmp_path / "state.json",
+                fingerprint="test",
+                console=Console(file=io.StringIO()),
+            )
+
+        jobs = [make_job("a", 1), make_job("b", 1), make_job("c", 0), make_job("d", 0, fail=True)]
+        states = await make_scheduler().run(jobs)
+
+        assert peak["cpu"] == 3
+        assert peak["inference"] == 1
+        assert [s.status for s in states.values()] == ["done", "done", "done", "failed"]
+        assert states["a"].completed == 3
+
+        # Resume reruns only the failed job
+        calls.clear()
+        jobs[3] = make_job("d", 0)
+        states = await make_scheduler().run(jobs, resume=True)
+        assert calls == ["d"]
+        assert all(s.status == "done" for s in states.values())
+        assert states["a"].result == {"name": "a"}
+
+        # A different fingerprint starts over
+        calls.clear()
+        scheduler = make_scheduler()
+        scheduler.fingerprint = "other"
+        await scheduler.run(jobs, resume=True)
+        assert sorted(calls) == ["a", "b", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_run_baselines_concurrent(self, tmp_path):
+        """Test scheduled baselines match the single-game runner."""
+        from elizaos_art.benchmark_runner import run_baselines, run_game_baseline
+
+        results = await run_baselines(
+            episodes=5, output_dir=str(tmp_path), games=["tic_tac_toe", "temporal_clue"]
+        )
+
+        assert set(results) == {"tic_tac_toe", "temporal_clue"}
+        for game, result in results.items():
+            direct = await run_game_baseline(game, episodes=5)
+            assert (result.wins, result.losses, result.draws) == (
+                direct.wins,
+                direct.losses,
+                direct.draws,
+            )
+            assert result.avg_reward == direct.avg_reward
+        assert (tmp_path / "baselines.state.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_sharded_baseline_matches_serial(self):
+        """Test process-sharded baselines give the serial aggregates."""
+        from elizaos_art.benchmark_runner import (
+            aggregate_baseline,
+            run_game_baseline,
+            shard_seeds,
+        )
+
+        assert shard_seeds(list(range(10)), 4) == [[0, 1, 2], [3, 4, 5], [6, 7], [8, 9]]
+        assert shard_seeds([1, 2], 8) == [[1], [2]]
+
+        seeds = list(range(100, 124))
+        serial = await run_game_baseline("tic_tac_toe", seeds=seeds)
+        advanced: list[int] = []
+        sharded = await run_game_baseline(
+            "tic_tac_toe", seeds=seeds, workers=2, progress=advanced.append
+        )
+
+        def strip(result):
+            return {k: v for k, v in result.to_dict().items() if k != "duration_seconds"}
+
+        assert strip(sharded) == strip(serial)
+        assert sum(advanced) == len(seeds)
+
+        # Merge order does not matter
+        outcomes = [(3, 1.0, "win"), (1, 0.5, "draw"), (2, -1.0, "loss")]
+        assert aggregate_baseline("g", outcomes, 0) == aggregate_baseline(
+            "g", sorted(outcomes), 0
+        )
+
+        with pytest.raises(ValueError):
+            await run_game_baseline("chess", episodes=1)
+        with pytest.raises(ValueError):
+            await run_game_baseline("tic_tac_toe", episodes=1, agent="expectimax")
+
+        expectimax = await run_game_baseline("game_2048", episodes=1, agent="expectimax")
+        assert expectimax.agent_type == "expectimax"
+        assert expectimax.episodes == 1
 
 
 if __name__ == "__main__":